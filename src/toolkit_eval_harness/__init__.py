@@ -1,20 +1,67 @@
 from __future__ import annotations
 
-from importlib.metadata import PackageNotFoundError, version
-
-from .compare import CompareBudget, compare_reports
-from .health import check_health
-from .metrics import MetricsCollector, SuiteMetrics
-from .pack import create_pack, extract_pack, load_suite_from_path
-from .plugins import get_scorer, list_scorers, register_scorer, unregister_scorer
-from .report import EvalReport
-from .runner import run_suite
-from .suite import EvalCase, EvalSuite
-
-try:
-    __version__ = version("toolkit-eval-harness")
-except PackageNotFoundError:  # pragma: no cover
-    __version__ = "0.0.0"
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .compare import CompareBudget, compare_reports
+    from .health import check_health
+    from .metrics import MetricsCollector, SuiteMetrics
+    from .pack import create_pack, extract_pack, load_suite_from_path
+    from .plugins import get_scorer, list_scorers, register_scorer, unregister_scorer
+    from .report import EvalReport
+    from .runner import arun_suite, run_suite
+    from .suite import EvalCase, EvalSuite
+
+    __version__: str
+
+# Public name -> defining submodule.  Submodules are imported on first
+# attribute access (PEP 562) so ``import toolkit_eval_harness`` -- and every
+# CLI invocation -- only pays for what it uses.
+_EXPORTS = {
+    "CompareBudget": "compare",
+    "compare_reports": "compare",
+    "check_health": "health",
+    "MetricsCollector": "metrics",
+    "SuiteMetrics": "metrics",
+    "create_pack": "pack",
+    "extract_pack": "pack",
+    "load_suite_from_path": "pack",
+    "get_scorer": "plugins",
+    "list_scorers": "plugins",
+    "register_scorer": "plugins",
+    "unregister_scorer": "plugins",
+    "EvalReport": "report",
+    "arun_suite": "runner",
+    "run_suite": "runner",
+    "EvalCase": "suite",
+    "EvalSuite": "suite",
+}
+
+
+def _version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("toolkit-eval-harness")
+    except PackageNotFoundError:  # pragma: no cover
+        return "0.0.0"
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        value: Any = _version()
+    elif name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     "CompareBudget",
@@ -24,6 +71,7 @@ __all__ = [
     "MetricsCollector",
     "SuiteMetrics",
     "__version__",
+    "arun_suite",
     "check_health",
     "compare_reports",
     "create_pack",
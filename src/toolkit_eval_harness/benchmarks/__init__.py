@@ -0,0 +1,51 @@
+"""
+Benchmarks for the harness's own hot paths (``toolkit-eval bench``).
+
+Covers synthetic workload generation and timing of suite loading, pack
+verification, scoring and report formatting.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .harness import run_benchmarks
+    from .workload import Workload, WorkloadSpec, generate_workload
+
+# Benchmark names, in run order, and workload payload shapes (kept here so
+# the CLI can list them without importing the harness or workload generator).
+BENCHMARKS = ("read_suite_dir", "verify_pack", "run_suite", "format_report")
+PAYLOADS = ("string", "json", "nested")
+
+# Public name -> defining submodule, imported on first access (PEP 562):
+# the harness pulls in the runner, which the CLI only needs for ``bench``.
+_EXPORTS = {
+    "run_benchmarks": "harness",
+    "Workload": "workload",
+    "WorkloadSpec": "workload",
+    "generate_workload": "workload",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
+
+__all__ = [
+    "BENCHMARKS",
+    "PAYLOADS",
+    "Workload",
+    "WorkloadSpec",
+    "generate_workload",
+    "run_benchmarks",
+]
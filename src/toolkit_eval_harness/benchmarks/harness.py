@@ -0,0 +1,153 @@
+"""Time the harness's hot paths against a generated workload."""
+
+from __future__ import annotations
+
+import logging
+import platform
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from ..formatters import format_csv, format_json, format_table
+from ..pack import create_pack, verify_pack
+from ..plugins import list_scorers, register_scorer, unregister_scorer
+from ..runner import run_suite
+from ..suite import read_suite_dir
+from . import BENCHMARKS
+from .workload import BENCH_SCORER, Workload, token_overlap
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending sequence (``0.0`` if empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return float(sorted_values[int(rank) - 1])
+
+
+def peak_rss_bytes() -> int | None:
+    """Peak resident set size of this process, or ``None`` where unsupported."""
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def _time(func: Callable[[], Any], repeat: int) -> list[float]:
+    samples: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _summarize(samples: list[float], cases: int) -> dict[str, Any]:
+    ordered = sorted(samples)
+    p50 = percentile(ordered, 50)
+    return {
+        "repeat": len(samples),
+        "cases": cases,
+        "seconds": {
+            "min": round(ordered[0], 6),
+            "p50": round(p50, 6),
+            "p90": round(percentile(ordered, 90), 6),
+            "p99": round(percentile(ordered, 99), 6),
+            "max": round(ordered[-1], 6),
+            "mean": round(sum(ordered) / len(ordered), 6),
+        },
+        "cases_per_second": round(cases / p50, 2) if p50 > 0 else None,
+    }
+
+
+def run_benchmarks(
+    workload: Workload,
+    *,
+    repeat: int = 5,
+    workers: int = 1,
+    executor: str = "thread",
+    only: Sequence[str] | None = None,
+) -> dict[str, Any]:
+    """Run the selected benchmarks and return a JSON-serialisable result.
+
+    Args:
+        workload: Generated workload (see :func:`.generate_workload`).
+        repeat: Timed repetitions per benchmark.
+        workers: ``run_suite`` scoring workers.
+        executor: ``run_suite`` pool type.
+        only: Subset of :data:`BENCHMARKS` to run; all when ``None``.
+
+    Returns:
+        Per-benchmark timing percentiles and throughput, peak RSS and the
+        environment, suitable for comparing across commits.
+
+    Raises:
+        ValueError: If *repeat* < 1 or *only* names an unknown benchmark.
+    """
+    from .. import __version__
+
+    if repeat < 1:
+        raise ValueError(f"repeat must be >= 1, got {repeat}")
+    selected = list(only) if only else list(BENCHMARKS)
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"unknown_benchmark:{','.join(unknown)}")
+
+    cases = workload.spec.cases
+    registered = False
+    if workload.spec.plugin_scorers and BENCH_SCORER not in list_scorers():
+        register_scorer(BENCH_SCORER, token_overlap)
+        registered = True
+
+    results: dict[str, Any] = {}
+    try:
+        with tempfile.TemporaryDirectory(prefix="toolkit-eval-bench-") as tmp:
+            suite = read_suite_dir(workload.suite_dir)
+
+            def score() -> Any:
+                return run_suite(
+                    suite=suite,
+                    predictions_path=workload.predictions_path,
+                    workers=workers,
+                    executor=executor,
+                )
+
+            report = score().to_dict()
+            for name in selected:
+                logger.info("Benchmark %s: %d cases x %d", name, cases, repeat)
+                if name == "read_suite_dir":
+                    samples = _time(lambda: read_suite_dir(workload.suite_dir), repeat)
+                elif name == "verify_pack":
+                    pack = Path(tmp) / "suite.zip"
+                    create_pack(suite_dir=workload.suite_dir, out_zip=pack)
+                    samples = _time(lambda p=pack: verify_pack(pack_zip=p), repeat)
+                elif name == "run_suite":
+                    samples = _time(score, repeat)
+                else:
+                    samples = _time(
+                        lambda: (format_json(report), format_table(report), format_csv(report)),
+                        repeat,
+                    )
+                results[name] = _summarize(samples, cases)
+    finally:
+        if registered:
+            unregister_scorer(BENCH_SCORER)
+
+    return {
+        "tool_version": __version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "workload": asdict(workload.spec),
+        "config": {"repeat": repeat, "workers": workers, "executor": executor},
+        "benchmarks": results,
+        "peak_rss_bytes": peak_rss_bytes(),
+    }
@@ -0,0 +1,141 @@
+"""Synthetic suites and predictions of configurable size and shape."""
+
+from __future__ import annotations
+
+import json
+import logging
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from . import PAYLOADS
+
+logger = logging.getLogger(__name__)
+
+BENCH_SCORER = "bench_token_overlap"
+
+_WORDS = (
+    "alpha beta gamma delta epsilon zeta eta theta iota kappa lambda mu nu xi omicron pi rho "
+    "sigma tau upsilon phi chi psi omega"
+).split()
+
+
+@dataclass(frozen=True)
+class WorkloadSpec:
+    """Shape of a synthetic workload.
+
+    Attributes:
+        cases: Number of suite cases.
+        payload: ``"string"`` (short text), ``"json"`` (flat objects scored
+            with ``json_required_keys``) or ``"nested"`` (deep objects).
+        plugin_scorers: Also score with the :func:`token_overlap` plugin.
+        accuracy: Fraction of predictions that exactly match.
+        seed: RNG seed; the same spec always generates the same files.
+    """
+
+    cases: int = 10_000
+    payload: str = "json"
+    plugin_scorers: bool = False
+    accuracy: float = 0.8
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.cases < 1:
+            raise ValueError(f"cases must be >= 1, got {self.cases}")
+        if self.payload not in PAYLOADS:
+            raise ValueError(f"unsupported_payload:{self.payload}")
+        if not 0.0 <= self.accuracy <= 1.0:
+            raise ValueError(f"accuracy must be in [0, 1], got {self.accuracy}")
+
+
+@dataclass(frozen=True)
+class Workload:
+    """Paths of a generated workload."""
+
+    spec: WorkloadSpec
+    suite_dir: Path
+    predictions_path: Path
+
+
+def token_overlap(*, expected: Any, predicted: Any, **kwargs: Any) -> tuple[float, dict[str, Any]]:
+    """Jaccard overlap of whitespace tokens; a representative pure-Python plugin scorer."""
+    exp = set(json.dumps(expected, sort_keys=True).split())
+    pred = set(json.dumps(predicted, sort_keys=True).split())
+    union = exp | pred
+    score = len(exp & pred) / len(union) if union else 1.0
+    return score, {"tokens": len(union)}
+
+
+def _sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(n))
+
+
+def _expected(rng: random.Random, payload: str, i: int) -> Any:
+    if payload == "string":
+        return _sentence(rng, 8)
+    if payload == "json":
+        return {"answer": _sentence(rng, 4), "confidence": rng.random(), "index": i}
+    return {
+        "answer": {"text": _sentence(rng, 4), "spans": [[rng.randrange(100), rng.randrange(100)]]},
+        "evidence": [
+            {"doc": f"d{rng.randrange(1000)}", "quote": _sentence(rng, 6)} for _ in range(3)
+        ],
+        "meta": {"index": i, "labels": rng.sample(_WORDS, 3)},
+    }
+
+
+def _wrong(rng: random.Random, expected: Any) -> Any:
+    if isinstance(expected, str):
+        return _sentence(rng, 8)
+    if rng.random() < 0.5:
+        # Missing a required key.
+        return {k: v for k, v in expected.items() if k != "answer"}
+    return {**expected, "answer": _sentence(rng, 4)}
+
+
+def generate_workload(spec: WorkloadSpec, out_dir: Path) -> Workload:
+    """Write ``suite/`` and ``predictions.jsonl`` for *spec* under *out_dir*.
+
+    Case ids are zero-padded so cases and predictions are sorted by id;
+    predictions are written in shuffled order to exercise the unsorted join.
+    """
+    # Reproducible synthetic data, not crypto.
+    rng = random.Random(spec.seed)  # nosec B311
+    suite_dir = out_dir / "suite"
+    suite_dir.mkdir(parents=True, exist_ok=True)
+    scoring: dict[str, Any] = {}
+    if spec.payload != "string":
+        scoring["json_schema"] = {"required_keys": ["answer"]}
+    if spec.plugin_scorers:
+        scoring["scorers"] = [BENCH_SCORER]
+    meta = {
+        "schema_version": 1,
+        "name": f"bench-{spec.payload}-{spec.cases}",
+        "description": "Synthetic benchmark workload",
+        "created_at": "1970-01-01T00:00:00Z",
+        "scoring": scoring,
+    }
+    (suite_dir / "suite.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+    width = len(str(spec.cases))
+    predictions: list[str] = []
+    with (suite_dir / "cases.jsonl").open("w", encoding="utf-8") as f:
+        for i in range(spec.cases):
+            case_id = f"case-{i:0{width}d}"
+            expected = _expected(rng, spec.payload, i)
+            case = {
+                "id": case_id,
+                "input": {"prompt": _sentence(rng, 12)},
+                "expected": expected,
+                "tags": [spec.payload, f"bucket-{i % 10}"],
+            }
+            f.write(json.dumps(case) + "\n")
+            predicted = expected if rng.random() < spec.accuracy else _wrong(rng, expected)
+            predictions.append(json.dumps({"id": case_id, "prediction": predicted}) + "\n")
+    rng.shuffle(predictions)
+    predictions_path = out_dir / "predictions.jsonl"
+    with predictions_path.open("w", encoding="utf-8") as f:
+        f.writelines(predictions)
+    logger.debug("Generated %d-case %s workload in %s", spec.cases, spec.payload, out_dir)
+    return Workload(spec=spec, suite_dir=suite_dir, predictions_path=predictions_path)
@@ -3,22 +3,24 @@ from __future__ import annotations
 import argparse
 import json
 import logging
-import platform
+import os
 import sys
 import time
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from . import __version__
-from .compare import CompareBudget, compare_reports
 from .formatters import get_formatter
 from .io import read_bytes, read_json, read_text, write_json, write_text
 from .logging_config import setup_logging
-from .pack import create_pack, load_suite_from_path, verify_pack
-from .plugins import list_scorers
-from .report import EvalReport
-from .runner import run_suite
-from .signing import generate_ed25519_keypair, sign_bytes, verify_bytes
+
+if TYPE_CHECKING:
+    from .compare import CompareBudget
+    from .profiling import RunProfiler
+
+# Subcommand dependencies are imported inside each ``_cmd_*`` handler so that
+# short commands (check-deps, validate-report, pack verify) start quickly;
+# tests/test_import_time.py enforces the budget.
 
 logger = logging.getLogger(__name__)
 
@@ -28,14 +30,27 @@ EXIT_UNEXPECTED_ERROR = 3
 EXIT_VALIDATION_FAILED = 4
 
 
-def _emit(data: dict[str, Any], args: argparse.Namespace) -> None:
+def _span(profiler: RunProfiler | None, phase: str) -> AbstractContextManager[Any]:
+    """Time *phase* when ``--profile`` is active."""
+    return profiler.span(phase) if profiler is not None else nullcontext()
+
+
+def _emit(
+    data: dict[str, Any], args: argparse.Namespace, profiler: RunProfiler | None = None
+) -> None:
     """Format *data* according to ``--format`` and write to stdout or ``--output``."""
     fmt_name = getattr(args, "format", "json") or "json"
     output_path = getattr(args, "output", "") or ""
 
     formatter = get_formatter(fmt_name)
-    text = formatter(data)
+    with _span(profiler, "serialize"):
+        text = formatter(data)
 
+    with _span(profiler, "write"):
+        _write_output(text, output_path)
+
+
+def _write_output(text: str, output_path: str) -> None:
     if output_path:
         out = Path(output_path).resolve()
         try:
@@ -56,6 +71,8 @@ def _emit(data: dict[str, Any], args: argparse.Namespace) -> None:
 
 def _cmd_pack_create(args: argparse.Namespace) -> int:
     """Create a suite pack zip from a suite directory."""
+    from .pack import create_pack
+
     suite_dir = Path(args.suite_dir).resolve()
     out = Path(args.out).resolve()
 
@@ -80,6 +97,8 @@ def _cmd_pack_create(args: argparse.Namespace) -> int:
 
 def _cmd_pack_inspect(args: argparse.Namespace) -> int:
     """Inspect a suite (dir or zip)."""
+    from .pack import load_suite_from_path
+
     suite_path = Path(args.suite).resolve()
 
     logger.info(f"Inspecting suite: {suite_path}")
@@ -105,6 +124,8 @@ def _cmd_pack_inspect(args: argparse.Namespace) -> int:
 
 def _cmd_pack_verify(args: argparse.Namespace) -> int:
     """Verify pack integrity (hashes)."""
+    from .pack import verify_pack
+
     pack_path = Path(args.suite).resolve()
 
     logger.info(f"Verifying pack: {pack_path}")
@@ -136,6 +157,8 @@ def _cmd_pack_verify(args: argparse.Namespace) -> int:
 
 def _cmd_keygen(args: argparse.Namespace) -> int:
     """Generate Ed25519 keypair for signing."""
+    from .signing import generate_ed25519_keypair
+
     private_key_path = Path(args.private_key).resolve()
     public_key_path = Path(args.public_key).resolve()
 
@@ -163,6 +186,8 @@ def _cmd_keygen(args: argparse.Namespace) -> int:
 
 def _cmd_pack_sign(args: argparse.Namespace) -> int:
     """Sign a pack zip (detached signature JSON)."""
+    from .signing import sign_bytes
+
     pack_path = Path(args.suite).resolve()
     private_key_path = Path(args.private_key).resolve()
 
@@ -223,6 +248,8 @@ def _cmd_pack_sign(args: argparse.Namespace) -> int:
 
 def _cmd_pack_verify_sig(args: argparse.Namespace) -> int:
     """Verify a pack signature."""
+    from .signing import verify_bytes
+
     pack_path = Path(args.suite).resolve()
     signature_path = Path(args.signature).resolve()
     public_key_path = Path(args.public_key).resolve()
@@ -278,14 +305,133 @@ def _cmd_pack_verify_sig(args: argparse.Namespace) -> int:
 
 def _cmd_run(args: argparse.Namespace) -> int:
     """Run an evaluation suite against predictions."""
+    from .metrics import MetricsCollector
+    from .profiling import RunProfiler
+
+    if args.server:
+        return _run_remote(args)
+    if not args.profile:
+        return _run(args, None)
+    profiler = RunProfiler(MetricsCollector(), cprofile=args.profile == "cprofile")
+    with profiler:
+        code = _run(args, profiler)
+    # Profile output goes beside the report: --out, else --output, else the cwd.
+    report_path = Path(
+        getattr(args, "out", "") or args.output or "toolkit-eval-run"
+    ).resolve()
+    try:
+        profiler.write(report_path)
+    except OSError as e:
+        logger.warning("Failed to write profile beside %s: %s", report_path, e)
+    return code
+
+
+def _run_remote(args: argparse.Namespace) -> int:
+    """Send a ``run`` to a ``toolkit-eval serve`` daemon."""
+    from .client import EvalClient
+
+    out = getattr(args, "out", "")
+    local_only = {
+        "--journal": args.journal,
+        "--isolate-plugins": args.isolate_plugins,
+        "--profile": args.profile,
+        "--metrics-textfile": args.metrics_textfile,
+        "--metrics-port": args.metrics_port is not None,
+        "--score-cache-dir": args.score_cache_dir,
+        "--suite-cache-dir": args.suite_cache_dir,
+        "--online": args.online,
+        "a .jsonl --out": out.endswith(".jsonl"),
+    }
+    unsupported = [flag for flag, value in local_only.items() if value]
+    if unsupported:
+        logger.error("--server does not support %s", ", ".join(unsupported))
+        return EXIT_CLI_ERROR
+
+    ids: list[str] | None = None
+    if args.case_ids:
+        ids_path = Path(args.case_ids).resolve()
+        try:
+            ids = [line.strip() for line in read_text(ids_path).splitlines() if line.strip()]
+        except FileNotFoundError:
+            logger.error("Case ids file not found: %s. Provide one case id per line.", ids_path)
+            return EXIT_CLI_ERROR
+
+    logger.info("Running suite %s on %s", args.suite, args.server)
+    try:
+        report_dict = EvalClient(args.server).run(
+            Path(args.suite),
+            predictions_path=Path(args.predictions),
+            case_ids=ids,
+            workers=args.workers,
+            executor=args.executor,
+            batch_size=args.batch_size,
+        )
+    except FileNotFoundError as e:
+        logger.error("Not found by the server: %s", e)
+        return EXIT_CLI_ERROR
+    except (ValueError, OSError) as e:
+        logger.error("Failed to run suite on %s: %s", args.server, e)
+        return EXIT_CLI_ERROR
+
+    summary = report_dict["summary"]
+    logger.info(
+        "Eval complete: %d cases, %d passed, %d failed, %.3fs elapsed",
+        summary.get("cases", 0),
+        summary.get("pass_count", 0),
+        summary.get("fail_count", 0),
+        summary.get("execution_time_seconds", 0.0),
+    )
+    if out:
+        out_path = Path(out).resolve()
+        try:
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            out_path.write_text(
+                json.dumps(report_dict, indent=2, sort_keys=True), encoding="utf-8"
+            )
+        except OSError as e:
+            logger.error("Failed to write report to %s: %s", out_path, e)
+            return EXIT_CLI_ERROR
+    _emit(report_dict, args)
+    return EXIT_SUCCESS
+
+
+def _print_snapshot(snapshot: dict[str, Any]) -> None:
+    """Write an online-run progress snapshot to stderr as one JSON line."""
+    print(json.dumps({"snapshot": snapshot}), file=sys.stderr, flush=True)
+
+
+def _run(args: argparse.Namespace, profiler: RunProfiler | None) -> int:
+    from .control_plane.config import build_config_hierarchy
+    from .journal import ResultJournal
+    from .metrics import MetricsCollector
+    from .openmetrics import MetricsServer, write_textfile
+    from .pack import load_suite_from_path
+    from .report import JsonlReportWriter, add_run_info
+    from .runner import run_suite
+    from .sandbox import SandboxLimits
+    from .score_cache import CACHE_DIR_ENV as SCORE_CACHE_DIR_ENV
+    from .score_cache import DEFAULT_MAX_BYTES as SCORE_CACHE_DEFAULT_MAX_BYTES
+    from .score_cache import ScoreCache
+    from .suite_cache import CACHE_DIR_ENV, DEFAULT_MAX_BYTES, SuiteCache
+
     suite_path = Path(args.suite).resolve()
     predictions_path = Path(args.predictions).resolve()
 
     logger.info(f"Running suite: {suite_path}")
     logger.debug(f"Predictions: {predictions_path}")
 
+    cache: SuiteCache | None = None
+    cache_dir = args.suite_cache_dir or os.environ.get(CACHE_DIR_ENV, "")
+    if cache_dir:
+        max_mb = args.suite_cache_max_mb
+        cache = SuiteCache(
+            Path(cache_dir).resolve(),
+            max_bytes=DEFAULT_MAX_BYTES if max_mb is None else int(max_mb * 1024 * 1024),
+        )
+
     try:
-        suite = load_suite_from_path(suite_path)
+        with _span(profiler, "load_suite"):
+            suite = load_suite_from_path(suite_path, cache=cache, lazy=args.lazy)
         logger.info(f"Loaded suite: {suite.name}")
     except FileNotFoundError:
         logger.error(
@@ -299,11 +445,134 @@ def _cmd_run(args: argparse.Namespace) -> int:
         logger.error("Failed to load suite: %s", e)
         return EXIT_CLI_ERROR
 
+    if args.case_ids:
+        ids_path = Path(args.case_ids).resolve()
+        try:
+            with _span(profiler, "select_cases"):
+                ids = [line.strip() for line in read_text(ids_path).splitlines() if line.strip()]
+                suite = suite.select(ids)
+            logger.info("Selected %d cases from %s", len(ids), ids_path)
+        except FileNotFoundError:
+            logger.error("Case ids file not found: %s. Provide one case id per line.", ids_path)
+            return EXIT_CLI_ERROR
+        except KeyError as e:
+            logger.error("Failed to select cases: %s", e.args[0])
+            return EXIT_CLI_ERROR
+
+    overrides: dict[str, Any] = {}
+    if args.workers is not None:
+        overrides["max_workers"] = args.workers
+    config = build_config_hierarchy(cli_overrides=overrides)
+    if config.max_workers < 1:
+        logger.error("--workers must be >= 1, got %d", config.max_workers)
+        return EXIT_CLI_ERROR
+
+    if args.batch_size is not None and args.batch_size < 1:
+        logger.error("--batch-size must be >= 1, got %d", args.batch_size)
+        return EXIT_CLI_ERROR
+
+    isolation: SandboxLimits | None = None
+    if args.isolate_plugins:
+        if args.plugin_timeout <= 0:
+            logger.error("--plugin-timeout must be > 0, got %s", args.plugin_timeout)
+            return EXIT_CLI_ERROR
+        isolation = SandboxLimits(
+            timeout_seconds=args.plugin_timeout,
+            max_memory_bytes=int(args.plugin_max_memory_mb * 1024 * 1024),
+            recycle_after=args.plugin_recycle_after,
+        )
+
+    if args.resume and not args.journal:
+        logger.error("--resume requires --journal FILE (the journal to replay).")
+        return EXIT_CLI_ERROR
+
+    if args.online:
+        offline_only = {
+            "--journal": args.journal,
+            "--isolate-plugins": args.isolate_plugins,
+            "--stream-predictions": args.stream_predictions,
+            "--executor process": args.executor == "process",
+        }
+        unsupported = [flag for flag, value in offline_only.items() if value]
+        if unsupported:
+            logger.error("--online does not support %s", ", ".join(unsupported))
+            return EXIT_CLI_ERROR
+    elif args.predictions == "-":
+        logger.error("Reading predictions from stdin ('--predictions -') requires --online.")
+        return EXIT_CLI_ERROR
+
+    score_cache: ScoreCache | None = None
+    score_cache_dir = args.score_cache_dir or os.environ.get(SCORE_CACHE_DIR_ENV, "")
+    if score_cache_dir:
+        max_mb = args.score_cache_max_mb
+        score_cache = ScoreCache(
+            Path(score_cache_dir).resolve(),
+            max_bytes=(
+                SCORE_CACHE_DEFAULT_MAX_BYTES if max_mb is None else int(max_mb * 1024 * 1024)
+            ),
+        )
+    collector = profiler.collector if profiler is not None else MetricsCollector()
+    metrics_server: MetricsServer | None = None
+    if args.metrics_port is not None:
+        try:
+            metrics_server = MetricsServer(collector, port=args.metrics_port).start()
+        except OSError as e:
+            logger.error("Could not serve metrics on port %d: %s", args.metrics_port, e)
+            return EXIT_CLI_ERROR
+
+    # A .jsonl --out streams case results to disk instead of holding them.
+    out_path = Path(args.out).resolve() if getattr(args, "out", "") else None
+    writer: JsonlReportWriter | None = None
+    pass_count = 0
+
+    def write_case(result: dict[str, Any]) -> None:
+        nonlocal pass_count
+        if writer is None:
+            raise RuntimeError("case result streamed without a report writer")
+        writer.write_case(result)
+        if result.get("score", 0) >= 1.0:
+            pass_count += 1
+
     start_time = time.monotonic()
+    journal: ResultJournal | None = None
     try:
-        report = run_suite(suite=suite, predictions_path=predictions_path)
+        if out_path is not None and out_path.suffix == ".jsonl":
+            writer = JsonlReportWriter(out_path, suite=suite.to_dict())
+        if args.journal:
+            journal = ResultJournal(Path(args.journal).resolve(), resume=args.resume)
+        if args.online:
+            from .online import run_online
+
+            report = run_online(
+                suite=suite,
+                source=sys.stdin.buffer if args.predictions == "-" else predictions_path,
+                snapshot_interval=args.snapshot_interval,
+                on_snapshot=_print_snapshot,
+                idle_timeout=args.online_idle_timeout or None,
+                concurrency=config.max_workers,
+                batch_size=args.batch_size,
+                score_cache=score_cache,
+                collector=collector,
+                case_sink=write_case if writer is not None else None,
+            )
+        else:
+            report = run_suite(
+                suite=suite,
+                predictions_path=predictions_path,
+                workers=config.max_workers,
+                executor=args.executor,
+                batch_size=args.batch_size,
+                stream_predictions=args.stream_predictions,
+                journal=journal,
+                score_cache=score_cache,
+                collector=collector,
+                isolation=isolation,
+                case_sink=write_case if writer is not None else None,
+            )
         logger.info("Suite run completed")
     except FileNotFoundError:
+        if writer is not None:
+            writer.abort()
         logger.error(
             "Predictions file not found: %s. "
             'Provide a JSONL file with one {"id": ..., "prediction": ...} per line.',
@@ -311,46 +580,115 @@ def _cmd_run(args: argparse.Namespace) -> int:
         )
         return EXIT_CLI_ERROR
     except (ValueError, PermissionError) as e:
+        if writer is not None:
+            writer.abort()
         logger.error("Failed to run suite: %s", e)
         return EXIT_CLI_ERROR
+    except BaseException:
+        if writer is not None:
+            writer.abort()
+        raise
+    finally:
+        if journal is not None:
+            journal.close()
+        if score_cache is not None:
+            score_cache.close()
+        if metrics_server is not None:
+            metrics_server.close()
+        if args.metrics_textfile:
+            try:
+                write_textfile(collector, Path(args.metrics_textfile).resolve())
+            except OSError as e:
+                logger.warning("Failed to write metrics textfile %s: %s", args.metrics_textfile, e)
     elapsed = time.monotonic() - start_time
 
     # Enrich report with timing and metrics
-    report_dict = report.to_dict()
+    with _span(profiler, "serialize"):
+        report_dict = report.to_dict()
+    add_run_info(
+        report_dict, elapsed=elapsed, pass_count=pass_count if writer is not None else None
+    )
     total_cases = report_dict["summary"].get("cases", 0)
-    pass_count = sum(1 for c in report_dict.get("cases", []) if c.get("score", 0) >= 1.0)
-    fail_count = total_cases - pass_count
-    report_dict["summary"]["execution_time_seconds"] = round(elapsed, 4)
-    report_dict["summary"]["pass_count"] = pass_count
-    report_dict["summary"]["fail_count"] = fail_count
-    report_dict["metadata"] = {
-        "tool_version": __version__,
-        "python_version": platform.python_version(),
-        "platform": platform.platform(),
-    }
+    pass_count = report_dict["summary"]["pass_count"]
+    fail_count = report_dict["summary"]["fail_count"]
+    if score_cache is not None:
+        report_dict["metadata"]["metrics"] = collector.snapshot()
 
     logger.info(
         f"Eval complete: {total_cases} cases, {pass_count} passed, "
         f"{fail_count} failed, {elapsed:.3f}s elapsed"
     )
 
+    if writer is not None:
+        try:
+            with _span(profiler, "write"):
+                writer.finish(report_dict["summary"], report_dict["metadata"])
+            logger.info("Wrote streaming report (%d cases) to: %s", writer.cases, writer.path)
+        except OSError as e:
+            writer.abort()
+            logger.error("Failed to write report to %s: %s", writer.path, e)
+            return EXIT_CLI_ERROR
+        del report_dict["cases"]
+        report_dict["report_path"] = str(writer.path)
     # Legacy --out flag (kept for backward compat)
-    if getattr(args, "out", "") and args.out:
-        out = Path(args.out).resolve()
+    elif out_path is not None:
+        out = out_path
         try:
             out.parent.mkdir(parents=True, exist_ok=True)
-            out.write_text(json.dumps(report_dict, indent=2, sort_keys=True), encoding="utf-8")
+            with _span(profiler, "serialize"):
+                text = json.dumps(report_dict, indent=2, sort_keys=True)
+            with _span(profiler, "write"):
+                out.write_text(text, encoding="utf-8")
             logger.info(f"Wrote report to: {out}")
         except (OSError, PermissionError) as e:
             logger.error("Failed to write report to %s: %s", out, e)
             return EXIT_CLI_ERROR
 
-    _emit(report_dict, args)
+    _emit(report_dict, args, profiler)
+    return EXIT_SUCCESS
+
+
+def _cmd_bench(args: argparse.Namespace) -> int:
+    """Benchmark the harness's hot paths on a synthetic workload."""
+    import tempfile
+
+    from .benchmarks import BENCHMARKS, WorkloadSpec, generate_workload, run_benchmarks
+
+    only = [name.strip() for name in args.only.split(",") if name.strip()] if args.only else None
+    try:
+        spec = WorkloadSpec(
+            cases=args.cases,
+            payload=args.payload,
+            plugin_scorers=args.plugins,
+            accuracy=args.accuracy,
+            seed=args.seed,
+        )
+        with tempfile.TemporaryDirectory(prefix="toolkit-eval-bench-") as tmp:
+            workdir = Path(args.workdir).resolve() if args.workdir else Path(tmp)
+            workload = generate_workload(spec, workdir)
+            results = run_benchmarks(
+                workload,
+                repeat=args.repeat,
+                workers=args.workers,
+                executor=args.executor,
+                only=only,
+            )
+    except ValueError as e:
+        logger.error(
+            "Invalid benchmark options: %s. Available benchmarks: %s", e, ", ".join(BENCHMARKS)
+        )
+        return EXIT_CLI_ERROR
+    _emit(results, args)
     return EXIT_SUCCESS
 
 
 def _cmd_check_deps(args: argparse.Namespace) -> int:
     """Check that required tools and dependencies are available."""
+    import platform
+
+    from . import __version__
+    from .plugins import get_scorer, list_scorers
+
     results: dict[str, Any] = {"tool": "toolkit-eval", "version": __version__, "checks": []}
     all_ok = True
 
@@ -383,17 +721,40 @@ def _cmd_check_deps(args: argparse.Namespace) -> int:
             }
         )
 
-    # Report registered scorer plugins
-    scorers = list_scorers()
+    # Report scorer plugins, importing each so one that fails to load is not
+    # listed as available (list_scorers alone does not import entry points).
+    scorers: list[str] = []
+    unavailable: list[str] = []
+    for name in list_scorers():
+        try:
+            get_scorer(name)
+        except KeyError:
+            unavailable.append(name)
+        else:
+            scorers.append(name)
     results["registered_scorers"] = scorers
+    results["unavailable_scorers"] = unavailable
 
     results["all_ok"] = all_ok
     _emit(results, args)
     return EXIT_SUCCESS if all_ok else EXIT_VALIDATION_FAILED
 
 
+def _tag_budget(value: str) -> tuple[str, float]:
+    """Parse a ``TAG=PCT`` per-tag budget."""
+    tag, sep, pct = value.rpartition("=")
+    try:
+        if not sep or not tag:
+            raise ValueError(value)
+        return tag, float(pct)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected TAG=PCT, got '{value}'") from None
+
+
 def _cmd_compare(args: argparse.Namespace) -> int:
     """Compare candidate report against baseline report."""
+    from .compare import CompareBudget
+
     baseline_path = Path(args.baseline).resolve()
     candidate_path = Path(args.candidate).resolve()
 
@@ -402,8 +763,63 @@ def _cmd_compare(args: argparse.Namespace) -> int:
     logger.debug(f"Candidate: {candidate_path}")
 
     try:
-        baseline_obj = read_json(baseline_path)
-        baseline = EvalReport.from_dict(baseline_obj)
+        budget = CompareBudget(
+            max_score_regression_pct=float(args.max_score_regression_pct),
+            bootstrap_resamples=args.bootstrap,
+            bootstrap_seed=args.bootstrap_seed,
+            confidence=args.confidence,
+            max_tag_score_regression_pct=args.max_tag_score_regression_pct,
+            tag_budgets=dict(args.tag_budget),
+        )
+    except ValueError as e:
+        logger.error("Invalid comparison budget: %s", e)
+        return EXIT_CLI_ERROR
+
+    if args.server:
+        result = _compare_remote(args, baseline_path, candidate_path, budget)
+    else:
+        result = _compare_local(args, baseline_path, candidate_path, budget)
+    if result is None:
+        return EXIT_CLI_ERROR
+
+    if result["passed"]:
+        logger.info("Comparison passed")
+    elif result["reason"] == "significant_score_regression":
+        low, high = result["bootstrap"]["score_regression_pct_ci"]
+        logger.warning(
+            "Comparison FAILED: score regressed %.2f%% (%.0f%% CI %.2f%%..%.2f%%, "
+            "max allowed: %.2f%%).",
+            result.get("score_regression_pct", 0),
+            budget.confidence * 100,
+            low,
+            high,
+            budget.max_score_regression_pct,
+        )
+    elif result["reason"] == "tag_score_regression":
+        logger.warning(
+            "Comparison FAILED: per-tag budget exceeded for %s.",
+            ", ".join(result["failed_tags"]),
+        )
+    else:
+        logger.warning(
+            "Comparison FAILED: score regressed %.2f%% (max allowed: %.2f%%).",
+            result.get("score_regression_pct", 0),
+            budget.max_score_regression_pct,
+        )
+
+    _emit(result, args)
+    return EXIT_SUCCESS if result["passed"] else EXIT_VALIDATION_FAILED
+
+
+def _compare_local(
+    args: argparse.Namespace, baseline_path: Path, candidate_path: Path, budget: CompareBudget
+) -> dict[str, Any] | None:
+    """Load both reports and compare them in-process; ``None`` on error (logged)."""
+    from .compare import compare_reports
+    from .report import EvalReport
+
+    try:
+        baseline = EvalReport.load(baseline_path, columnar=True)
         logger.info("Loaded baseline report")
     except FileNotFoundError:
         logger.error(
@@ -411,14 +827,13 @@ def _cmd_compare(args: argparse.Namespace) -> int:
             "Provide a path to a JSON report produced by 'toolkit-eval run'.",
             baseline_path,
         )
-        return EXIT_CLI_ERROR
+        return None
     except (ValueError, PermissionError) as e:
         logger.error("Failed to read baseline: %s", e)
-        return EXIT_CLI_ERROR
+        return None
 
     try:
-        candidate_obj = read_json(candidate_path)
-        candidate = EvalReport.from_dict(candidate_obj)
+        candidate = EvalReport.load(candidate_path, columnar=True)
         logger.info("Loaded candidate report")
     except FileNotFoundError:
         logger.error(
@@ -426,39 +841,153 @@ def _cmd_compare(args: argparse.Namespace) -> int:
             "Provide a path to a JSON report produced by 'toolkit-eval run'.",
             candidate_path,
         )
-        return EXIT_CLI_ERROR
+        return None
     except (ValueError, PermissionError) as e:
         logger.error("Failed to read candidate: %s", e)
-        return EXIT_CLI_ERROR
+        return None
 
     try:
-        budget = CompareBudget(max_score_regression_pct=float(args.max_score_regression_pct))
-        result = compare_reports(baseline=baseline, candidate=candidate, budget=budget)
+        return compare_reports(
+            baseline=baseline,
+            candidate=candidate,
+            budget=budget,
+            case_diff=args.cases,
+            case_tolerance=args.case_tolerance,
+            max_listed=args.max_listed,
+        )
+    except Exception as e:
+        logger.error("Failed to compare reports: %s", e)
+        return None
 
-        if result["passed"]:
-            logger.info("Comparison passed")
-        else:
-            logger.warning(
-                "Comparison FAILED: score regressed %.2f%% (max allowed: %.2f%%).",
-                result.get("score_regression_pct", 0),
-                budget.max_score_regression_pct,
-            )
 
-        _emit(result, args)
-        return EXIT_SUCCESS if result["passed"] else EXIT_VALIDATION_FAILED
+def _compare_remote(
+    args: argparse.Namespace, baseline_path: Path, candidate_path: Path, budget: CompareBudget
+) -> dict[str, Any] | None:
+    """Compare in a ``toolkit-eval serve`` daemon; ``None`` on error (logged)."""
+    from .client import EvalClient
+
+    try:
+        return EvalClient(args.server).compare(
+            baseline_path,
+            candidate_path,
+            budget=budget,
+            case_diff=args.cases,
+            case_tolerance=args.case_tolerance,
+            max_listed=args.max_listed,
+        )
+    except FileNotFoundError as e:
+        logger.error("Report not found by the server: %s", e)
+    except (ValueError, OSError) as e:
+        logger.error("Failed to compare reports on %s: %s", args.server, e)
+    return None
+
+
+def _cmd_serve(args: argparse.Namespace) -> int:
+    """Serve run/compare requests from a warm daemon until interrupted."""
+    from .server import EvalServer
+
+    try:
+        server = EvalServer(
+            host=args.host,
+            port=args.port,
+            max_suites=args.max_suites,
+            workers=args.workers,
+            executor=args.executor,
+        )
+    except ValueError as e:
+        logger.error("Invalid server options: %s", e)
+        return EXIT_CLI_ERROR
+    except OSError as e:
+        logger.error("Could not listen on %s:%d: %s", args.host, args.port, e)
+        return EXIT_CLI_ERROR
+    # Announce the bound URL (``--port 0`` picks one) before blocking.
+    _emit({"url": server.url}, args)
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Shutting down")
+    finally:
+        server.close()
+    return EXIT_SUCCESS
+
+
+def _cmd_compare_many(args: argparse.Namespace) -> int:
+    """Compare many candidate reports against one baseline."""
+    from .compare import CompareBudget, compare_many
+    from .report import EvalReport
+
+    baseline_path = Path(args.baseline).resolve()
+    try:
+        baseline = EvalReport.load(baseline_path, columnar=True)
+    except FileNotFoundError:
+        logger.error(
+            "Baseline report not found: %s. "
+            "Provide a path to a JSON report produced by 'toolkit-eval run'.",
+            baseline_path,
+        )
+        return EXIT_CLI_ERROR
+    except (ValueError, PermissionError) as e:
+        logger.error("Failed to read baseline: %s", e)
+        return EXIT_CLI_ERROR
+    if args.workers < 1:
+        logger.error("--workers must be >= 1, got %d", args.workers)
+        return EXIT_CLI_ERROR
+
+    candidates = [(p, Path(p).resolve()) for p in args.candidates]
+    logger.info("Comparing %d candidate reports", len(candidates))
+    try:
+        result = compare_many(
+            baseline=baseline,
+            candidates=candidates,
+            budget=CompareBudget(max_score_regression_pct=float(args.max_score_regression_pct)),
+            workers=args.workers,
+            executor=args.executor,
+        )
     except Exception as e:
         logger.error("Failed to compare reports: %s", e)
         return EXIT_CLI_ERROR
 
+    failed = [row["name"] for row in result["candidates"] if not row["passed"]]
+    if failed:
+        logger.warning("%d candidate(s) FAILED: %s", len(failed), ", ".join(failed))
+    else:
+        logger.info("All candidates passed")
+    _emit(result, args)
+    return EXIT_SUCCESS if result["passed"] else EXIT_VALIDATION_FAILED
+
+
+def _validate_jsonl_report(path: Path) -> list[str]:
+    """Check a streaming JSONL report's envelope and case records."""
+    from .report import iter_report_cases, read_jsonl_report_envelope
+
+    errors: list[str] = []
+    try:
+        header, trailer = read_jsonl_report_envelope(path)
+        if not isinstance(header.get("suite"), dict):
+            errors.append("Missing or invalid 'suite' in header record (expected object).")
+        if not isinstance(trailer.get("summary"), dict):
+            errors.append("Missing or invalid 'summary' in trailer record (expected object).")
+        for n, case in enumerate(iter_report_cases(path), start=1):
+            if not isinstance(case, dict):
+                errors.append(f"Case record {n} is not an object.")
+                break
+    except (ValueError, KeyError, AttributeError) as e:
+        errors.append(f"Invalid JSONL report: {e}")
+    return errors
+
 
 def _cmd_validate_report(args: argparse.Namespace) -> int:
     """Validate an eval report JSON has the expected shape."""
+    from .report import is_jsonl_report
+
     report_path = Path(args.report).resolve()
 
     logger.info(f"Validating report: {report_path}")
 
     try:
-        obj = read_json(report_path)
+        jsonl = is_jsonl_report(report_path)
+        obj = None if jsonl else read_json(report_path)
     except FileNotFoundError:
         logger.error(
             "Report file not found: %s. "
@@ -471,7 +1000,9 @@ def _cmd_validate_report(args: argparse.Namespace) -> int:
         return EXIT_CLI_ERROR
 
     errors: list[str] = []
-    if not isinstance(obj, dict):
+    if jsonl:
+        errors = _validate_jsonl_report(report_path)
+    elif not isinstance(obj, dict):
         errors.append("Root element must be a JSON object (dict).")
     else:
         if not isinstance(obj.get("suite"), dict):
@@ -502,13 +1033,34 @@ def _cmd_validate_report(args: argparse.Namespace) -> int:
     return EXIT_SUCCESS if ok else EXIT_VALIDATION_FAILED
 
 
+class _VersionAction(argparse.Action):
+    """``--version``, resolving the installed version only when requested."""
+
+    def __init__(self, option_strings: list[str], dest: str, **kwargs: Any) -> None:
+        super().__init__(
+            option_strings,
+            dest,
+            nargs=0,
+            default=argparse.SUPPRESS,
+            help="show program's version number and exit",
+        )
+
+    def __call__(self, parser: argparse.ArgumentParser, *args: Any, **kwargs: Any) -> None:
+        from . import __version__
+
+        print(f"{parser.prog} {__version__}")
+        parser.exit()
+
+
 def build_parser() -> argparse.ArgumentParser:
     """Build CLI argument parser."""
+    from .benchmarks import BENCHMARKS, PAYLOADS
+
     p = argparse.ArgumentParser(
         prog="toolkit-eval",
         description="Toolkit Eval Harness - Run and compare evaluation suites",
     )
-    p.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    p.add_argument("--version", action=_VersionAction)
     verbosity = p.add_mutually_exclusive_group()
     verbosity.add_argument(
         "--verbose",
@@ -587,8 +1139,166 @@ def build_parser() -> argparse.ArgumentParser:
 
     run = sub.add_parser("run", help="Run an evaluation suite against predictions.")
     run.add_argument("--suite", required=True, help="Suite path (directory or zip)")
-    run.add_argument("--predictions", required=True, help="Predictions JSONL (id+prediction)")
-    run.add_argument("--out", default="", help="Optional output report JSON path")
+    run.add_argument(
+        "--predictions",
+        required=True,
+        help="Predictions JSONL (id+prediction); '-' reads stdin (with --online)",
+    )
+    run.add_argument(
+        "--out",
+        default="",
+        help="Optional output report path; a .jsonl path streams case results to disk and "
+        "omits them from stdout",
+    )
+    run.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Parallel scoring workers (default: max_workers from toolkit config, 4)",
+    )
+    run.add_argument(
+        "--executor",
+        choices=["thread", "process"],
+        default="thread",
+        help="Worker pool type: thread (I/O-bound scorers) or process (CPU-bound plugin "
+        "scorers) (default: thread)",
+    )
+    run.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Cases per call to batch plugin scorers; also the work unit size "
+        "(default: automatic)",
+    )
+    run.add_argument(
+        "--isolate-plugins",
+        action="store_true",
+        help="Run plugin scorers in sandboxed worker processes with a per-call timeout",
+    )
+    run.add_argument(
+        "--plugin-timeout",
+        type=float,
+        default=30.0,
+        help="Seconds before a sandboxed scorer call is killed and scored as a timeout "
+        "(default: 30)",
+    )
+    run.add_argument(
+        "--plugin-max-memory-mb",
+        type=float,
+        default=0,
+        help="Address-space ceiling per sandbox worker in MB, POSIX only (default: 0, no limit)",
+    )
+    run.add_argument(
+        "--plugin-recycle-after",
+        type=int,
+        default=1000,
+        help="Replace a sandbox worker after N calls; 0 never (default: 1000)",
+    )
+    run.add_argument(
+        "--stream-predictions",
+        action="store_true",
+        help="Stream predictions instead of loading the whole file (for very large JSONL)",
+    )
+    run.add_argument(
+        "--online",
+        action="store_true",
+        help="Score predictions as they are appended to --predictions (or read from "
+        "stdin with '--predictions -'), printing progress snapshots to stderr",
+    )
+    run.add_argument(
+        "--snapshot-interval",
+        type=float,
+        default=10.0,
+        metavar="SECONDS",
+        help="Seconds between --online progress snapshots; 0 disables (default: 10)",
+    )
+    run.add_argument(
+        "--online-idle-timeout",
+        type=float,
+        default=600.0,
+        metavar="SECONDS",
+        help="Finish an --online run once the predictions file has not grown for this "
+        "long; 0 waits until every case has a prediction (default: 600)",
+    )
+    run.add_argument(
+        "--lazy",
+        action="store_true",
+        help="Memory-map cases.jsonl and decode cases on access (suite directories only)",
+    )
+    run.add_argument(
+        "--case-ids",
+        default="",
+        help="Only score the case ids listed in FILE (one per line)",
+        metavar="FILE",
+    )
+    run.add_argument(
+        "--journal",
+        default="",
+        help="Append per-case results to FILE so an interrupted run can be resumed",
+        metavar="FILE",
+    )
+    run.add_argument(
+        "--resume",
+        action="store_true",
+        help="Replay results from --journal and only score missing or changed cases",
+    )
+    run.add_argument(
+        "--score-cache-dir",
+        default="",
+        help="Memoize scorer results in DIR (default: $TOOLKIT_EVAL_SCORE_CACHE_DIR, "
+        "unset disables)",
+        metavar="DIR",
+    )
+    run.add_argument(
+        "--score-cache-max-mb",
+        type=float,
+        default=None,
+        help="Evict least recently used score cache entries beyond this size (default: 1024)",
+    )
+    run.add_argument(
+        "--suite-cache-dir",
+        default="",
+        help="Cache parsed suites in DIR keyed by content hash "
+        "(default: $TOOLKIT_EVAL_SUITE_CACHE_DIR, "
+        "unset disables caching)",
+        metavar="DIR",
+    )
+    run.add_argument(
+        "--suite-cache-max-mb",
+        type=float,
+        default=None,
+        help="Evict least recently used suite cache entries beyond this size (default: 4096)",
+    )
+    run.add_argument(
+        "--metrics-textfile",
+        default="",
+        metavar="PATH",
+        help="Write run metrics in Prometheus text format to PATH (a node_exporter "
+        "textfile-collector .prom file) when the run ends",
+    )
+    run.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        metavar="PORT",
+        help="Serve live OpenMetrics at http://127.0.0.1:PORT/metrics during the run",
+    )
+    run.add_argument(
+        "--profile",
+        nargs="?",
+        const="spans",
+        default="",
+        choices=["spans", "cprofile"],
+        help="Time run phases and each plugin scorer and write <report>.profile.json "
+        "beside the report (--out, else --output, else ./toolkit-eval-run); "
+        "'cprofile' also writes <report>.pstats (use --workers 1 to include scorers)",
+    )
+    run.add_argument(
+        "--server",
+        default="",
+        metavar="URL",
+        help="Run in a warm 'toolkit-eval serve' daemon at URL (e.g. http://127.0.0.1:8765)",
+    )
     run.set_defaults(func=_cmd_run)
 
     compare = sub.add_parser("compare", help="Compare candidate report against baseline report.")
@@ -599,8 +1309,116 @@ def build_parser() -> argparse.ArgumentParser:
         default="2.0",
         help="Max score regression %% (default: 2.0)",
     )
+    compare.add_argument(
+        "--bootstrap",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Paired bootstrap with N resamples; fail only if the regression exceeds the "
+        "budget at --confidence (default: 0, point estimate)",
+    )
+    compare.add_argument(
+        "--bootstrap-seed", type=int, default=0, help="Bootstrap RNG seed (default: 0)"
+    )
+    compare.add_argument(
+        "--confidence",
+        type=float,
+        default=0.95,
+        help="Bootstrap confidence level (default: 0.95)",
+    )
+    compare.add_argument(
+        "--max-tag-score-regression-pct",
+        type=float,
+        default=None,
+        help="Max mean-score regression %% for every baseline tag (default: tags not gated)",
+    )
+    compare.add_argument(
+        "--tag-budget",
+        type=_tag_budget,
+        action="append",
+        default=[],
+        metavar="TAG=PCT",
+        help="Max score regression %% for one tag; repeatable, overrides "
+        "--max-tag-score-regression-pct",
+    )
+    compare.add_argument(
+        "--cases",
+        action="store_true",
+        help=(
+            "Add a per-case diff (regressed/improved/added/removed cases and per-tag deltas); "
+            "JSONL reports are streamed, JSON reports are loaded whole"
+        ),
+    )
+    compare.add_argument(
+        "--case-tolerance",
+        type=float,
+        default=0.0,
+        help="Score change at or below which a case counts as unchanged (default: 0)",
+    )
+    compare.add_argument(
+        "--max-listed",
+        type=int,
+        default=None,
+        help="List at most N cases per category in the case diff (default: all)",
+    )
+    compare.add_argument(
+        "--server",
+        default="",
+        metavar="URL",
+        help="Compare in a warm 'toolkit-eval serve' daemon at URL",
+    )
     compare.set_defaults(func=_cmd_compare)
 
+    compare_many_p = sub.add_parser(
+        "compare-many",
+        help="Rank many candidate reports against one baseline (summary and per-tag deltas).",
+    )
+    compare_many_p.add_argument("--baseline", required=True, help="Baseline report file path")
+    compare_many_p.add_argument(
+        "--candidates", required=True, nargs="+", help="Candidate report file paths"
+    )
+    compare_many_p.add_argument(
+        "--max-score-regression-pct",
+        default="2.0",
+        help="Max score regression %% per candidate (default: 2.0)",
+    )
+    compare_many_p.add_argument(
+        "--workers", type=int, default=1, help="Candidate reports loaded in parallel (default: 1)"
+    )
+    compare_many_p.add_argument(
+        "--executor",
+        choices=["thread", "process"],
+        default="thread",
+        help="Worker pool type (default: thread)",
+    )
+    compare_many_p.set_defaults(func=_cmd_compare_many)
+
+    serve = sub.add_parser(
+        "serve",
+        help="Run a warm evaluation daemon that keeps suites and plugin scorers resident.",
+    )
+    serve.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Loopback interface to bind; other hosts are refused (default: 127.0.0.1)",
+    )
+    serve.add_argument(
+        "--port", type=int, default=8765, help="TCP port; 0 picks a free one (default: 8765)"
+    )
+    serve.add_argument(
+        "--max-suites", type=int, default=16, help="Parsed suites kept resident (default: 16)"
+    )
+    serve.add_argument(
+        "--workers", type=int, default=1, help="Default scoring workers per run (default: 1)"
+    )
+    serve.add_argument(
+        "--executor",
+        choices=["thread", "process"],
+        default="thread",
+        help="Default worker pool type per run (default: thread)",
+    )
+    serve.set_defaults(func=_cmd_serve)
+
     validate_report = sub.add_parser(
         "validate-report", help="Validate an eval report JSON has the expected shape."
     )
@@ -609,6 +1427,49 @@ def build_parser() -> argparse.ArgumentParser:
     )
     validate_report.set_defaults(func=_cmd_validate_report)
 
+    bench = sub.add_parser(
+        "bench", help="Benchmark suite loading, pack verification, scoring and formatting."
+    )
+    bench.add_argument("--cases", type=int, default=10_000, help="Synthetic cases (default: 10000)")
+    bench.add_argument(
+        "--payload",
+        choices=list(PAYLOADS),
+        default="json",
+        help="Expected/prediction shape (default: json)",
+    )
+    bench.add_argument(
+        "--plugins", action="store_true", help="Also score with a pure-Python plugin scorer"
+    )
+    bench.add_argument(
+        "--accuracy",
+        type=float,
+        default=0.8,
+        help="Fraction of predictions that match exactly (default: 0.8)",
+    )
+    bench.add_argument("--seed", type=int, default=0, help="Workload RNG seed (default: 0)")
+    bench.add_argument(
+        "--repeat", type=int, default=5, help="Timed runs per benchmark (default: 5)"
+    )
+    bench.add_argument("--workers", type=int, default=1, help="Scoring workers (default: 1)")
+    bench.add_argument(
+        "--executor",
+        choices=["thread", "process"],
+        default="thread",
+        help="Scoring pool type (default: thread)",
+    )
+    bench.add_argument(
+        "--only",
+        default="",
+        help=f"Comma-separated benchmarks to run ({', '.join(BENCHMARKS)}; default: all)",
+    )
+    bench.add_argument(
+        "--workdir",
+        default="",
+        help="Keep the generated suite and predictions in DIR (default: temporary)",
+        metavar="DIR",
+    )
+    bench.set_defaults(func=_cmd_bench)
+
     check_deps = sub.add_parser(
         "check-deps", help="Verify all required tools and dependencies are available."
     )
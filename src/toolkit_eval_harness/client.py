@@ -0,0 +1,130 @@
+"""Thin client for the warm evaluation daemon (see :mod:`.server`).
+
+Uses only :mod:`urllib`, so ``run --server`` / ``compare --server`` import
+none of the scoring machinery::
+
+    client = EvalClient("http://127.0.0.1:8765")
+    report = client.run(Path("suite"), predictions_path=Path("preds.jsonl"))
+
+Paths are sent resolved to absolute paths, since the daemon's working
+directory may differ from the caller's.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import urllib.error
+import urllib.parse
+import urllib.request
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .compare import CompareBudget
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_URL = "http://127.0.0.1:8765"
+
+
+class EvalClient:
+    """Send ``run`` / ``compare`` requests to an :class:`.EvalServer`.
+
+    Args:
+        url: Base URL of the daemon.
+        timeout: Socket timeout in seconds (``None`` waits indefinitely).
+
+    Raises:
+        ValueError: If *url* is not an ``http://`` or ``https://`` URL.
+    """
+
+    def __init__(self, url: str = DEFAULT_URL, *, timeout: float | None = None) -> None:
+        if urllib.parse.urlsplit(url).scheme not in ("http", "https"):
+            raise ValueError(f"unsupported_server_url:{url}")
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def _request(self, path: str, payload: dict[str, Any] | None = None) -> dict[str, Any]:
+        data = None if payload is None else json.dumps(payload).encode("utf-8")
+        req = urllib.request.Request(
+            self.url + path, data=data, headers={"Content-Type": "application/json"}
+        )
+        try:
+            # The scheme is checked in __init__.
+            with urllib.request.urlopen(req, timeout=self.timeout) as resp:  # nosec B310
+                return dict(json.loads(resp.read()))
+        except urllib.error.HTTPError as e:
+            try:
+                message = json.loads(e.read()).get("error", e.reason)
+            except ValueError:
+                message = e.reason
+            if e.code == 404:
+                raise FileNotFoundError(message) from None
+            raise ValueError(f"server_error:{e.code}:{message}") from None
+
+    def health(self) -> dict[str, Any]:
+        """Return the daemon's ``/health`` status."""
+        return self._request("/health")
+
+    def run(
+        self,
+        suite: Path,
+        *,
+        predictions: dict[str, Any] | None = None,
+        predictions_path: Path | None = None,
+        case_ids: list[str] | None = None,
+        workers: int | None = None,
+        executor: str | None = None,
+        batch_size: int | None = None,
+    ) -> dict[str, Any]:
+        """Run *suite* in the daemon; returns the report object.
+
+        Give either in-memory *predictions* (keyed by case id) or a
+        *predictions_path* the daemon can read.
+
+        Raises:
+            FileNotFoundError: If the daemon cannot find a path.
+            ValueError: If the daemon rejects the request.
+        """
+        payload: dict[str, Any] = {"suite": str(Path(suite).resolve())}
+        if predictions is not None:
+            payload["predictions"] = predictions
+        if predictions_path is not None:
+            payload["predictions_path"] = str(Path(predictions_path).resolve())
+        options = {
+            "case_ids": case_ids,
+            "workers": workers,
+            "executor": executor,
+            "batch_size": batch_size,
+        }
+        payload.update({k: v for k, v in options.items() if v is not None})
+        return self._request("/run", payload)
+
+    def compare(
+        self,
+        baseline: Path,
+        candidate: Path,
+        *,
+        budget: CompareBudget | None = None,
+        case_diff: bool = False,
+        case_tolerance: float = 0.0,
+        max_listed: int | None = None,
+    ) -> dict[str, Any]:
+        """Compare two reports in the daemon; returns the comparison result.
+
+        Raises:
+            FileNotFoundError: If the daemon cannot find a report.
+            ValueError: If the daemon rejects the request.
+        """
+        payload: dict[str, Any] = {
+            "baseline": str(Path(baseline).resolve()),
+            "candidate": str(Path(candidate).resolve()),
+            "case_diff": case_diff,
+            "case_tolerance": case_tolerance,
+            "max_listed": max_listed,
+        }
+        if budget is not None:
+            payload["budget"] = {**asdict(budget), "tag_budgets": dict(budget.tag_budgets)}
+        return self._request("/compare", payload)
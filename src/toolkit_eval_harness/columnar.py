@@ -0,0 +1,207 @@
+"""Columnar in-memory store for per-case report results.
+
+A report's case results are normally a list of nested dicts, which costs
+several hundred bytes per case and makes every aggregation a Python loop.
+:class:`ColumnarCases` keeps the hot fields in flat arrays instead:
+
+* ``ids`` -- case ids, in report order;
+* ``scores`` -- ``array('d')`` of scores;
+* tags -- dictionary-encoded: ``tag_vocab`` holds each distinct tag once,
+  ``tag_codes`` the codes of every case's tags back to back and
+  ``tag_offsets`` where each case's run starts (CSR layout).
+
+* ``exact``, ``json`` and ``plugins`` -- dictionary-encoded JSON text: each
+  distinct value is stored once and every case holds a code (most suites
+  have a handful of distinct ``exact`` / ``json`` results).
+
+Any other field (``error`` ...) is kept per case as-is, so converting to and
+from the dict form is lossless for JSON-compatible results.
+Per-tag totals are kept up to date as cases are appended, so
+:meth:`ColumnarCases.tag_scores` costs O(distinct tags) however many cases
+there are; :meth:`ColumnarCases.mean_score` is vectorised with NumPy when it
+is installed.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, overload
+
+logger = logging.getLogger(__name__)
+
+# Fields stored as columns; everything else lives in the per-case extras.
+_COLUMNS = ("id", "tags", "score")
+# Fields dictionary-encoded as JSON text (values JSON cannot encode stay extras).
+_ENCODED = ("exact", "json", "plugins")
+_ABSENT = -1
+
+
+class _DictColumn:
+    """Dictionary-encoded column of JSON values; ``_ABSENT`` marks a missing field."""
+
+    __slots__ = ("codes", "index", "vocab")
+
+    def __init__(self) -> None:
+        self.vocab: list[str] = []
+        self.index: dict[str, int] = {}
+        self.codes = array("i")
+
+    def append(self, text: str | None) -> None:
+        if text is None:
+            self.codes.append(_ABSENT)
+            return
+        code = self.index.get(text)
+        if code is None:
+            code = self.index[text] = len(self.vocab)
+            self.vocab.append(text)
+        self.codes.append(code)
+
+
+class ColumnarCases(Sequence[dict[str, Any]]):
+    """Case results stored column-wise.
+
+    Behaves as a read-only sequence of case dicts (each item is rebuilt on
+    access), so it can stand in for ``EvalReport.cases``; cases are added
+    with :meth:`append`.
+
+    Args:
+        cases: Initial case dicts.
+    """
+
+    def __init__(self, cases: Iterable[dict[str, Any]] = ()) -> None:
+        self.ids: list[str] = []
+        self.scores = array("d")
+        self.tag_vocab: list[str] = []
+        self.tag_codes = array("i")
+        self.tag_offsets = array("q", [0])
+        self._tag_index: dict[str, int] = {}
+        self._fields = {name: _DictColumn() for name in _ENCODED}
+        self._extras: list[dict[str, Any] | None] = []
+        # Running per-tag case counts and score sums, indexed by tag code.
+        self._tag_counts = array("q")
+        self._tag_sums = array("d")
+        for case in cases:
+            self.append(case)
+
+    @classmethod
+    def from_cases(cls, cases: Iterable[dict[str, Any]]) -> ColumnarCases:
+        """Build a store from case dicts (consumed lazily)."""
+        if isinstance(cases, ColumnarCases):
+            return cases
+        return cls(cases)
+
+    def append(self, case: dict[str, Any]) -> None:
+        """Add one case result."""
+        score = float(case.get("score", 0.0))
+        self.ids.append(str(case["id"]))
+        self.scores.append(score)
+        start = len(self.tag_codes)
+        for tag in case.get("tags") or ():
+            code = self._tag_index.get(tag)
+            if code is None:
+                code = self._tag_index[tag] = len(self.tag_vocab)
+                self.tag_vocab.append(tag)
+                self._tag_counts.append(0)
+                self._tag_sums.append(0.0)
+            self.tag_codes.append(code)
+        self.tag_offsets.append(len(self.tag_codes))
+        for code in set(self.tag_codes[start:]):
+            self._tag_counts[code] += 1
+            self._tag_sums[code] += score
+        extras: dict[str, Any] = {}
+        encoded: dict[str, str] = {}
+        for key, value in case.items():
+            if key in _COLUMNS:
+                continue
+            if key in self._fields:
+                try:
+                    encoded[key] = json.dumps(value, ensure_ascii=False)
+                    continue
+                except (TypeError, ValueError):
+                    pass
+            extras[key] = value
+        for name, column in self._fields.items():
+            column.append(encoded.get(name))
+        self._extras.append(extras or None)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def tags_of(self, index: int) -> list[str]:
+        """Return the tags of the case at *index*."""
+        lo, hi = self.tag_offsets[index], self.tag_offsets[index + 1]
+        return [self.tag_vocab[code] for code in self.tag_codes[lo:hi]]
+
+    def _case(self, index: int) -> dict[str, Any]:
+        case: dict[str, Any] = {
+            "id": self.ids[index],
+            "tags": self.tags_of(index),
+            "score": self.scores[index],
+        }
+        for name, column in self._fields.items():
+            code = column.codes[index]
+            if code != _ABSENT:
+                case[name] = json.loads(column.vocab[code])
+        extras = self._extras[index]
+        if extras:
+            case.update(extras)
+        return case
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            return [self._case(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._case(index)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for index in range(len(self)):
+            yield self._case(index)
+
+    def to_cases(self) -> list[dict[str, Any]]:
+        """Return the case results as a list of dicts."""
+        return list(self)
+
+    def iter_entries(self) -> Iterator[tuple[str, float, list[str]]]:
+        """Yield ``(id, score, tags)`` per case without rebuilding case dicts."""
+        for index, cid in enumerate(self.ids):
+            yield cid, self.scores[index], self.tags_of(index)
+
+    def mean_score(self) -> float:
+        """Mean score over all cases (``0.0`` when empty)."""
+        if not self.scores:
+            return 0.0
+        try:
+            # Imported here: NumPy costs more to import than most CLI commands take.
+            import numpy as np
+        except ImportError:
+            return math.fsum(self.scores) / len(self.scores)
+        return float(np.frombuffer(self.scores, dtype=np.float64).mean())
+
+    def summary(self) -> dict[str, Any]:
+        """Report summary (``cases`` and mean ``score``) computed from the columns."""
+        return {"cases": len(self), "score": self.mean_score()}
+
+    def tag_scores(self) -> dict[str, dict[str, Any]]:
+        """Per-tag case count and mean score, sorted by tag.
+
+        Per-tag totals are maintained as cases are appended, so this costs
+        O(distinct tags).  A tag repeated within one case counts once.
+        """
+        counts, sums = self._tag_counts, self._tag_sums
+        return {
+            tag: {"cases": counts[code], "score": sums[code] / counts[code]}
+            for code, tag in sorted(enumerate(self.tag_vocab), key=lambda item: item[1])
+        }
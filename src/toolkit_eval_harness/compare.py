@@ -1,16 +1,60 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+import logging
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
 
+from .columnar import ColumnarCases
+from .diskindex import DiskIndex
+from .parallel import iter_chunks, map_chunks
 from .report import EvalReport
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class CompareBudget:
     max_score_regression_pct: float = 2.0
+    # Paired bootstrap over per-case scores; 0 gates on the point estimate only.
+    bootstrap_resamples: int = 0
+    bootstrap_seed: int = 0
+    confidence: float = 0.95
+    # Per-tag budgets: a default for every baseline tag and/or per-tag overrides.
+    max_tag_score_regression_pct: float | None = None
+    tag_budgets: Mapping[str, float] = field(default_factory=dict)
+
+
+def compare_reports(
+    *,
+    baseline: EvalReport,
+    candidate: EvalReport,
+    budget: CompareBudget,
+    case_diff: bool = False,
+    case_tolerance: float = 0.0,
+    max_listed: int | None = None,
+) -> dict:
+    result = _compare_summaries(baseline=baseline, candidate=candidate, budget=budget)
+    if budget.bootstrap_resamples > 0:
+        _apply_bootstrap(result, baseline=baseline, candidate=candidate, budget=budget)
+    if budget.max_tag_score_regression_pct is not None or budget.tag_budgets:
+        _apply_tag_budgets(result, baseline=baseline, candidate=candidate, budget=budget)
+    if case_diff:
+        result["case_diff"] = diff_cases(
+            baseline=baseline,
+            candidate=candidate,
+            tolerance=case_tolerance,
+            max_listed=max_listed,
+        )
+    return result
 
 
-def compare_reports(*, baseline: EvalReport, candidate: EvalReport, budget: CompareBudget) -> dict:
+def _compare_summaries(
+    *, baseline: EvalReport, candidate: EvalReport, budget: CompareBudget
+) -> dict:
     base = float(baseline.summary.get("score", 0.0))
     cand = float(candidate.summary.get("score", 0.0))
 
@@ -34,3 +78,429 @@ def compare_reports(*, baseline: EvalReport, candidate: EvalReport, budget: Comp
         "score_regression_pct": regression_pct,
         "max_score_regression_pct": budget.max_score_regression_pct,
     }
+
+
+def _apply_bootstrap(
+    result: dict[str, Any], *, baseline: EvalReport, candidate: EvalReport, budget: CompareBudget
+) -> None:
+    """Add a paired bootstrap to *result* and gate on its confidence interval.
+
+    With a baseline score, the comparison fails only when even the optimistic
+    end of the regression interval exceeds the budget, i.e. the regression is
+    beyond the budget at the configured confidence.
+    """
+    from .stats import paired_bootstrap
+
+    base_scores, cand_scores = paired_scores(baseline=baseline, candidate=candidate)
+    if not base_scores:
+        logger.warning("No cases present in both reports; skipping bootstrap")
+        result["bootstrap"] = None
+        return
+    boot = paired_bootstrap(
+        base_scores,
+        cand_scores,
+        resamples=budget.bootstrap_resamples,
+        seed=budget.bootstrap_seed,
+        confidence=budget.confidence,
+    )
+    result["bootstrap"] = boot
+    base = result["baseline_score"]
+    if base <= 0:
+        return
+    regression_low = -boot["ci_high"] / base * 100.0
+    regression_high = -boot["ci_low"] / base * 100.0
+    boot["score_regression_pct_ci"] = [regression_low, regression_high]
+    passed = regression_low <= budget.max_score_regression_pct
+    result["passed"] = passed
+    result["reason"] = "ok" if passed else "significant_score_regression"
+
+
+def _tag_result(
+    base: dict[str, Any] | None, cand: dict[str, Any] | None, max_pct: float
+) -> dict[str, Any]:
+    out: dict[str, Any] = {
+        "baseline_score": None if base is None else base["score"],
+        "candidate_score": None if cand is None else cand["score"],
+        "score_regression_pct": None,
+        "max_score_regression_pct": max_pct,
+    }
+    if base is None:
+        out.update(passed=True, reason="no_baseline_tag")
+    elif cand is None:
+        out.update(passed=False, reason="missing_tag")
+    elif base["score"] <= 0:
+        out.update(passed=True, reason="no_baseline_score")
+    else:
+        pct = (base["score"] - cand["score"]) / base["score"] * 100.0
+        passed = pct <= max_pct
+        out.update(
+            score_regression_pct=pct, passed=passed, reason="ok" if passed else "score_regression"
+        )
+    return out
+
+
+def _apply_tag_budgets(
+    result: dict[str, Any], *, baseline: EvalReport, candidate: EvalReport, budget: CompareBudget
+) -> None:
+    """Gate per-tag mean scores on their budgets and add ``by_tag`` to *result*.
+
+    Tag scores come from the reports' ``summary["by_tag"]`` when present (no
+    pass over the cases); older reports are aggregated from their cases.  A
+    budgeted tag missing from the candidate fails.
+    """
+    base_tags = _report_tag_scores(baseline)
+    cand_tags = _report_tag_scores(candidate)
+    budgets: dict[str, float] = {}
+    if budget.max_tag_score_regression_pct is not None:
+        budgets = dict.fromkeys(base_tags, budget.max_tag_score_regression_pct)
+    budgets.update(budget.tag_budgets)
+    by_tag = {
+        tag: _tag_result(base_tags.get(tag), cand_tags.get(tag), budgets[tag])
+        for tag in sorted(budgets)
+    }
+    result["by_tag"] = by_tag
+    failed = [tag for tag, row in by_tag.items() if not row["passed"]]
+    if failed:
+        result["failed_tags"] = failed
+        if result["passed"]:
+            result["passed"] = False
+            result["reason"] = "tag_score_regression"
+
+
+# ---------------------------------------------------------------------------
+# Case-level diff
+# ---------------------------------------------------------------------------
+
+# (score, tags) for one case.
+_Entry = tuple[float, list[str]]
+
+
+class _Unsorted(Exception):
+    """Raised when a stream assumed to be sorted by id is not."""
+
+
+def _entries(report: EvalReport) -> Iterator[tuple[str, _Entry]]:
+    if isinstance(report.cases, ColumnarCases):
+        for cid, score, tags in report.cases.iter_entries():
+            yield cid, (score, tags)
+        return
+    for case in report.iter_cases():
+        yield str(case["id"]), (float(case.get("score", 0.0)), list(case.get("tags") or []))
+
+
+def _sorted_entries(report: EvalReport) -> Iterator[tuple[str, _Entry]]:
+    """Yield entries of an id-sorted report, last duplicate winning; raise if unsorted."""
+    pending: tuple[str, _Entry] | None = None
+    for cid, entry in _entries(report):
+        if pending is not None:
+            if cid < pending[0]:
+                raise _Unsorted
+            if cid != pending[0]:
+                yield pending
+        pending = (cid, entry)
+    if pending is not None:
+        yield pending
+
+
+def _merge(
+    left: Iterator[tuple[str, _Entry]], right: Iterator[tuple[str, _Entry]]
+) -> Iterator[tuple[str, _Entry | None, _Entry | None]]:
+    """Full outer join of two id-ordered, duplicate-free streams."""
+    a = next(left, None)
+    b = next(right, None)
+    while a is not None and b is not None:
+        if a[0] < b[0]:
+            yield a[0], a[1], None
+            a = next(left, None)
+        elif b[0] < a[0]:
+            yield b[0], None, b[1]
+            b = next(right, None)
+        else:
+            yield a[0], a[1], b[1]
+            a, b = next(left, None), next(right, None)
+    while a is not None:
+        yield a[0], a[1], None
+        a = next(left, None)
+    while b is not None:
+        yield b[0], None, b[1]
+        b = next(right, None)
+
+
+def _spilled(index: DiskIndex) -> Iterator[tuple[str, _Entry]]:
+    for cid, raw in index.items():
+        score, tags = json.loads(raw)
+        yield cid, (float(score), list(tags))
+
+
+@dataclass
+class _DiffAccumulator:
+    tolerance: float
+    max_listed: int | None
+    regressed: list[dict[str, Any]] = field(default_factory=list)
+    improved: list[dict[str, Any]] = field(default_factory=list)
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    counts: dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(
+            ("matched", "regressed", "improved", "unchanged", "added", "removed"), 0
+        )
+    )
+    # tag -> [cases, baseline score sum, candidate score sum]
+    tags: dict[str, list[float]] = field(default_factory=dict)
+    truncated: bool = False
+
+    def _list(self, bucket: list[Any], item: Any) -> None:
+        if self.max_listed is None or len(bucket) < self.max_listed:
+            bucket.append(item)
+        else:
+            self.truncated = True
+
+    def add(self, cid: str, base: _Entry | None, cand: _Entry | None) -> None:
+        if base is None:
+            self.counts["added"] += 1
+            self._list(self.added, cid)
+            return
+        if cand is None:
+            self.counts["removed"] += 1
+            self._list(self.removed, cid)
+            return
+        self.counts["matched"] += 1
+        delta = cand[0] - base[0]
+        tags = sorted(set(base[1]) | set(cand[1]))
+        for tag in tags:
+            stats = self.tags.setdefault(tag, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += base[0]
+            stats[2] += cand[0]
+        if -self.tolerance <= delta <= self.tolerance:
+            self.counts["unchanged"] += 1
+            return
+        kind = "regressed" if delta < 0 else "improved"
+        self.counts[kind] += 1
+        item = {"id": cid, "baseline": base[0], "candidate": cand[0], "delta": delta, "tags": tags}
+        self._list(self.regressed if delta < 0 else self.improved, item)
+
+    def to_dict(self) -> dict[str, Any]:
+        by_tag: dict[str, dict[str, Any]] = {}
+        for tag in sorted(self.tags):
+            n, base_sum, cand_sum = self.tags[tag]
+            by_tag[tag] = {
+                "cases": int(n),
+                "baseline_score": base_sum / n,
+                "candidate_score": cand_sum / n,
+                "delta": (cand_sum - base_sum) / n,
+            }
+        return {
+            "counts": self.counts,
+            "regressed": self.regressed,
+            "improved": self.improved,
+            "added": self.added,
+            "removed": self.removed,
+            "by_tag": by_tag,
+            "truncated": self.truncated,
+        }
+
+
+_T = TypeVar("_T")
+
+
+def _join_cases(
+    baseline: EvalReport,
+    candidate: EvalReport,
+    consume: Callable[[Iterator[tuple[str, _Entry | None, _Entry | None]]], _T],
+) -> _T:
+    """Full outer join of both reports' cases on id, fed to *consume*.
+
+    A sort-merge over the streamed cases is tried first.  If either side is
+    not sorted by id, *consume* is called again from scratch on a merge of
+    both sides spilled to on-disk indexes.
+    """
+    try:
+        return consume(
+            _merge(_sorted_entries(baseline), _sorted_entries(candidate))
+        )
+    except _Unsorted:
+        logger.debug("Report cases not sorted by id; joining via on-disk index")
+    with DiskIndex() as base_index, DiskIndex() as cand_index:
+        for report, index in ((baseline, base_index), (candidate, cand_index)):
+            entries = _entries(report)
+            index.put_many((cid, json.dumps([score, tags])) for cid, (score, tags) in entries)
+        return consume(_merge(_spilled(base_index), _spilled(cand_index)))
+
+
+def diff_cases(
+    *,
+    baseline: EvalReport,
+    candidate: EvalReport,
+    tolerance: float = 0.0,
+    max_listed: int | None = None,
+) -> dict[str, Any]:
+    """Join baseline and candidate cases on ``id`` and classify every change.
+
+    Cases are streamed (see :meth:`.EvalReport.iter_cases`).  When both
+    reports list cases sorted by id -- as ``run_suite`` does for suites with
+    sorted ids -- a single sort-merge pass is used; otherwise both sides are
+    spilled to an on-disk :class:`~.diskindex.DiskIndex` and merged from
+    there.  For JSONL reports memory therefore grows with the diff, not with
+    the reports; a JSON report is parsed whole by :meth:`.EvalReport.load`
+    (into :class:`.ColumnarCases` under ``compare``), so its cases are held in
+    memory regardless.  Write reports to a ``.jsonl`` ``--out`` path to keep large
+    diffs bounded.
+
+    Args:
+        baseline: Baseline report.
+        candidate: Candidate report.
+        tolerance: Absolute score change at or below which a case counts as
+            unchanged.
+        max_listed: Cap on entries in each of the ``regressed``, ``improved``,
+            ``added`` and ``removed`` lists (counts are always complete).
+
+    Returns:
+        ``counts``, the four case lists (in id order), per-tag mean scores
+        and deltas over matched cases (``by_tag``), and ``truncated``.
+    """
+    if tolerance < 0:
+        raise ValueError(f"tolerance must be >= 0, got {tolerance}")
+
+    def consume(joined: Iterator[tuple[str, _Entry | None, _Entry | None]]) -> dict[str, Any]:
+        acc = _DiffAccumulator(tolerance=tolerance, max_listed=max_listed)
+        for cid, base, cand in joined:
+            acc.add(cid, base, cand)
+        return acc.to_dict()
+
+    return _join_cases(baseline, candidate, consume)
+
+
+def paired_scores(*, baseline: EvalReport, candidate: EvalReport) -> tuple[array, array]:
+    """Return ``array('d')`` baseline and candidate scores of cases present in both."""
+
+    def consume(joined: Iterator[tuple[str, _Entry | None, _Entry | None]]) -> tuple[array, array]:
+        base_scores, cand_scores = array("d"), array("d")
+        for _, base, cand in joined:
+            if base is not None and cand is not None:
+                base_scores.append(base[0])
+                cand_scores.append(cand[0])
+        return base_scores, cand_scores
+
+    return _join_cases(baseline, candidate, consume)
+
+
+# ---------------------------------------------------------------------------
+# One baseline, many candidates
+# ---------------------------------------------------------------------------
+
+
+def tag_scores(cases: Iterable[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Per-tag case count and mean score, streamed in one pass.
+
+    Vectorised over the columns when *cases* is a :class:`.ColumnarCases`.
+    """
+    if isinstance(cases, ColumnarCases):
+        return cases.tag_scores()
+    sums: dict[str, list[float]] = {}
+    for case in cases:
+        score = float(case.get("score", 0.0))
+        for tag in set(case.get("tags") or []):
+            stats = sums.setdefault(tag, [0, 0.0])
+            stats[0] += 1
+            stats[1] += score
+    return {tag: {"cases": int(n), "score": total / n} for tag, (n, total) in sorted(sums.items())}
+
+
+def _report_tag_scores(report: EvalReport) -> dict[str, dict[str, Any]]:
+    """Per-tag scores from the summary when recorded, else from the cases."""
+    by_tag = report.summary.get("by_tag")
+    if isinstance(by_tag, dict):
+        return {tag: {"cases": s["cases"], "score": s["score"]} for tag, s in by_tag.items()}
+    return tag_scores(report.cases if report.cases_path is None else report.iter_cases())
+
+
+def _candidate_rows(
+    baseline: EvalReport,
+    baseline_tags: dict[str, dict[str, Any]],
+    budget: CompareBudget,
+    chunk: list[tuple[str, Path]],
+) -> list[dict[str, Any]]:
+    """Load and summarise candidate reports.  Runs inside pool workers."""
+    rows: list[dict[str, Any]] = []
+    for name, path in chunk:
+        row: dict[str, Any] = {"name": name, "path": str(path)}
+        try:
+            candidate = EvalReport.load(path, columnar=True)
+            tags = _report_tag_scores(candidate)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Could not read candidate report %s: %s", path, e)
+            row.update(passed=False, reason="unreadable_report", error=str(e), score=None)
+            rows.append(row)
+            continue
+        row.update(_compare_summaries(baseline=baseline, candidate=candidate, budget=budget))
+        row["score"] = row.pop("candidate_score")
+        row["delta"] = row["score"] - row.pop("baseline_score")
+        row["cases"] = candidate.summary.get("cases")
+        row["by_tag"] = {
+            tag: stats["score"] - baseline_tags[tag]["score"]
+            for tag, stats in tags.items()
+            if tag in baseline_tags
+        }
+        rows.append(row)
+    return rows
+
+
+def compare_many(
+    *,
+    baseline: EvalReport,
+    candidates: Sequence[tuple[str, Path]],
+    budget: CompareBudget,
+    workers: int = 1,
+    executor: str = "thread",
+) -> dict[str, Any]:
+    """Compare one baseline against many candidate reports in a single pass.
+
+    The baseline's per-tag scores are computed once; each candidate report is
+    loaded (JSON or JSONL) once, optionally in parallel.  Per-tag scores come
+    from ``summary["by_tag"]`` when the report records them, otherwise from
+    one streamed pass over its cases.  Tag
+    deltas compare per-tag mean scores of each report and need no case join,
+    so candidates never hold the baseline's cases.  The budget is applied to
+    the summary score point estimate; bootstrap settings are not used here.
+
+    Args:
+        baseline: Baseline report.
+        candidates: ``(name, report_path)`` pairs.
+        budget: Regression budget applied to each candidate.
+        workers: Candidate reports loaded concurrently.
+        executor: ``"thread"`` or ``"process"`` (see :mod:`.parallel`).
+
+    Returns:
+        ``baseline`` score and tag scores, ``candidates`` ranked by score
+        (best first, unreadable reports last), the union of compared ``tags``
+        and ``passed`` (all candidates within budget).
+    """
+    baseline_tags = _report_tag_scores(baseline)
+    # Workers need the summary, not the cases.
+    slim = EvalReport(suite=baseline.suite, summary=baseline.summary)
+    rows = [
+        row
+        for chunk_rows in map_chunks(
+            _candidate_rows,
+            iter_chunks(candidates, 1),
+            workers=workers,
+            executor=executor,
+            args=(slim, baseline_tags, budget),
+        )
+        for row in chunk_rows
+    ]
+    rows.sort(key=lambda r: (r["score"] is None, -(r["score"] or 0.0), r["name"]))
+    for rank, row in enumerate(rows, start=1):
+        row["rank"] = rank
+    tags = sorted({tag for row in rows for tag in row.get("by_tag", {})})
+    return {
+        "baseline": {
+            "score": float(baseline.summary.get("score", 0.0)),
+            "cases": baseline.summary.get("cases"),
+            "by_tag": baseline_tags,
+        },
+        "candidates": rows,
+        "tags": tags,
+        "passed": all(row["passed"] for row in rows),
+    }
@@ -1,7 +1,7 @@
 """
 CLI command → ToolSpec mapping for toolkit-eval-harness.
 
-Maps the 7 top-level CLI subcommands to ToolSpec contracts.
+Maps the 9 top-level CLI subcommands to ToolSpec contracts.
 
 All commands are READ_ONLY + AUTO — the eval harness reads prediction files,
 runs scoring, and produces reports but never modifies external state.
@@ -96,7 +96,18 @@ TOOLKIT_TOOL_SPECS: dict[str, ToolkitCommandSpec] = {
                     "output": {"type": "string", "description": "Output report path"},
                     "format": {"type": "string", "enum": ["json", "text", "markdown"]},
                     "workers": {"type": "integer"},
+                    "executor": {"type": "string", "enum": ["thread", "process"]},
+                    "batch_size": {"type": "integer", "minimum": 1},
+                    "isolate_plugins": {"type": "boolean"},
+                    "plugin_timeout": {"type": "number", "exclusiveMinimum": 0},
                     "fail_fast": {"type": "boolean"},
+                    "metrics_textfile": {"type": "string"},
+                    "metrics_port": {"type": "integer", "minimum": 0},
+                    "profile": {"type": "string", "enum": ["spans", "cprofile"]},
+                    "server": {"type": "string", "description": "URL of a serve daemon"},
+                    "online": {"type": "boolean"},
+                    "snapshot_interval": {"type": "number", "minimum": 0},
+                    "online_idle_timeout": {"type": "number", "minimum": 0},
                 },
                 "required": ["suite", "predictions"],
             },
@@ -114,12 +125,50 @@ TOOLKIT_TOOL_SPECS: dict[str, ToolkitCommandSpec] = {
                     "baseline": {"type": "string"},
                     "candidate": {"type": "string"},
                     "format": {"type": "string", "enum": ["json", "text"]},
+                    "cases": {"type": "boolean", "description": "Include a per-case diff"},
+                    "server": {"type": "string", "description": "URL of a serve daemon"},
                 },
                 "required": ["baseline", "candidate"],
             },
         ),
         boundary=_READ_ONLY_AUTO,
     ),
+    "compare-many": ToolkitCommandSpec(
+        command="compare-many",
+        spec=_make_spec(
+            name="compare-many",
+            description="Rank many candidate eval reports against one baseline report.",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "baseline": {"type": "string"},
+                    "candidates": {"type": "array", "items": {"type": "string"}},
+                    "format": {"type": "string", "enum": ["json", "table", "csv"]},
+                    "workers": {"type": "integer", "minimum": 1},
+                },
+                "required": ["baseline", "candidates"],
+            },
+        ),
+        boundary=_READ_ONLY_AUTO,
+    ),
+    "serve": ToolkitCommandSpec(
+        command="serve",
+        spec=_make_spec(
+            name="serve",
+            description="Run a warm daemon serving run/compare requests on localhost.",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "host": {"type": "string"},
+                    "port": {"type": "integer", "minimum": 0},
+                    "max_suites": {"type": "integer", "minimum": 1},
+                    "workers": {"type": "integer", "minimum": 1},
+                    "executor": {"type": "string", "enum": ["thread", "process"]},
+                },
+            },
+        ),
+        boundary=_READ_ONLY_AUTO,
+    ),
     "validate-report": ToolkitCommandSpec(
         command="validate-report",
         spec=_make_spec(
@@ -135,6 +184,25 @@ TOOLKIT_TOOL_SPECS: dict[str, ToolkitCommandSpec] = {
         ),
         boundary=_READ_ONLY_AUTO,
     ),
+    "bench": ToolkitCommandSpec(
+        command="bench",
+        spec=_make_spec(
+            name="bench",
+            description="Benchmark the harness's hot paths on a synthetic workload.",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "cases": {"type": "integer", "minimum": 1},
+                    "payload": {"type": "string", "enum": ["string", "json", "nested"]},
+                    "plugins": {"type": "boolean"},
+                    "repeat": {"type": "integer", "minimum": 1},
+                    "workers": {"type": "integer", "minimum": 1},
+                    "only": {"type": "string", "description": "Comma-separated benchmarks"},
+                },
+            },
+        ),
+        boundary=_READ_ONLY_AUTO,
+    ),
     "check-deps": ToolkitCommandSpec(
         command="check-deps",
         spec=_make_spec(
@@ -0,0 +1,80 @@
+"""On-disk key/value index for joins that do not fit in memory.
+
+A thin wrapper over a throw-away SQLite database living in a private temp
+directory.  Used when streaming inputs are not sorted by id and an in-memory
+``dict`` would grow with the input size.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_BATCH = 10_000
+
+
+class DiskIndex:
+    """Temporary ``str -> value`` mapping stored in SQLite.
+
+    Values may be any type SQLite stores natively (int, float, str, bytes,
+    ``None``).  Re-inserting a key replaces the previous value (last write
+    wins).  Use as a context manager so the backing file is removed::
+
+        with DiskIndex() as idx:
+            idx.put_many((k, v) for k, v in pairs)
+            value = idx.get("c1")
+    """
+
+    def __init__(self, *, dir: Path | None = None) -> None:
+        self._tmp = tempfile.TemporaryDirectory(prefix="toolkit_eval_index_", dir=dir)
+        db_path = Path(self._tmp.name) / "index.sqlite"
+        self._conn = sqlite3.connect(str(db_path))
+        self._conn.execute("PRAGMA journal_mode=OFF")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute("CREATE TABLE kv (k TEXT PRIMARY KEY, v)")
+        logger.debug("Created disk index at %s", db_path)
+
+    def put_many(self, items: Iterable[tuple[str, Any]]) -> int:
+        """Insert *items* in batches; return the number of rows written."""
+        count = 0
+        batch: list[tuple[str, Any]] = []
+        for item in items:
+            batch.append(item)
+            if len(batch) >= _BATCH:
+                self._conn.executemany("INSERT OR REPLACE INTO kv VALUES (?, ?)", batch)
+                count += len(batch)
+                batch.clear()
+        if batch:
+            self._conn.executemany("INSERT OR REPLACE INTO kv VALUES (?, ?)", batch)
+            count += len(batch)
+        self._conn.commit()
+        return count
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value stored under *key*, or *default*."""
+        row = self._conn.execute("SELECT v FROM kv WHERE k = ?", (key,)).fetchone()
+        return default if row is None else row[0]
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        """Yield all ``(key, value)`` pairs ordered by key."""
+        yield from self._conn.execute("SELECT k, v FROM kv ORDER BY k")
+
+    def __len__(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM kv").fetchone()[0])
+
+    def close(self) -> None:
+        """Close the database and delete the backing directory."""
+        self._conn.close()
+        self._tmp.cleanup()
+
+    def __enter__(self) -> DiskIndex:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
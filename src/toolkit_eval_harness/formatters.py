@@ -13,24 +13,80 @@ import io
 import json
 from typing import Any
 
+from .columnar import ColumnarCases
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, ColumnarCases):
+        return obj.to_cases()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
 def format_json(data: dict[str, Any]) -> str:
-    """Format data as pretty-printed JSON."""
-    return json.dumps(data, indent=2, sort_keys=True)
+    """Format data as pretty-printed JSON (columnar ``cases`` are expanded)."""
+    return json.dumps(data, indent=2, sort_keys=True, default=_json_default)
 
 
 def format_table(data: dict[str, Any]) -> str:
     """Format evaluation result data as a human-readable ASCII table.
 
-    Handles two shapes:
+    Handles three shapes:
     - Eval report (has ``summary`` and ``cases`` keys)
+    - Comparison matrix from ``compare-many`` (``baseline`` and ``candidates``)
     - Generic dict (rendered as key-value pairs)
     """
     if "cases" in data and "summary" in data:
         return _format_report_table(data)
+    if _is_matrix(data):
+        return _format_matrix_table(data)
     return _format_dict_table(data)
 
 
+def _is_matrix(data: dict[str, Any]) -> bool:
+    return "baseline" in data and isinstance(data.get("candidates"), list)
+
+
+def _fmt_num(val: Any, spec: str = ".4f") -> str:
+    return "-" if val is None else format(val, spec)
+
+
+def _matrix_rows(data: dict[str, Any]) -> tuple[list[str], list[list[str]]]:
+    """Header and rows of a ``compare-many`` matrix, one row per candidate."""
+    tags = list(data.get("tags", []))
+    header = ["rank", "candidate", "score", "delta", "regression_pct", "passed", *tags]
+    baseline = data.get("baseline", {})
+    base_tags = baseline.get("by_tag", {})
+    rows = [
+        ["", "(baseline)", _fmt_num(baseline.get("score")), "", "", ""]
+        + [_fmt_num(base_tags.get(t, {}).get("score")) for t in tags]
+    ]
+    for c in data["candidates"]:
+        by_tag = c.get("by_tag", {})
+        rows.append(
+            [
+                str(c.get("rank", "")),
+                str(c.get("name", "")),
+                _fmt_num(c.get("score")),
+                _fmt_num(c.get("delta"), "+.4f"),
+                _fmt_num(c.get("score_regression_pct"), ".2f"),
+                "yes" if c.get("passed") else f"no ({c.get('reason', '')})",
+            ]
+            + [_fmt_num(by_tag.get(t), "+.4f") for t in tags]
+        )
+    return header, rows
+
+
+def _format_matrix_table(data: dict[str, Any]) -> str:
+    """Format a ``compare-many`` result as a ranked table with per-tag deltas."""
+    header, rows = _matrix_rows(data)
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    lines = ["  ".join(h.ljust(w) for h, w in zip(header, widths, strict=True)).rstrip()]
+    lines.append("  ".join("-" * w for w in widths))
+    for row in rows:
+        lines.append("  ".join(v.ljust(w) for v, w in zip(row, widths, strict=True)).rstrip())
+    return "\n".join(lines)
+
+
 def _format_report_table(data: dict[str, Any]) -> str:
     """Format an eval report as a table."""
     lines: list[str] = []
@@ -49,23 +105,41 @@ def _format_report_table(data: dict[str, Any]) -> str:
     lines.append("-" * 40)
     for key in sorted(summary):
         val = summary[key]
+        if key == "by_tag" and isinstance(val, dict):
+            continue
         if isinstance(val, float):
             val = f"{val:.4f}"
         lines.append(f"  {key:<30s} {val}")
     lines.append("")
 
+    # Per-tag summary
+    by_tag = summary.get("by_tag")
+    if isinstance(by_tag, dict) and by_tag:
+        w = max(len("Tag"), max(len(str(t)) for t in by_tag))
+        lines.append(f"{'Tag':<{w}s}  {'Cases':>6s}  {'Score':>8s}  {'Passed':>6s}  {'StdDev':>8s}")
+        lines.append(f"{'-' * w}  {'-' * 6}  {'-' * 8}  {'-' * 6}  {'-' * 8}")
+        for tag, st in by_tag.items():
+            lines.append(
+                f"{tag:<{w}s}  {st.get('cases', 0):>6d}  {st.get('score', 0.0):>8.4f}  "
+                f"{st.get('passed', 0):>6d}  {st.get('stddev', 0.0):>8.4f}"
+            )
+        lines.append("")
+
     # Cases table
     cases = data.get("cases", [])
     if cases:
         # Columns: ID, Score, Tags
-        id_width = max(len("ID"), max((len(str(c.get("id", ""))) for c in cases), default=2))
+        if isinstance(cases, ColumnarCases):
+            rows = list(cases.iter_entries())
+        else:
+            rows = [
+                (str(c.get("id", "")), c.get("score", 0.0), c.get("tags", [])) for c in cases
+            ]
+        id_width = max(len("ID"), max((len(cid) for cid, _, _ in rows), default=2))
         lines.append(f"{'ID':<{id_width}s}  {'Score':>8s}  Tags")
         lines.append(f"{'-' * id_width}  {'-' * 8}  {'-' * 20}")
-        for c in cases:
-            cid = str(c.get("id", ""))
-            score = c.get("score", 0.0)
-            tags = ", ".join(c.get("tags", []))
-            lines.append(f"{cid:<{id_width}s}  {score:>8.4f}  {tags}")
+        for cid, score, tags in rows:
+            lines.append(f"{cid:<{id_width}s}  {score:>8.4f}  {', '.join(tags)}")
 
     # Metadata
     metadata = data.get("metadata", {})
@@ -97,6 +171,9 @@ def format_csv(data: dict[str, Any]) -> str:
     For eval reports, outputs one row per case with columns:
     id, score, tags, exact_match, json_valid.
 
+    For ``compare-many`` matrices, outputs the baseline row and one row per
+    candidate, with a per-tag delta column for every tag.
+
     For generic dicts, outputs key,value rows.
     """
     buf = io.StringIO()
@@ -117,6 +194,10 @@ def format_csv(data: dict[str, Any]) -> str:
                     json_meta.get("json_valid", ""),
                 ]
             )
+    elif _is_matrix(data):
+        header, rows = _matrix_rows(data)
+        writer.writerow(header)
+        writer.writerows([[v if v != "-" else "" for v in row] for row in rows])
     else:
         writer.writerow(["key", "value"])
         for key in sorted(data):
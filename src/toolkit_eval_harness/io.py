@@ -191,6 +191,41 @@ def read_jsonl(path: Path) -> Iterable[dict[str, Any]]:
     logger.info(f"Read JSONL with {line_num} lines from: {validated_path}")
 
 
+_ID_PREFIX = b'{"id":'
+_ID_PROBE_BYTES = 512
+_decoder = json.JSONDecoder()
+
+
+def jsonl_line_id(line: bytes) -> str:
+    """Return the ``id`` field of a JSONL record without parsing the whole line.
+
+    Records written with ``id`` as their first key (as ``json.dumps`` does for
+    dicts built that way) are resolved from a short prefix; anything else
+    falls back to a full parse.
+
+    Args:
+        line: One raw JSONL line.
+
+    Returns:
+        The record id, converted to ``str``.
+
+    Raises:
+        KeyError: If the record has no ``id`` field.
+        ValueError: If the line is not valid JSON.
+    """
+    stripped = line.lstrip()
+    if stripped.startswith(_ID_PREFIX):
+        probe = stripped[len(_ID_PREFIX) : len(_ID_PREFIX) + _ID_PROBE_BYTES]
+        try:
+            text = probe.decode("utf-8")
+            value, end = _decoder.raw_decode(text, len(text) - len(text.lstrip()))
+            if text[end:].lstrip()[:1] in (",", "}") and not isinstance(value, (dict, list)):
+                return str(value)
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            pass
+    return str(json.loads(line)["id"])
+
+
 def read_text(path: Path) -> str:
     """Read text file.
 
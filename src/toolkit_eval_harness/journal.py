@@ -0,0 +1,113 @@
+"""Append-only per-case result journal for resumable runs.
+
+Every scored case is appended to a JSONL journal as
+``{"id": ..., "key": ..., "result": {...}}`` where ``key`` is a digest of the
+case's expected value, the prediction and the suite's scorer configuration
+(including plugin scorer versions).  When a run is resumed, cases whose key
+matches a journaled record reuse the stored result instead of being
+rescored; cases that are new or whose inputs changed are scored normally and
+appended.
+
+A truncated final line (e.g. after the process was killed mid-write) is
+ignored on load.  Later records for the same id take precedence.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import IO, Any
+
+from .hashing import canonical_json
+
+logger = logging.getLogger(__name__)
+
+
+def scorer_config_digest(scoring: dict[str, Any], plugin_scorers: dict[str, str]) -> str:
+    """Digest of everything besides the case data that can change a score.
+
+    Args:
+        scoring: The suite's scoring configuration.
+        plugin_scorers: Plugin scorer name -> :func:`.scorer_version`, so a
+            journal written by an older plugin release is not replayed.
+    """
+    return hashlib.sha256(
+        canonical_json({"scoring": scoring, "plugin_scorers": plugin_scorers})
+    ).hexdigest()
+
+
+def result_key(*, config_digest: str, expected: Any, predicted: Any) -> str:
+    """Return the journal key for one case."""
+    h = hashlib.sha256(config_digest.encode("ascii"))
+    h.update(b"\0")
+    h.update(canonical_json(expected))
+    h.update(b"\0")
+    h.update(canonical_json(predicted))
+    return h.hexdigest()
+
+
+class ResultJournal:
+    """Append-only JSONL journal of per-case results.
+
+    Args:
+        path: Journal file path.
+        resume: Load existing records for replay.  When ``False`` the journal
+            is truncated and a fresh run is recorded.
+    """
+
+    def __init__(self, path: Path, *, resume: bool = False) -> None:
+        self.path = path
+        self._entries: dict[str, tuple[str, dict[str, Any]]] = {}
+        self.replayed = 0
+        if resume and path.exists():
+            self._load()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh: IO[str] = path.open("a" if resume else "w", encoding="utf-8")
+
+    def _load(self) -> None:
+        skipped = 0
+        with self.path.open("r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    rec = json.loads(line)
+                    self._entries[str(rec["id"])] = (str(rec["key"]), dict(rec["result"]))
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    skipped += 1
+        if skipped:
+            logger.warning("Skipped %d unreadable journal records in %s", skipped, self.path)
+        logger.info("Loaded %d journaled results from %s", len(self._entries), self.path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, case_id: str, key: str) -> dict[str, Any] | None:
+        """Return the journaled result for *case_id* if its key still matches."""
+        entry = self._entries.get(case_id)
+        if entry is None or entry[0] != key:
+            return None
+        self.replayed += 1
+        return entry[1]
+
+    def append(self, case_id: str, key: str, result: dict[str, Any]) -> None:
+        """Record a freshly scored result (buffered until :meth:`flush`)."""
+        self._fh.write(json.dumps({"id": case_id, "key": key, "result": result}) + "\n")
+
+    def flush(self) -> None:
+        """Flush buffered records to the OS."""
+        self._fh.flush()
+
+    def close(self) -> None:
+        """Flush and close the journal file."""
+        if not self._fh.closed:
+            self._fh.flush()
+            self._fh.close()
+
+    def __enter__(self) -> ResultJournal:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -3,19 +3,161 @@
 Provides simple counters, timers, and gauge tracking without external
 dependencies.  Designed for CLI-tool use -- all state lives in-process
 and can be serialised to a plain dict for inclusion in reports.
+
+Timers are recorded into :class:`LogHistogram` sketches, so memory stays
+bounded however many measurements a run takes while latency percentiles
+remain accurate to about 1%.
 """
 
 from __future__ import annotations
 
 import logging
+import math
 import threading
 import time
+from collections import deque
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
+# Most recent raw measurements kept per timer for get_timer().
+RECENT_TIMINGS = 1024
+# Quantiles reported for every timer / latency histogram.
+QUANTILES = {"p50": 0.50, "p90": 0.90, "p99": 0.99, "p999": 0.999}
+
+
+class LogHistogram:
+    """Bounded-memory histogram with logarithmic buckets (HDR style).
+
+    Values at or above *min_value* land in bucket ``floor(log(v / min_value)
+    / log(1 + 2 * relative_error))``, so a quantile read from a bucket
+    midpoint is within about *relative_error* of the true value.  Buckets are
+    sparse; nanoseconds to days at 1% span under 2,000 of them.  Count,
+    total, min and max are exact.
+
+    Args:
+        relative_error: Target relative error of quantile estimates.
+        min_value: Smallest distinguishable value; smaller values (including
+            zero) share one underflow bucket.
+    """
+
+    def __init__(self, *, relative_error: float = 0.01, min_value: float = 1e-9) -> None:
+        if not 0.0 < relative_error < 1.0:
+            raise ValueError(f"relative_error must be in (0, 1), got {relative_error}")
+        if min_value <= 0:
+            raise ValueError(f"min_value must be > 0, got {min_value}")
+        self.relative_error = relative_error
+        self.min_value = min_value
+        self._log_base = math.log1p(2 * relative_error)
+        self._buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _bucket(self, value: float) -> int:
+        if value < self.min_value:
+            return -1
+        return int(math.log(value / self.min_value) / self._log_base)
+
+    def add(self, value: float) -> None:
+        """Record one value."""
+        idx = self._bucket(value)
+        self._buckets[idx] = self._buckets.get(idx, 0) + 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: LogHistogram) -> None:
+        """Add *other*'s values (same bucket layout required)."""
+        if (other.relative_error, other.min_value) != (self.relative_error, self.min_value):
+            raise ValueError("cannot merge histograms with different bucket layouts")
+        # Copy first: *other* may be another thread's live shard.
+        for idx, n in dict(other._buckets).items():
+            self._buckets[idx] = self._buckets.get(idx, 0) + n
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def cumulative_counts(self, bounds: Sequence[float]) -> list[int]:
+        """Count values ``<= bound`` for each ascending bound (Prometheus ``le`` buckets).
+
+        A bucket counts towards a bound once its upper edge is within the
+        bound, so counts are exact up to the histogram's relative error.
+        """
+        out: list[int] = []
+        items = sorted(self._buckets.items())
+        seen, pos = 0, 0
+        for bound in bounds:
+            while pos < len(items):
+                idx, n = items[pos]
+                upper = self.min_value * math.exp((idx + 1) * self._log_base)
+                if upper > bound * (1 + 1e-9):
+                    break
+                seen += n
+                pos += 1
+            out.append(seen)
+        return out
+
+    def to_state(self) -> dict[str, Any]:
+        """Return the histogram in a JSON-serialisable mergeable form."""
+        return {
+            "relative_error": self.relative_error,
+            "min_value": self.min_value,
+            "buckets": {str(idx): n for idx, n in self._buckets.items()},
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> LogHistogram:
+        """Rebuild a histogram from :meth:`to_state` output."""
+        hist = cls(relative_error=state["relative_error"], min_value=state["min_value"])
+        hist._buckets = {int(idx): int(n) for idx, n in state["buckets"].items()}
+        hist.count = int(state["count"])
+        hist.total = float(state["total"])
+        if hist.count:
+            hist.min, hist.max = float(state["min"]), float(state["max"])
+        return hist
+
+    def quantile(self, q: float) -> float:
+        """Estimate the *q*-quantile (nearest rank; ``0.0`` when empty)."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for idx in sorted(self._buckets):
+            seen += self._buckets[idx]
+            if seen >= rank:
+                if idx < 0:
+                    return self.min
+                mid = self.min_value * math.exp((idx + 0.5) * self._log_base)
+                return min(max(mid, self.min), self.max)
+        return self.max
+
+    def to_dict(self, *, suffix: str = "") -> dict[str, Any]:
+        """Return count, total, min, max and :data:`QUANTILES`, rounded to 6 places."""
+        empty = not self.count
+        out: dict[str, Any] = {
+            "count": self.count,
+            f"total{suffix}": round(self.total, 6),
+            f"min{suffix}": 0.0 if empty else round(self.min, 6),
+            f"max{suffix}": 0.0 if empty else round(self.max, 6),
+        }
+        for name, q in QUANTILES.items():
+            out[f"{name}{suffix}"] = round(self.quantile(q), 6)
+        return out
+
+
 @dataclass
 class TimerResult:
     """Result of a completed timer measurement."""
@@ -24,15 +166,41 @@ class TimerResult:
     elapsed_seconds: float
 
 
+class _Shard:
+    """One thread's private metric accumulators."""
+
+    __slots__ = ("counters", "gauges", "recent", "timers")
+
+    def __init__(self) -> None:
+        self.counters: dict[str, int] = {}
+        self.timers: dict[str, LogHistogram] = {}
+        # (monotonic_ns, value) so values from several shards can be ordered.
+        self.recent: dict[str, deque[tuple[int, float]]] = {}
+        self.gauges: dict[str, tuple[int, float]] = {}
+
+    def clear(self) -> None:
+        self.counters.clear()
+        self.timers.clear()
+        self.recent.clear()
+        self.gauges.clear()
+
+
 class MetricsCollector:
     """Thread-safe, in-process metrics collector.
 
     Tracks three metric types:
 
     * **counters** -- monotonically increasing integers (e.g. test counts).
-    * **timers** -- elapsed-time measurements stored as lists of floats.
+    * **timers** -- elapsed-time measurements summarised in bounded-memory
+      :class:`LogHistogram` sketches (plus the most recent raw values).
     * **gauges** -- point-in-time numeric values (e.g. score averages).
 
+    Updates go to a per-thread shard without taking a lock; shards are
+    merged when metrics are read.  Reads taken while other threads are
+    updating see each shard as of some recent point, which is fine for
+    monitoring.  :meth:`to_state` / :meth:`merge_state` move partial metrics
+    between processes (e.g. from process-pool workers back to the parent).
+
     Usage::
 
         mc = MetricsCollector()
@@ -43,28 +211,58 @@ class MetricsCollector:
             run_suite(...)
 
         snapshot = mc.snapshot()
+
+    Args:
+        log_updates: Emit a ``DEBUG`` log record for every update.  Off by
+            default because updates sit on the scoring hot path.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, *, log_updates: bool = False) -> None:
+        self._setup(log_updates)
+
+    def _setup(self, log_updates: bool) -> None:
+        self.log_updates = log_updates
+        # Guards the shard list and whole-collector operations, not updates.
         self._lock = threading.Lock()
-        self._counters: dict[str, int] = {}
-        self._timers: dict[str, list[float]] = {}
-        self._gauges: dict[str, float] = {}
+        self._local = threading.local()
+        self._shards: list[_Shard] = []
+
+    def _shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    # A pickled collector carries its merged metrics, e.g. into pool workers.
+    def __getstate__(self) -> dict[str, Any]:
+        return {"log_updates": self.log_updates, "state": self.to_state()}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._setup(state["log_updates"])
+        self.merge_state(state["state"])
 
     # -- counters -------------------------------------------------------------
 
     def increment(self, name: str, delta: int = 1) -> int:
-        """Increment a counter by *delta* (default 1) and return its new value."""
-        with self._lock:
-            self._counters[name] = self._counters.get(name, 0) + delta
-            value = self._counters[name]
-        logger.debug("metrics.counter %s = %d (+%d)", name, value, delta)
+        """Increment a counter by *delta* (default 1).
+
+        Returns the calling thread's share of the counter, so the hot path
+        never reads other threads' shards; use :meth:`get_counter` for the
+        total.  With a single updating thread the two are equal.
+        """
+        counters = self._shard().counters
+        value = counters[name] = counters.get(name, 0) + delta
+        if self.log_updates:
+            logger.debug("metrics.counter %s = %d (+%d)", name, value, delta)
         return value
 
     def get_counter(self, name: str) -> int:
         """Return current value of a counter (0 if not set)."""
-        with self._lock:
-            return self._counters.get(name, 0)
+        return sum(shard.counters.get(name, 0) for shard in list(self._shards))
 
     # -- timers ---------------------------------------------------------------
 
@@ -74,53 +272,110 @@ class MetricsCollector:
 
     def record_time(self, name: str, elapsed: float) -> None:
         """Manually record an elapsed-time measurement."""
-        with self._lock:
-            self._timers.setdefault(name, []).append(elapsed)
-        logger.debug("metrics.timer %s = %.4fs", name, elapsed)
+        shard = self._shard()
+        hist = shard.timers.get(name)
+        if hist is None:
+            hist = shard.timers[name] = LogHistogram()
+            shard.recent[name] = deque(maxlen=RECENT_TIMINGS)
+        hist.add(elapsed)
+        shard.recent[name].append((time.monotonic_ns(), elapsed))
+        if self.log_updates:
+            logger.debug("metrics.timer %s = %.4fs", name, elapsed)
 
     def get_timer(self, name: str) -> list[float]:
-        """Return all recorded durations for *name*."""
-        with self._lock:
-            return list(self._timers.get(name, []))
+        """Return the most recent durations for *name* (up to :data:`RECENT_TIMINGS`)."""
+        stamped = sorted(
+            item for shard in list(self._shards) for item in tuple(shard.recent.get(name, ()))
+        )
+        return [value for _, value in stamped[-RECENT_TIMINGS:]]
+
+    def get_histogram(self, name: str) -> LogHistogram | None:
+        """Return a merged copy of the latency histogram for *name*, if recorded."""
+        merged: LogHistogram | None = None
+        for shard in list(self._shards):
+            hist = shard.timers.get(name)
+            if hist is not None:
+                if merged is None:
+                    merged = LogHistogram(
+                        relative_error=hist.relative_error, min_value=hist.min_value
+                    )
+                merged.merge(hist)
+        return merged
 
     # -- gauges ---------------------------------------------------------------
 
     def set_gauge(self, name: str, value: float) -> None:
-        """Set a gauge to an absolute value."""
-        with self._lock:
-            self._gauges[name] = value
-        logger.debug("metrics.gauge %s = %.4f", name, value)
+        """Set a gauge to an absolute value (the latest write across threads wins)."""
+        self._shard().gauges[name] = (time.monotonic_ns(), value)
+        if self.log_updates:
+            logger.debug("metrics.gauge %s = %.4f", name, value)
 
     def get_gauge(self, name: str) -> float | None:
         """Return the current gauge value, or ``None`` if unset."""
-        with self._lock:
-            return self._gauges.get(name)
+        stamped = [s.gauges[name] for s in list(self._shards) if name in s.gauges]
+        return max(stamped)[1] if stamped else None
+
+    # -- merging ----------------------------------------------------------------
+
+    def _merged(self) -> _Shard:
+        out = _Shard()
+        for shard in list(self._shards):
+            for name, value in dict(shard.counters).items():
+                out.counters[name] = out.counters.get(name, 0) + value
+            for name, hist in dict(shard.timers).items():
+                if name not in out.timers:
+                    out.timers[name] = LogHistogram(
+                        relative_error=hist.relative_error, min_value=hist.min_value
+                    )
+                out.timers[name].merge(hist)
+            for name, stamped in dict(shard.gauges).items():
+                if name not in out.gauges or stamped > out.gauges[name]:
+                    out.gauges[name] = stamped
+        return out
+
+    def to_state(self) -> dict[str, Any]:
+        """Return all metrics in a JSON- and pickle-friendly mergeable form."""
+        merged = self._merged()
+        return {
+            "counters": merged.counters,
+            "timers": {name: hist.to_state() for name, hist in merged.timers.items()},
+            "gauges": {name: list(stamped) for name, stamped in merged.gauges.items()},
+        }
+
+    def merge_state(self, state: dict[str, Any]) -> None:
+        """Fold metrics produced by :meth:`to_state` (e.g. in a worker) into this one."""
+        shard = self._shard()
+        for name, value in state.get("counters", {}).items():
+            shard.counters[name] = shard.counters.get(name, 0) + value
+        for name, hist_state in state.get("timers", {}).items():
+            hist = LogHistogram.from_state(hist_state)
+            if name in shard.timers:
+                shard.timers[name].merge(hist)
+            else:
+                shard.timers[name] = hist
+                shard.recent[name] = deque(maxlen=RECENT_TIMINGS)
+        for name, (stamp, value) in state.get("gauges", {}).items():
+            if name not in shard.gauges or stamp > shard.gauges[name][0]:
+                shard.gauges[name] = (stamp, value)
 
     # -- snapshot -------------------------------------------------------------
 
     def snapshot(self) -> dict[str, Any]:
         """Return a JSON-serialisable snapshot of all metrics."""
-        with self._lock:
-            timers_summary: dict[str, dict[str, Any]] = {}
-            for name, values in self._timers.items():
-                timers_summary[name] = {
-                    "count": len(values),
-                    "total_seconds": round(sum(values), 6),
-                    "min_seconds": round(min(values), 6) if values else 0.0,
-                    "max_seconds": round(max(values), 6) if values else 0.0,
-                }
-            return {
-                "counters": dict(self._counters),
-                "timers": timers_summary,
-                "gauges": {k: round(v, 6) for k, v in self._gauges.items()},
-            }
+        merged = self._merged()
+        return {
+            "counters": merged.counters,
+            "timers": {
+                name: hist.to_dict(suffix="_seconds") for name, hist in merged.timers.items()
+            },
+            "gauges": {name: round(value, 6) for name, (_, value) in merged.gauges.items()},
+        }
 
     def reset(self) -> None:
         """Clear all metrics."""
         with self._lock:
-            self._counters.clear()
-            self._timers.clear()
-            self._gauges.clear()
+            for shard in self._shards:
+                shard.clear()
         logger.debug("metrics: all metrics reset")
 
 
@@ -146,12 +401,77 @@ class _TimerContext:
         return time.monotonic() - self._start
 
 
+@dataclass
+class TagStats:
+    """Streaming per-tag score statistics.
+
+    The mean and variance use Welford's online algorithm, so they are
+    updated in O(1) per case and stay numerically stable over long runs;
+    two accumulators combine exactly with :meth:`merge`.
+    """
+
+    cases: int = 0
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    score_sum: float = 0.0
+    mean: float = 0.0
+    # Sum of squared deviations from the running mean.
+    m2: float = 0.0
+
+    def add(self, score: float, *, skipped: bool = False) -> None:
+        """Fold one case score into the statistics."""
+        self.cases += 1
+        self.score_sum += score
+        delta = score - self.mean
+        self.mean += delta / self.cases
+        self.m2 += delta * (score - self.mean)
+        if skipped:
+            self.skipped += 1
+        elif score >= 1.0:
+            self.passed += 1
+        else:
+            self.failed += 1
+
+    def merge(self, other: TagStats) -> None:
+        """Combine *other*'s cases into these statistics (Chan et al.)."""
+        if not other.cases:
+            return
+        total = self.cases + other.cases
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.cases * other.cases / total
+        self.mean += delta * other.cases / total
+        self.cases = total
+        self.passed += other.passed
+        self.failed += other.failed
+        self.skipped += other.skipped
+        self.score_sum += other.score_sum
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of the scores (``0.0`` below two cases)."""
+        return self.m2 / (self.cases - 1) if self.cases > 1 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable summary."""
+        return {
+            "cases": self.cases,
+            "score": self.score_sum / self.cases if self.cases else 0.0,
+            "passed": self.passed,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "variance": self.variance,
+            "stddev": math.sqrt(self.variance),
+        }
+
+
 @dataclass
 class SuiteMetrics:
     """Aggregated metrics for a single suite execution.
 
     This is a convenience wrapper over ``MetricsCollector`` that exposes
-    domain-specific fields (pass/fail/skip counts, score, timing).
+    domain-specific fields (pass/fail/skip counts, score, timing) and
+    per-tag :class:`TagStats` accumulated in the same pass.
     """
 
     total_cases: int = 0
@@ -160,24 +480,44 @@ class SuiteMetrics:
     skipped: int = 0
     score_sum: float = 0.0
     execution_time_seconds: float = 0.0
-    case_times: list[float] = field(default_factory=list)
+    case_latency: LogHistogram = field(default_factory=LogHistogram)
+    by_tag: dict[str, TagStats] = field(default_factory=dict)
 
     @property
     def average_score(self) -> float:
         """Return average score across all cases."""
         return (self.score_sum / self.total_cases) if self.total_cases else 0.0
 
-    def record_case(self, *, score: float, elapsed: float = 0.0, skipped: bool = False) -> None:
-        """Record the result of a single test case."""
+    def record_case(
+        self,
+        *,
+        score: float,
+        elapsed: float = 0.0,
+        skipped: bool = False,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """Record the result of a single test case.
+
+        A tag listed more than once on a case counts once.
+        """
         self.total_cases += 1
         self.score_sum += score
-        self.case_times.append(elapsed)
+        self.case_latency.add(elapsed)
         if skipped:
             self.skipped += 1
         elif score >= 1.0:
             self.passed += 1
         else:
             self.failed += 1
+        for tag in set(tags):
+            stats = self.by_tag.get(tag)
+            if stats is None:
+                stats = self.by_tag[tag] = TagStats()
+            stats.add(score, skipped=skipped)
+
+    def tag_summary(self) -> dict[str, dict[str, Any]]:
+        """Per-tag statistics as plain dicts, sorted by tag."""
+        return {tag: self.by_tag[tag].to_dict() for tag in sorted(self.by_tag)}
 
     def to_dict(self) -> dict[str, Any]:
         """Return a JSON-serialisable summary."""
@@ -188,4 +528,6 @@ class SuiteMetrics:
             "skipped": self.skipped,
             "average_score": round(self.average_score, 6),
             "execution_time_seconds": round(self.execution_time_seconds, 4),
+            "case_latency": self.case_latency.to_dict(suffix="_seconds"),
+            "by_tag": self.tag_summary(),
         }
@@ -0,0 +1,249 @@
+"""Online scoring: score predictions while a model is still writing them.
+
+:func:`follow_predictions` yields ``(case_id, prediction)`` pairs from a
+predictions JSONL file as lines are appended to it (like ``tail -f``), or
+from a binary stream such as stdin, passing on complete lines only.
+:func:`run_online` feeds them through :func:`.arun_suite`, so each
+prediction is scored as soon as its line is written, and reports progress
+as summary snapshots at a fixed interval -- enough to stop a long
+generation job early once the running score is out of budget::
+
+    report = run_online(suite=suite, source=Path("preds.jsonl"), on_snapshot=print)
+
+Input ends once every suite case has a prediction, at end of stream, or
+when a file has not grown for *idle_timeout* seconds.  Cases still without a
+prediction are then scored against ``None`` and the usual
+:class:`.EvalReport` is returned.  A prediction is scored when it arrives,
+so a later line repeating an id is ignored (batch runs keep the last line).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Collection
+from contextlib import aclosing
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from .metrics import SuiteMetrics
+from .report import EvalReport
+from .runner import arun_suite
+from .suite import EvalSuite
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 0.2
+DEFAULT_SNAPSHOT_INTERVAL = 10.0
+DEFAULT_IDLE_TIMEOUT = 600.0
+_READ_SIZE = 1024 * 1024
+# Lines read ahead of scoring from a stream.
+_STREAM_BUFFER = 1024
+
+
+async def _file_lines(
+    path: Path, *, poll_interval: float, idle_timeout: float | None
+) -> AsyncGenerator[bytes, None]:
+    """Yield complete lines appended to *path*, waiting for it to be created."""
+    idle_since = time.monotonic()
+
+    def idle() -> bool:
+        return idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout
+
+    while not path.exists():
+        if idle():
+            raise FileNotFoundError(f"Predictions file not found: {path}")
+        await asyncio.sleep(poll_interval)
+    with path.open("rb") as f:
+        buffer = b""
+        while True:
+            chunk = f.read(_READ_SIZE)
+            if chunk:
+                idle_since = time.monotonic()
+                *lines, buffer = (buffer + chunk).split(b"\n")
+                for line in lines:
+                    yield line
+            elif idle():
+                logger.info("No new predictions for %.0fs; finishing", idle_timeout)
+                break
+            else:
+                await asyncio.sleep(poll_interval)
+    if buffer.strip():
+        yield buffer
+
+
+async def _stream_lines(stream: BinaryIO) -> AsyncGenerator[bytes, None]:
+    """Yield lines from a blocking binary stream read on a daemon thread."""
+    loop = asyncio.get_running_loop()
+    lines: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=_STREAM_BUFFER)
+
+    def pump() -> None:
+        # Blocks while the queue is full, so a fast writer is throttled.
+        try:
+            for line in iter(stream.readline, b""):
+                asyncio.run_coroutine_threadsafe(lines.put(line), loop).result()
+            asyncio.run_coroutine_threadsafe(lines.put(None), loop).result()
+        except RuntimeError:  # the loop closed: the run finished without us
+            return
+
+    threading.Thread(target=pump, name="toolkit-eval-online-reader", daemon=True).start()
+    while (line := await lines.get()) is not None:
+        yield line
+
+
+def _parse(line: bytes) -> tuple[str, Any] | None:
+    if not line.strip():
+        return None
+    obj = json.loads(line)
+    return str(obj["id"]), obj.get("prediction")
+
+
+async def follow_predictions(
+    source: Path | BinaryIO,
+    *,
+    case_ids: Collection[str] | None = None,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT,
+) -> AsyncIterator[tuple[str, Any]]:
+    """Yield ``(case_id, prediction)`` pairs as prediction lines are completed.
+
+    Malformed lines are logged and skipped rather than ending the run.
+
+    Args:
+        source: Predictions JSONL file to follow, or a binary stream (stdin).
+        case_ids: Stop once every one of these ids has been yielded.
+        poll_interval: Seconds between checks of a file for new data.
+        idle_timeout: Stop once a file has not grown (or, before it exists,
+            been created) for this many seconds; ``None`` waits forever.
+            Streams end at end of input.
+
+    Raises:
+        FileNotFoundError: If the file does not appear within *idle_timeout*.
+    """
+    remaining = set(case_ids) if case_ids is not None else None
+    if remaining is not None and not remaining:
+        return
+    if isinstance(source, Path):
+        lines = _file_lines(source, poll_interval=poll_interval, idle_timeout=idle_timeout)
+    else:
+        lines = _stream_lines(source)
+    async with aclosing(lines):
+        async for line in lines:
+            try:
+                pair = _parse(line)
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning("Skipping malformed prediction line: %r (%s)", line[:80], e)
+                continue
+            if pair is None:
+                continue
+            yield pair
+            if remaining is not None:
+                remaining.discard(pair[0])
+                if not remaining:
+                    logger.info("Every case has a prediction; finishing")
+                    return
+
+
+def _snapshot(progress: SuiteMetrics, total: int, elapsed: float) -> dict[str, Any]:
+    """Running summary; ``score_bounds`` brackets the final score."""
+    remaining = max(total - progress.total_cases, 0)
+    return {
+        "elapsed_seconds": round(elapsed, 3),
+        "cases_scored": progress.total_cases,
+        "cases_total": total,
+        "score": progress.average_score,
+        "score_bounds": [
+            progress.score_sum / total if total else 0.0,
+            (progress.score_sum + remaining) / total if total else 0.0,
+        ],
+        "passed": progress.passed,
+        "failed": progress.failed,
+        "cases_per_second": round(progress.total_cases / elapsed, 3) if elapsed > 0 else 0.0,
+        "by_tag": progress.tag_summary(),
+    }
+
+
+async def arun_online(
+    *,
+    suite: EvalSuite,
+    source: Path | BinaryIO,
+    snapshot_interval: float = DEFAULT_SNAPSHOT_INTERVAL,
+    on_snapshot: Callable[[dict[str, Any]], None] | None = None,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT,
+    case_sink: Callable[[dict[str, Any]], None] | None = None,
+    **options: Any,
+) -> EvalReport:
+    """Score *suite* against predictions as they are written to *source*.
+
+    Args:
+        suite: Suite to evaluate.
+        source: Predictions JSONL file to follow, or a binary stream.
+        snapshot_interval: Seconds between progress snapshots (``0`` disables
+            the periodic ones).
+        on_snapshot: Receives each snapshot dict, and a last one when input
+            ends.  ``score`` is the mean over scored cases; ``score_bounds``
+            is the final score if every remaining case scored 0 or 1.
+        poll_interval: See :func:`follow_predictions`.
+        idle_timeout: See :func:`follow_predictions`.
+        case_sink: Receives each case result as it is scored (completion
+            order); the returned report then has no ``cases``.
+        **options: Passed to :func:`.arun_suite` (``concurrency``,
+            ``batch_size``, ``score_cache``, ``collector``, ...).
+
+    Returns:
+        The report, with ``cases`` in suite order.
+    """
+    total = len(suite.cases)
+    progress = SuiteMetrics()
+    results: dict[str, dict[str, Any]] = {}
+    start = time.monotonic()
+
+    def sink(result: dict[str, Any]) -> None:
+        progress.record_case(score=result["score"], tags=result.get("tags") or ())
+        if case_sink is not None:
+            case_sink(result)
+        else:
+            results[result["id"]] = result
+
+    def emit() -> None:
+        if on_snapshot is not None:
+            on_snapshot(_snapshot(progress, total, time.monotonic() - start))
+
+    async def tick() -> None:
+        while True:
+            await asyncio.sleep(snapshot_interval)
+            emit()
+
+    ticker = (
+        asyncio.ensure_future(tick())
+        if on_snapshot is not None and snapshot_interval > 0
+        else None
+    )
+    predictions = follow_predictions(
+        source,
+        case_ids=[case.id for case in suite.cases],
+        poll_interval=poll_interval,
+        idle_timeout=idle_timeout,
+    )
+    try:
+        report = await arun_suite(suite=suite, predictions=predictions, case_sink=sink, **options)
+    finally:
+        if ticker is not None:
+            ticker.cancel()
+    emit()
+    if case_sink is not None:
+        return report
+    return EvalReport(
+        suite=report.suite,
+        summary=report.summary,
+        cases=[results[case.id] for case in suite.cases],
+    )
+
+
+def run_online(**kwargs: Any) -> EvalReport:
+    """Synchronous wrapper around :func:`arun_online` (same arguments)."""
+    return asyncio.run(arun_online(**kwargs))
@@ -0,0 +1,178 @@
+"""OpenMetrics / Prometheus exposition of :class:`.MetricsCollector` metrics.
+
+Counters, timers and gauges are rendered as text that Prometheus scrapes
+directly, either from a file for node_exporter's textfile collector
+(:func:`write_textfile`, written once a run finishes) or from a small HTTP
+endpoint served while a long run is in progress (:class:`MetricsServer`)::
+
+    with MetricsServer(collector, port=9464):
+        run_suite(..., collector=collector)
+
+Metric names are prefixed (``toolkit_eval_`` by default) and sanitised;
+timers become histograms in seconds with fixed ``le`` buckets derived from
+their :class:`.LogHistogram` sketches.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import re
+import threading
+from collections.abc import Sequence
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from .metrics import LogHistogram, MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_PREFIX = "toolkit_eval_"
+# Histogram bucket upper bounds in seconds.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)  # fmt: skip
+
+_INVALID = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def metric_name(name: str, prefix: str = DEFAULT_PREFIX) -> str:
+    """Return *name* as a valid metric name (``score_cache.hits`` -> ``..._score_cache_hits``)."""
+    out = _INVALID.sub("_", prefix + name)
+    return "_" + out if out[0].isdigit() else out
+
+
+def _num(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def render(
+    collector: MetricsCollector,
+    *,
+    openmetrics: bool = True,
+    prefix: str = DEFAULT_PREFIX,
+    buckets: Sequence[float] = DEFAULT_BUCKETS,
+) -> str:
+    """Render *collector*'s metrics in the text exposition format.
+
+    Args:
+        collector: Metrics to expose.
+        openmetrics: OpenMetrics 1.0 (``# EOF`` terminated, counter families
+            named without ``_total``) rather than the Prometheus 0.0.4 text
+            format read by node_exporter's textfile collector.
+        prefix: Prepended to every metric name.
+        buckets: Histogram bucket upper bounds for timers, in seconds.
+    """
+    state = collector.to_state()
+    lines: list[str] = []
+    for name in sorted(state["counters"]):
+        base = metric_name(name, prefix)
+        lines.append(f"# TYPE {base if openmetrics else base + '_total'} counter")
+        lines.append(f"{base}_total {state['counters'][name]}")
+    for name in sorted(state["timers"]):
+        base = metric_name(name, prefix) + "_seconds"
+        hist = LogHistogram.from_state(state["timers"][name])
+        lines.append(f"# TYPE {base} histogram")
+        for bound, count in zip(buckets, hist.cumulative_counts(buckets), strict=True):
+            lines.append(f'{base}_bucket{{le="{_num(bound)}"}} {count}')
+        lines.append(f'{base}_bucket{{le="+Inf"}} {hist.count}')
+        lines.append(f"{base}_sum {_num(hist.total)}")
+        lines.append(f"{base}_count {hist.count}")
+    for name in sorted(state["gauges"]):
+        base = metric_name(name, prefix)
+        lines.append(f"# TYPE {base} gauge")
+        lines.append(f"{base} {_num(state['gauges'][name][1])}")
+    if openmetrics:
+        lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(collector: MetricsCollector, path: Path, **kwargs: Any) -> None:
+    """Atomically write Prometheus text to *path* (a ``.prom`` file).
+
+    The file is written beside *path* and renamed into place so the textfile
+    collector never reads a partial file.  *kwargs* go to :func:`render`.
+    """
+    kwargs.setdefault("openmetrics", False)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(render(collector, **kwargs), encoding="utf-8")
+    os.replace(tmp, path)
+    logger.debug("Wrote metrics textfile %s", path)
+
+
+class MetricsServer:
+    """Serve ``GET /metrics`` for *collector* from a daemon thread.
+
+    Args:
+        collector: Metrics to expose; rendered fresh on every scrape.
+        host: Interface to bind (loopback by default).
+        port: TCP port; ``0`` picks a free one (see :attr:`port`).
+    """
+
+    def __init__(self, collector: MetricsCollector, *, host: str = "127.0.0.1", port: int = 0):
+        self.collector = collector
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        """The bound TCP port."""
+        return int(self._httpd.server_address[1])
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        collector = self.collector
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 -- http.server API
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+                body = render(collector, openmetrics=openmetrics).encode("utf-8")
+                self.send_response(200)
+                self.send_header(
+                    "Content-Type",
+                    OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE,
+                )
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug("metrics endpoint: " + format, *args)
+
+        return Handler
+
+    def start(self) -> MetricsServer:
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="toolkit-eval-metrics", daemon=True
+        )
+        self._thread.start()
+        logger.info("Serving metrics on http://%s:%d/metrics", *self._httpd.server_address[:2])
+        return self
+
+    def close(self) -> None:
+        """Stop serving and release the port."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> MetricsServer:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
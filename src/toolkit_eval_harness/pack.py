@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import hashlib
+import io
 import json
+import logging
 import time
 import zipfile
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import Any, cast
 
 from .hashing import sha256_file
-from .suite import EvalSuite, read_suite_dir
+from .suite import EvalSuite, iter_cases, open_suite_lazy, read_suite_dir, suite_from_parts
+from .suite_cache import SuiteCache, suite_cache_key
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -69,8 +77,6 @@ def verify_pack(*, pack_zip: Path) -> dict[str, object]:
             if isinstance(meta, dict):
                 expected = str(meta.get("sha256") or "")
             content = zf.read(fname)
-            import hashlib
-
             got = hashlib.sha256(content).hexdigest()
             if got != expected:
                 failures.append({"file": str(fname), "reason": "hash_mismatch"})
@@ -92,18 +98,69 @@ def extract_pack(*, pack_zip: Path, dest_dir: Path) -> Path:
     return dest_dir
 
 
-def load_suite_from_path(path: Path) -> EvalSuite:
+def read_suite_zip(pack_zip: Path) -> EvalSuite:
+    """Load a suite straight from a pack zip, without extracting it to disk.
+
+    ``suite.json`` is parsed from memory and ``cases.jsonl`` is streamed out of
+    its zip member line by line, so no temporary files are written and
+    concurrent readers of the same pack do not interfere.
+    """
+    with zipfile.ZipFile(pack_zip, "r") as zf:
+        names = set(zf.namelist())
+        for member in ("suite.json", "cases.jsonl"):
+            if member not in names:
+                raise ValueError(f"invalid_pack:missing_member:{member}")
+        meta = json.loads(zf.read("suite.json").decode("utf-8"))
+        with zf.open("cases.jsonl") as raw, io.TextIOWrapper(raw, encoding="utf-8") as f:
+            return suite_from_parts(meta, iter_cases(f))
+
+
+def suite_file_digests(path: Path) -> dict[str, str]:
+    """Return SHA-256 digests of ``suite.json`` and ``cases.jsonl`` for a dir or pack.
+
+    Directories reuse :func:`_manifest_for_suite_dir`; packs hash the zip
+    members as they are stored, so the result matches the pack manifest for an
+    untampered pack.
+    """
+    if path.is_dir():
+        files = cast("dict[str, dict[str, Any]]", _manifest_for_suite_dir(path)["files"])
+        return {name: str(meta["sha256"]) for name, meta in files.items()}
+    digests: dict[str, str] = {}
+    with zipfile.ZipFile(path, "r") as zf:
+        for member in ("suite.json", "cases.jsonl"):
+            h = hashlib.sha256()
+            try:
+                with zf.open(member) as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                        h.update(chunk)
+            except KeyError as e:
+                raise ValueError(f"invalid_pack:missing_member:{member}") from e
+            digests[member] = h.hexdigest()
+    return digests
+
+
+def load_suite_from_path(
+    path: Path, *, cache: SuiteCache | None = None, lazy: bool = False
+) -> EvalSuite:
+    """Load a suite from a directory or pack zip.
+
+    Args:
+        path: Suite directory (``suite.json`` + ``cases.jsonl``) or ``.zip`` pack.
+        cache: Optional parsed-suite cache, consulted by content digest.
+        lazy: Memory-map ``cases.jsonl`` and decode cases on access (see
+            :class:`~.suite.LazyCaseList`).  Only directories can be mapped;
+            packs fall back to an eager in-archive load.
+    """
+    if lazy and path.is_dir():
+        return open_suite_lazy(path)
+    if lazy:
+        logger.info("Lazy loading requires a suite directory; loading %s eagerly", path)
     if path.is_dir():
-        return read_suite_dir(path)
-    if path.suffix.lower() == ".zip":
-        tmp = Path(path.parent) / f".toolkit_eval_unpack_{path.stem}"
-        if tmp.exists():
-            for p in tmp.rglob("*"):
-                if p.is_file():
-                    p.unlink()
-            for p in sorted([x for x in tmp.rglob("*") if x.is_dir()], reverse=True):
-                p.rmdir()
-            tmp.rmdir()
-        extract_pack(pack_zip=path, dest_dir=tmp)
-        return read_suite_dir(tmp)
-    raise ValueError(f"unsupported_suite_path:{path}")
+        loader = partial(read_suite_dir, path)
+    elif path.suffix.lower() == ".zip":
+        loader = partial(read_suite_zip, path)
+    else:
+        raise ValueError(f"unsupported_suite_path:{path}")
+    if cache is None:
+        return loader()
+    return cache.get_or_load(suite_cache_key(suite_file_digests(path)), loader)
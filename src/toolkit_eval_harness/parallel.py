@@ -0,0 +1,112 @@
+"""Chunked, order-preserving parallel execution for suite scoring.
+
+``run_suite`` splits the case stream into fixed-size chunks and hands them to
+:func:`map_chunks`, which fans them out over a thread or process pool and
+yields the per-chunk results back *in submission order*.  The number of
+chunks in flight is bounded so that memory stays proportional to
+``workers * chunk_size`` rather than to the suite size.
+
+Executors:
+
+* ``"thread"`` -- best for I/O-bound scorers or scorers that release the GIL
+  (native extensions, subprocess calls, network requests).
+* ``"process"`` -- best for CPU-bound pure-Python plugin scorers.  The chunk
+  function and its arguments must be picklable, so plugin scorers have to be
+  module-level callables.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+EXECUTORS = ("thread", "process")
+DEFAULT_MAX_CHUNK_SIZE = 256
+
+
+def resolve_chunk_size(*, total: int, workers: int, chunk_size: int | None = None) -> int:
+    """Pick a chunk size giving each worker several chunks to balance load."""
+    if chunk_size is not None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        return chunk_size
+    per_worker = -(-total // max(1, workers * 4))
+    return max(1, min(DEFAULT_MAX_CHUNK_SIZE, per_worker))
+
+
+def iter_chunks(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yield successive lists of at most *size* items from *items*."""
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _make_executor(executor: str, workers: int) -> Executor:
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="toolkit-eval")
+    if executor == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    raise ValueError(
+        f"Unknown executor '{executor}'. Available executors: {', '.join(EXECUTORS)}."
+    )
+
+
+def map_chunks(
+    func: Callable[..., R],
+    chunks: Iterable[list[T]],
+    *,
+    workers: int,
+    executor: str = "thread",
+    args: tuple[Any, ...] = (),
+) -> Iterator[R]:
+    """Apply ``func(*args, chunk)`` to every chunk, yielding results in order.
+
+    With ``workers <= 1`` the chunks are processed inline with no pool.
+
+    Args:
+        func: Chunk function.  Must be picklable for the process executor.
+        chunks: Iterable of chunks (consumed lazily).
+        workers: Number of pool workers.
+        executor: ``"thread"`` or ``"process"``.
+        args: Leading positional arguments passed to every call.
+
+    Raises:
+        ValueError: If *executor* is unknown or *workers* is negative.
+    """
+    if workers < 0:
+        raise ValueError(f"workers must be >= 0, got {workers}")
+    if executor not in EXECUTORS:
+        raise ValueError(
+            f"Unknown executor '{executor}'. Available executors: {', '.join(EXECUTORS)}."
+        )
+    if workers <= 1:
+        for chunk in chunks:
+            yield func(*args, chunk)
+        return
+
+    logger.debug("Starting %s pool with %d workers", executor, workers)
+    max_in_flight = workers * 2
+    with _make_executor(executor, workers) as pool:
+        pending: deque[Future[R]] = deque()
+        try:
+            for chunk in chunks:
+                pending.append(pool.submit(func, *args, chunk))
+                if len(pending) >= max_in_flight:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for fut in pending:
+                fut.cancel()
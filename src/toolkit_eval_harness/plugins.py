@@ -24,17 +24,58 @@ Scorers can be registered in two ways:
 
 Both approaches populate the same global registry which ``run_suite`` consults
 when a case's scoring method is not one of the built-in scorers.
+
+**Batch scorers** receive whole batches of cases at once, so they can amortise
+setup, vectorise, or batch calls to a model.  Opt in with ``batch=True`` or by
+marking the callable (which also works for entry points)::
+
+    @batch_scorer
+    def similarity(*, expected, predicted, **kwargs):
+        sims = model.similarity(expected, predicted)  # one call per batch
+        return [(float(s), {"similarity": float(s)}) for s in sims]
+
+A batch scorer returns one ``(score, metadata)`` pair per input, in order.
+
+**Async scorers** are coroutine functions (``async def``), detected when
+they are registered or loaded.  :func:`.arun_suite` awaits them on its event
+loop, so scorers that call remote models overlap with each other and with
+prediction generation; :func:`.run_suite` runs each call to completion with
+:func:`asyncio.run` (or, when called from a thread already running an event
+loop, on a helper loop thread).  Async scorers can also be batch scorers.
+
+Entry points are discovered by name only: a plugin's module is imported the
+first time that scorer is requested, so unused plugins (and their heavy
+dependencies) are never loaded.  The discovered ``name -> "module:attr"``
+map is cached on disk (see :data:`ENTRY_POINT_CACHE_ENV`), keyed by a
+fingerprint of the installed distributions, so scanning them is skipped
+until a package is installed, upgraded or removed.
 """
 
 from __future__ import annotations
 
+import hashlib
+import importlib
+import inspect
+import json
 import logging
-from importlib.metadata import entry_points
-from typing import Any, Protocol
+import os
+import re
+import sys
+import threading
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Protocol, TypeVar
 
 logger = logging.getLogger(__name__)
 
 ENTRY_POINT_GROUP = "toolkit_eval_harness.scorers"
+BATCH_FLAG = "batch"
+# Path of the discovered entry-point cache file; an empty value disables it.
+ENTRY_POINT_CACHE_ENV = "TOOLKIT_EVAL_ENTRY_POINT_CACHE"
+_CACHE_FORMAT = 1
+
+# ``module[:attr[.attr...]] [extras]``, as in importlib.metadata.EntryPoint.
+_TARGET = re.compile(r"(?P<module>[\w.]+)\s*(:\s*(?P<attr>[\w.]+)\s*)?((?P<extras>\[.*\])\s*)?$")
 
 
 class ScorerFunc(Protocol):
@@ -49,20 +90,100 @@ class ScorerFunc(Protocol):
     ) -> tuple[float, dict[str, Any]]: ...
 
 
+class BatchScorerFunc(Protocol):
+    """Protocol for batch scorers: one call scores many cases."""
+
+    def __call__(
+        self,
+        *,
+        expected: Sequence[Any],
+        predicted: Sequence[Any],
+        **kwargs: Any,
+    ) -> Sequence[tuple[float, dict[str, Any]]]: ...
+
+
+_F = TypeVar("_F")
+
+
+def _is_coroutine_function(func: Any) -> bool:
+    if inspect.iscoroutinefunction(func):
+        return True
+    # A callable object whose class defines ``async def __call__``.
+    return not inspect.isroutine(func) and inspect.iscoroutinefunction(type(func).__call__)
+
+
+# (pid, loop) of an event loop on a daemon thread, for async scorers called
+# from a thread that is already running a loop, which asyncio.run refuses.
+_helper_loop: tuple[int, Any] | None = None
+_helper_lock = threading.Lock()
+
+
+def _run_on_helper_loop(coro: Any) -> Any:
+    global _helper_loop
+    import asyncio
+
+    with _helper_lock:
+        if _helper_loop is None or _helper_loop[0] != os.getpid():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="toolkit-eval-scorer-loop", daemon=True
+            ).start()
+            _helper_loop = (os.getpid(), loop)
+        loop = _helper_loop[1]
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+def call_scorer(func: Any, **kwargs: Any) -> Any:
+    """Call a scorer, running an async scorer's coroutine to completion.
+
+    Inside a running event loop (``run_suite`` called from a coroutine or a
+    notebook) the coroutine runs on a helper loop thread while the caller
+    blocks; :func:`.arun_suite` awaits it on the caller's loop instead.
+    """
+    result = func(**kwargs)
+    if not inspect.isawaitable(result):
+        return result
+    import asyncio
+
+    async def _await() -> Any:
+        return await result
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_await())
+    return _run_on_helper_loop(_await())
+
+
+def batch_scorer(func: _F) -> _F:
+    """Mark *func* as a batch scorer (sets the ``batch`` capability flag)."""
+    setattr(func, BATCH_FLAG, True)
+    return func
+
+
 # ---------------------------------------------------------------------------
 # Global registry
 # ---------------------------------------------------------------------------
 
-_registry: dict[str, ScorerFunc] = {}
+_registry: dict[str, ScorerFunc | BatchScorerFunc] = {}
+_batch_scorers: set[str] = set()
+_async_scorers: set[str] = set()
+# Entry-point scorers discovered but not yet loaded: name -> "module:attr".
+_discovered: dict[str, str] = {}
 _entry_points_loaded = False
 
 
-def register_scorer(name: str, func: ScorerFunc) -> None:
+def register_scorer(
+    name: str, func: ScorerFunc | BatchScorerFunc, *, batch: bool | None = None
+) -> None:
     """Register a scorer function under *name*.
 
     Args:
         name: Unique scorer name (e.g. ``"bleu"``).
-        func: Callable with signature ``(*, expected, predicted, **kw) -> (float, dict)``.
+        func: Callable with signature ``(*, expected, predicted, **kw) -> (float, dict)``,
+            or for batch scorers ``(*, expected: list, predicted: list, **kw) -> list``.
+        batch: Whether *func* is a :class:`BatchScorerFunc`.  Defaults to the
+            callable's ``batch`` flag (see :func:`batch_scorer`).
 
     Raises:
         ValueError: If *name* is already registered.
@@ -80,6 +201,11 @@ def register_scorer(name: str, func: ScorerFunc) -> None:
             "Use a unique name or call unregister_scorer() first."
         )
     _registry[name] = func
+    is_batch = bool(getattr(func, BATCH_FLAG, False)) if batch is None else batch
+    if is_batch:
+        _batch_scorers.add(name)
+    if _is_coroutine_function(func):
+        _async_scorers.add(name)
     logger.debug("Registered scorer: %s", name)
 
 
@@ -92,19 +218,23 @@ def unregister_scorer(name: str) -> None:
     Raises:
         KeyError: If *name* is not registered.
     """
-    if name not in _registry:
+    _discover_entry_points()
+    if name not in _registry and name not in _discovered:
         raise KeyError(
             f"Scorer '{name}' is not registered. "
             f"Available scorers: {', '.join(sorted(_registry)) or '(none)'}."
         )
-    del _registry[name]
+    _registry.pop(name, None)
+    _discovered.pop(name, None)
+    _batch_scorers.discard(name)
+    _async_scorers.discard(name)
     logger.debug("Unregistered scorer: %s", name)
 
 
-def get_scorer(name: str) -> ScorerFunc:
+def get_scorer(name: str) -> ScorerFunc | BatchScorerFunc:
     """Return the scorer registered under *name*.
 
-    Loads entry-point scorers on first call.
+    An entry-point scorer's module is imported on its first lookup.
 
     Args:
         name: Scorer name to look up.
@@ -113,11 +243,13 @@ def get_scorer(name: str) -> ScorerFunc:
         The scorer callable.
 
     Raises:
-        KeyError: If *name* is not found in the registry or entry points.
+        KeyError: If *name* is not found in the registry or entry points, or
+            its entry point fails to load.
     """
-    _load_entry_points()
     if name not in _registry:
-        available = ", ".join(sorted(_registry)) or "(none)"
+        _load_entry_point(name)
+    if name not in _registry:
+        available = ", ".join(list_scorers()) or "(none)"
         raise KeyError(
             f"Scorer '{name}' not found. "
             f"Available scorers: {available}. "
@@ -127,40 +259,162 @@ def get_scorer(name: str) -> ScorerFunc:
     return _registry[name]
 
 
+def is_batch_scorer(name: str) -> bool:
+    """Return whether the scorer registered under *name* is a batch scorer."""
+    if name not in _registry:
+        _load_entry_point(name)
+    return name in _batch_scorers
+
+
+def is_async_scorer(name: str) -> bool:
+    """Return whether the scorer registered under *name* is a coroutine function."""
+    if name not in _registry:
+        _load_entry_point(name)
+    return name in _async_scorers
+
+
 def list_scorers() -> list[str]:
     """Return sorted list of all registered scorer names.
 
-    Loads entry-point scorers on first call.
+    Includes entry-point scorers (discovered on first call) without loading them.
     """
-    _load_entry_points()
-    return sorted(_registry)
+    _discover_entry_points()
+    return sorted({*_registry, *_discovered})
+
+
+# ---------------------------------------------------------------------------
+# Entry-point discovery
+# ---------------------------------------------------------------------------
+
+
+def _default_cache_path() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "toolkit-eval" / "scorer-entry-points.json"
+
+
+def _cache_path() -> Path | None:
+    value = os.environ.get(ENTRY_POINT_CACHE_ENV)
+    if value is None:
+        return _default_cache_path()
+    return Path(value) if value else None
+
 
+def _environment_fingerprint() -> str:
+    """Hash of the installed distributions visible on ``sys.path``.
 
-def _load_entry_points() -> None:
-    """Discover and register scorers from installed entry points (once)."""
+    Built from each ``*.dist-info`` / ``*.egg-info`` entry's name and mtime
+    (install, upgrade and uninstall all replace these), without importing
+    :mod:`importlib.metadata`.
+    """
+    digest = hashlib.sha256(f"{_CACHE_FORMAT}\0{sys.executable}".encode())
+    for entry in sys.path:
+        digest.update(f"\0{entry}".encode())
+        try:
+            with os.scandir(entry or ".") as it:
+                dists = sorted(
+                    (d.name, d.stat().st_mtime_ns)
+                    for d in it
+                    if d.name.endswith((".dist-info", ".egg-info"))
+                )
+        except OSError:  # missing directory, or a zip / egg file
+            continue
+        for name, mtime in dists:
+            digest.update(f"\0{name}\0{mtime}".encode())
+    return digest.hexdigest()
+
+
+def _scan_entry_points() -> dict[str, str]:
+    """Return ``{name: "module:attr"}`` for the scorer entry points (first one wins)."""
+    from importlib.metadata import entry_points
+
+    found: dict[str, str] = {}
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        found.setdefault(ep.name, ep.value)
+    return found
+
+
+def _read_cache(path: Path, fingerprint: str) -> dict[str, str] | None:
+    try:
+        obj = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(obj, dict) or obj.get("fingerprint") != fingerprint:
+        return None
+    scorers = obj.get("scorers")
+    if not isinstance(scorers, dict):
+        return None
+    return {str(k): str(v) for k, v in scorers.items()}
+
+
+def _write_cache(path: Path, fingerprint: str, scorers: dict[str, str]) -> None:
+    payload = {"format": _CACHE_FORMAT, "fingerprint": fingerprint, "scorers": scorers}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug("Could not write entry-point cache %s: %s", path, e)
+
+
+def _discover_entry_points() -> None:
+    """Find entry-point scorer names and targets, without importing them (once)."""
     global _entry_points_loaded
     if _entry_points_loaded:
         return
     _entry_points_loaded = True
-
+    path = _cache_path()
+    if path is None:
+        _discovered.update(_scan_entry_points())
+        return
+    fingerprint = _environment_fingerprint()
+    cached = _read_cache(path, fingerprint)
+    if cached is not None:
+        logger.debug("Entry-point scorers from cache %s: %s", path, sorted(cached))
+        _discovered.update(cached)
+        return
+    scanned = _scan_entry_points()
+    _write_cache(path, fingerprint, scanned)
+    _discovered.update(scanned)
+
+
+def _load_target(target: str) -> Any:
+    """Import ``module:attr.attr`` the way ``EntryPoint.load()`` does."""
+    match = _TARGET.match(target)
+    if match is None:
+        raise ValueError(f"invalid_entry_point:{target}")
+    obj = importlib.import_module(match.group("module"))
+    for attr in (match.group("attr") or "").split("."):
+        if attr:
+            obj = getattr(obj, attr)
+    return obj
+
+
+def _load_entry_point(name: str) -> None:
+    """Import and register the entry-point scorer *name*, if one was discovered."""
+    _discover_entry_points()
+    target = _discovered.get(name)
+    if target is None or name in _registry:
+        return
     try:
-        eps = entry_points(group=ENTRY_POINT_GROUP)
-    except TypeError:
-        # Python 3.9 compat (unlikely given >=3.10 requirement, but safe)
-        eps = entry_points().get(ENTRY_POINT_GROUP, [])  # type: ignore[assignment,call-overload]
-
-    for ep in eps:
-        try:
-            func = ep.load()
-            if ep.name not in _registry:
-                _registry[ep.name] = func
-                logger.info("Loaded scorer plugin: %s (from %s)", ep.name, ep.value)
-        except Exception:
-            logger.warning("Failed to load scorer plugin: %s", ep.name, exc_info=True)
+        func = _load_target(target)
+    except Exception:
+        logger.warning("Failed to load scorer plugin: %s", name, exc_info=True)
+        del _discovered[name]
+        return
+    _registry[name] = func
+    if getattr(func, BATCH_FLAG, False):
+        _batch_scorers.add(name)
+    if _is_coroutine_function(func):
+        _async_scorers.add(name)
+    logger.info("Loaded scorer plugin: %s (from %s)", name, target)
 
 
 def _reset_registry() -> None:
     """Clear registry and reset entry-point flag. For testing only."""
     global _entry_points_loaded
     _registry.clear()
+    _batch_scorers.clear()
+    _async_scorers.clear()
+    _discovered.clear()
     _entry_points_loaded = False
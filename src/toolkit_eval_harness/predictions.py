@@ -0,0 +1,136 @@
+"""Predictions JSONL readers.
+
+Two access patterns are supported:
+
+* :func:`read_predictions` -- load every prediction into a ``dict`` keyed by
+  case id.  Simple and fast for files that fit comfortably in memory.
+* :func:`join_predictions` -- stream ``(case, prediction)`` pairs without
+  materialising the file.  When both the cases and the predictions are sorted
+  by id the join is a single merge pass; otherwise an on-disk id -> byte
+  offset index (:class:`~.diskindex.DiskIndex`) is built and each prediction
+  is read back with a seek.
+
+In every mode, duplicate prediction ids resolve to the *last* line and
+predictions for unknown ids are ignored.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+from .diskindex import DiskIndex
+from .io import jsonl_line_id
+from .suite import EvalCase
+
+logger = logging.getLogger(__name__)
+
+
+def iter_prediction_lines(path: Path) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(byte_offset, line)`` for every non-blank line, one line at a time."""
+    offset = 0
+    with path.open("rb") as f:
+        for line in f:
+            if line.strip():
+                yield offset, line
+            offset += len(line)
+
+
+def iter_predictions(path: Path) -> Iterator[tuple[str, Any]]:
+    """Yield ``(id, prediction)`` pairs in file order without buffering the file."""
+    for _, line in iter_prediction_lines(path):
+        obj = json.loads(line)
+        yield str(obj["id"]), obj.get("prediction")
+
+
+def read_predictions(path: Path) -> dict[str, Any]:
+    """Load all predictions into memory, keyed by id (last duplicate wins)."""
+    preds: dict[str, Any] = dict(iter_predictions(path))
+    logger.debug("Loaded %d predictions from %s", len(preds), path)
+    return preds
+
+
+def _is_sorted(ids: Iterable[str]) -> bool:
+    prev: str | None = None
+    for cid in ids:
+        if prev is not None and cid < prev:
+            return False
+        prev = cid
+    return True
+
+
+def _last_of_runs(pairs: Iterator[tuple[str, Any]]) -> Iterator[tuple[str, Any]]:
+    """Collapse consecutive equal ids in a sorted stream, keeping the last value."""
+    pending: tuple[str, Any] | None = None
+    for pair in pairs:
+        if pending is not None and pair[0] != pending[0]:
+            yield pending
+        pending = pair
+    if pending is not None:
+        yield pending
+
+
+def _merge_join(
+    cases: Sequence[EvalCase], path: Path
+) -> Iterator[tuple[EvalCase, Any]]:
+    preds = _last_of_runs(iter_predictions(path))
+    current = next(preds, None)
+    for case in cases:
+        while current is not None and current[0] < case.id:
+            current = next(preds, None)
+        if current is not None and current[0] == case.id:
+            yield case, current[1]
+        else:
+            yield case, None
+
+
+def _index_join(
+    cases: Sequence[EvalCase], path: Path
+) -> Iterator[tuple[EvalCase, Any]]:
+    with DiskIndex() as index, path.open("rb") as f:
+        count = index.put_many(
+            (jsonl_line_id(line), offset) for offset, line in iter_prediction_lines(path)
+        )
+        logger.debug("Indexed %d prediction lines from %s on disk", count, path)
+        for case in cases:
+            offset = index.get(case.id)
+            if offset is None:
+                yield case, None
+                continue
+            f.seek(offset)
+            yield case, json.loads(f.readline()).get("prediction")
+
+
+def join_predictions(
+    cases: Sequence[EvalCase], path: Path
+) -> Iterator[tuple[EvalCase, Any]]:
+    """Stream ``(case, prediction)`` pairs in case order with bounded memory.
+
+    A cheap pre-pass reads only the id of every prediction line to decide
+    between a sort-merge join and an on-disk index join.
+
+    Args:
+        cases: Suite cases, in the order results should be produced.
+        path: Predictions JSONL file.
+
+    Yields:
+        One ``(case, prediction)`` pair per case; missing predictions are ``None``.
+
+    Raises:
+        FileNotFoundError: If *path* does not exist.
+        KeyError: If a prediction line has no ``id`` field.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Predictions file not found: {path}")
+    cases_sorted = _is_sorted(case.id for case in cases)
+    preds_sorted = cases_sorted and _is_sorted(
+        jsonl_line_id(line) for _, line in iter_prediction_lines(path)
+    )
+    if cases_sorted and preds_sorted:
+        logger.debug("Predictions and cases sorted by id; using merge join")
+        return _merge_join(cases, path)
+    logger.debug("Predictions or cases unsorted; using on-disk index join")
+    return _index_join(cases, path)
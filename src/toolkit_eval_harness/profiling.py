@@ -0,0 +1,135 @@
+"""Phase and per-scorer profiling for evaluation runs (``run --profile``).
+
+A :class:`RunProfiler` times the phases of a run -- loading the suite and
+predictions, scoring, serializing and writing the report -- as
+``phase.<name>`` timers in a :class:`.MetricsCollector`.  The runner adds
+``phase.load_predictions`` and ``phase.score`` itself, along with a
+``scorer.<name>`` timer around every plugin scorer call, so each plugin's
+cumulative time is attributed individually, including calls made in pool
+workers and sandbox processes::
+
+    profiler = RunProfiler(collector, cprofile=True)
+    with profiler:
+        with profiler.span("load_suite"):
+            suite = load_suite_from_path(path)
+        report = run_suite(..., collector=collector)
+    profiler.write(Path("report.json"))
+
+:meth:`RunProfiler.write` saves the breakdown as ``<report>.profile.json``
+and, when cProfile is enabled, the raw ``<report>.pstats`` (readable with
+:mod:`pstats`, snakeviz or ``flameprof``) beside it.  cProfile only sees
+the thread that started it, so profile with ``--workers 1`` to include
+scorer internals in the pstats file; the phase and scorer timers are
+complete either way.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import json
+import logging
+import time
+from contextlib import AbstractContextManager
+from pathlib import Path
+from typing import Any
+
+from .metrics import LogHistogram, MetricsCollector
+from .runner import PHASE_TIMER_PREFIX, SCORER_TIMER_PREFIX
+
+logger = logging.getLogger(__name__)
+
+# Phases in the order a run goes through them; other phases sort after.
+PHASES = ("load_suite", "select_cases", "load_predictions", "score", "serialize", "write")
+
+
+def _timing(hist: LogHistogram, total: float) -> dict[str, Any]:
+    return {
+        "seconds": round(hist.total, 6),
+        "calls": hist.count,
+        "pct": round(100.0 * hist.total / total, 2) if total > 0 else 0.0,
+    }
+
+
+class RunProfiler:
+    """Times run phases and optionally runs cProfile over the whole run.
+
+    Args:
+        collector: Receives the ``phase.<name>`` timers; pass the same
+            collector to :func:`.run_suite` to pick up its phase and
+            per-scorer timers.
+        cprofile: Also run :mod:`cProfile` while the profiler is active.
+    """
+
+    def __init__(self, collector: MetricsCollector, *, cprofile: bool = False) -> None:
+        self.collector = collector
+        self._cprofile = cProfile.Profile() if cprofile else None
+        self._start = 0.0
+        self._elapsed = 0.0
+
+    def span(self, phase: str) -> AbstractContextManager[Any]:
+        """Return a context manager timing *phase* (may be entered repeatedly)."""
+        return self.collector.timer(f"{PHASE_TIMER_PREFIX}{phase}")
+
+    def __enter__(self) -> RunProfiler:
+        self._start = time.monotonic()
+        if self._cprofile is not None:
+            self._cprofile.enable()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        self._elapsed += time.monotonic() - self._start
+
+    def breakdown(self) -> dict[str, Any]:
+        """Return wall time per phase and per plugin scorer.
+
+        ``pct`` is the share of the profiled wall time for phases and the
+        share of the ``score`` phase for scorers (scorer time summed across
+        workers, so shares can exceed 100 with ``--workers`` > 1).
+        """
+        timers = {
+            name: LogHistogram.from_state(state)
+            for name, state in self.collector.to_state()["timers"].items()
+        }
+        phases = {
+            name[len(PHASE_TIMER_PREFIX):]: hist
+            for name, hist in timers.items()
+            if name.startswith(PHASE_TIMER_PREFIX)
+        }
+        order = {name: i for i, name in enumerate(PHASES)}
+        total = self._elapsed
+        score = phases["score"].total if "score" in phases else 0.0
+        accounted = sum(hist.total for hist in phases.values())
+        return {
+            "total_seconds": round(total, 6),
+            "phases": {
+                name: _timing(phases[name], total)
+                for name in sorted(phases, key=lambda n: (order.get(n, len(order)), n))
+            },
+            "scorers": {
+                name[len(SCORER_TIMER_PREFIX):]: _timing(hist, score)
+                for name, hist in sorted(timers.items())
+                if name.startswith(SCORER_TIMER_PREFIX)
+            },
+            "unaccounted_seconds": round(max(0.0, total - accounted), 6),
+        }
+
+    def write(self, report_path: Path) -> list[Path]:
+        """Write the breakdown (and pstats, if enabled) beside *report_path*.
+
+        Returns:
+            The paths written.
+        """
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        breakdown_path = report_path.with_name(report_path.name + ".profile.json")
+        breakdown_path.write_text(
+            json.dumps(self.breakdown(), indent=2) + "\n", encoding="utf-8"
+        )
+        written = [breakdown_path]
+        if self._cprofile is not None:
+            stats_path = report_path.with_name(report_path.name + ".pstats")
+            self._cprofile.dump_stats(str(stats_path))
+            written.append(stats_path)
+        logger.info("Wrote profile: %s", ", ".join(str(p) for p in written))
+        return written
@@ -1,28 +1,262 @@
+"""Eval reports: the in-memory model plus JSON and streaming JSONL formats.
+
+A JSON report is one object ``{"suite", "summary", "cases", ...}``.  For very
+large runs the JSONL format avoids holding every case result in memory: it is
+written incrementally by :class:`JsonlReportWriter` as one record per line::
+
+    {"record": "header", "format": "toolkit_eval_report.jsonl", "version": 1, "suite": {...}}
+    {"record": "case", "case": {...}}
+    ...
+    {"record": "summary", "summary": {...}, "metadata": {...}}
+
+:meth:`EvalReport.load` reads either format; for JSONL only the header and
+trailer are parsed up front and :meth:`EvalReport.iter_cases` streams the
+case records from disk.
+"""
+
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import os
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
+
+from .columnar import ColumnarCases
+from .io import validate_path_for_read
+
+JSONL_FORMAT = "toolkit_eval_report.jsonl"
+JSONL_VERSION = 1
 
 
 @dataclass(frozen=True)
 class EvalReport:
     suite: dict[str, Any]
     summary: dict[str, Any]
-    cases: list[dict[str, Any]]
+    cases: Sequence[dict[str, Any]] = ()
+    metadata: dict[str, Any] = field(default_factory=dict)
+    # Streamed JSONL report whose case records are read on demand.
+    cases_path: Path | None = None
+
+    def columnar(self) -> ColumnarCases:
+        """Return the case results as a :class:`.ColumnarCases` store."""
+        if isinstance(self.cases, ColumnarCases):
+            return self.cases
+        return ColumnarCases(self.iter_cases())
+
+    def iter_cases(self) -> Iterator[dict[str, Any]]:
+        """Yield case results, streaming them from ``cases_path`` when set."""
+        if self.cases_path is not None:
+            yield from iter_report_cases(self.cases_path)
+        else:
+            yield from self.cases
 
     def to_dict(self) -> dict[str, Any]:
-        return {"suite": self.suite, "summary": self.summary, "cases": self.cases}
+        """Return the JSON report object (materialises streamed or columnar cases)."""
+        out: dict[str, Any] = {
+            "suite": self.suite,
+            "summary": self.summary,
+            "cases": (
+                self.cases if isinstance(self.cases, list) else list(self.iter_cases())
+            ),
+        }
+        if self.metadata:
+            out["metadata"] = self.metadata
+        return out
 
     @staticmethod
-    def from_dict(obj: dict[str, Any]) -> EvalReport:
+    def from_dict(obj: dict[str, Any], *, columnar: bool = False) -> EvalReport:
+        cases = obj.get("cases") or []
         return EvalReport(
             suite=dict(obj.get("suite") or {}),
             summary=dict(obj.get("summary") or {}),
-            cases=list(obj.get("cases") or []),
+            cases=ColumnarCases(cases) if columnar else list(cases),
+            metadata=dict(obj.get("metadata") or {}),
         )
 
+    @staticmethod
+    def load(path: Path, *, columnar: bool = False) -> EvalReport:
+        """Load a JSON or JSONL report; JSONL case records stay on disk.
+
+        Args:
+            path: Report file.
+            columnar: Hold a JSON report's cases as :class:`.ColumnarCases`.
+                Streamed JSONL cases are never loaded into memory.
+
+        Raises:
+            FileNotFoundError: If *path* does not exist.
+            ValueError: If *path* is not a file, the file is not valid JSON or
+                a JSONL report lacks its header or summary trailer.
+            PermissionError: If the file is not readable.
+        """
+        path = validate_path_for_read(path)
+        if is_jsonl_report(path):
+            header, trailer = read_jsonl_report_envelope(path)
+            return EvalReport(
+                suite=dict(header.get("suite") or {}),
+                summary=dict(trailer.get("summary") or {}),
+                metadata=dict(trailer.get("metadata") or {}),
+                cases_path=path,
+            )
+        with path.open("r", encoding="utf-8") as f:
+            obj = json.load(f)
+        if not isinstance(obj, dict):
+            raise ValueError(f"invalid_report:not_an_object:{path}")
+        return EvalReport.from_dict(obj, columnar=columnar)
+
+
+def add_run_info(
+    report: dict[str, Any], *, elapsed: float, pass_count: int | None = None
+) -> dict[str, Any]:
+    """Add the timing, pass/fail counts and tool metadata ``toolkit-eval run`` reports.
+
+    Args:
+        report: A report object from :meth:`EvalReport.to_dict`, updated in place.
+        elapsed: Wall time of the run in seconds.
+        pass_count: Cases scoring 1.0; counted from ``report["cases"]`` when
+            ``None`` (pass it for streamed reports, whose cases are not held).
+
+    Returns:
+        *report*.
+    """
+    import platform
+
+    from . import __version__
+
+    summary = report["summary"]
+    if pass_count is None:
+        pass_count = sum(1 for c in report.get("cases", []) if c.get("score", 0) >= 1.0)
+    summary["execution_time_seconds"] = round(elapsed, 4)
+    summary["pass_count"] = pass_count
+    summary["fail_count"] = summary.get("cases", 0) - pass_count
+    report["metadata"] = {
+        "tool_version": __version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+    }
+    return report
+
 
 def write_report_json(report: EvalReport, path: Path) -> None:
     path.write_text(json.dumps(report.to_dict(), indent=2, sort_keys=True), encoding="utf-8")
+
+
+def _dumps(record: dict[str, Any]) -> str:
+    return json.dumps(record, sort_keys=True) + "\n"
+
+
+class JsonlReportWriter:
+    """Incrementally write a JSONL report.
+
+    Records go to ``<path>.tmp``, which is renamed over *path* only once the
+    summary trailer is written, so an interrupted run never leaves a
+    truncated report behind.
+
+    Args:
+        path: Destination report path.
+        suite: Suite description for the header record.
+    """
+
+    def __init__(self, path: Path, *, suite: dict[str, Any]) -> None:
+        self.path = path
+        self.cases = 0
+        self._tmp = path.with_name(path.name + ".tmp")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh: IO[str] = self._tmp.open("w", encoding="utf-8")
+        header = {"record": "header", "format": JSONL_FORMAT, "version": JSONL_VERSION}
+        self._fh.write(_dumps({**header, "suite": suite}))
+
+    def write_case(self, case: dict[str, Any]) -> None:
+        """Append one case result."""
+        self._fh.write(_dumps({"record": "case", "case": case}))
+        self.cases += 1
+
+    def finish(self, summary: dict[str, Any], metadata: dict[str, Any] | None = None) -> None:
+        """Write the summary trailer and move the report into place."""
+        trailer: dict[str, Any] = {"record": "summary", "summary": summary}
+        if metadata:
+            trailer["metadata"] = metadata
+        self._fh.write(_dumps(trailer))
+        self._fh.close()
+        os.replace(self._tmp, self.path)
+
+    def abort(self) -> None:
+        """Discard the partial report."""
+        if not self._fh.closed:
+            self._fh.close()
+            self._tmp.unlink(missing_ok=True)
+
+    def __enter__(self) -> JsonlReportWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.abort()
+
+
+def write_report_jsonl(report: EvalReport, path: Path) -> None:
+    """Write *report* in the streaming JSONL format."""
+    with JsonlReportWriter(path, suite=report.suite) as writer:
+        for case in report.iter_cases():
+            writer.write_case(case)
+        writer.finish(report.summary, report.metadata)
+
+
+def is_jsonl_report(path: Path) -> bool:
+    """Return whether *path* starts with a JSONL report header record."""
+    with path.open("rb") as f:
+        first = f.readline(1 << 20)
+    try:
+        obj = json.loads(first)
+    except ValueError:
+        return False
+    return (
+        isinstance(obj, dict)
+        and obj.get("record") == "header"
+        and obj.get("format") == JSONL_FORMAT
+    )
+
+
+def _last_line(f: IO[bytes]) -> bytes:
+    """Return the last non-empty line of a binary file, reading backwards."""
+    end = f.seek(0, os.SEEK_END)
+    pos, tail = end, b""
+    while pos > 0:
+        step = min(64 * 1024, pos)
+        pos -= step
+        f.seek(pos)
+        tail = f.read(step) + tail
+        stripped = tail.rstrip(b"\r\n")
+        nl = stripped.rfind(b"\n")
+        if nl >= 0:
+            return stripped[nl + 1 :]
+    return tail.rstrip(b"\r\n")
+
+
+def read_jsonl_report_envelope(path: Path) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return the header and summary trailer records of a JSONL report.
+
+    Raises:
+        ValueError: If the header or trailer is missing or malformed.
+    """
+    with path.open("rb") as f:
+        header = json.loads(f.readline())
+        trailer = json.loads(_last_line(f))
+    if not isinstance(header, dict) or header.get("record") != "header":
+        raise ValueError(f"invalid_report:missing_header:{path}")
+    if header.get("version") != JSONL_VERSION:
+        raise ValueError(f"invalid_report:unsupported_version:{header.get('version')}")
+    if not isinstance(trailer, dict) or trailer.get("record") != "summary":
+        raise ValueError(f"invalid_report:missing_summary:{path}")
+    return header, trailer
+
+
+def iter_report_cases(path: Path) -> Iterator[dict[str, Any]]:
+    """Stream case results from a JSONL report, one line at a time."""
+    with path.open("rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record.get("record") == "case":
+                yield record["case"]
@@ -1,29 +1,35 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import time
+from collections import deque
+from collections.abc import AsyncIterable, Callable, Iterator, Mapping
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
-from .metrics import SuiteMetrics
-from .plugins import get_scorer
+from .columnar import ColumnarCases
+from .journal import ResultJournal, result_key, scorer_config_digest
+from .metrics import MetricsCollector, SuiteMetrics
+from .parallel import iter_chunks, map_chunks, resolve_chunk_size
+from .plugins import call_scorer, get_scorer, is_async_scorer, is_batch_scorer
+from .predictions import join_predictions, read_predictions
 from .report import EvalReport
+from .sandbox import SandboxLimits, ScorerSandbox
+from .score_cache import ScoreCache, case_digest, score_key, scorer_version
 from .scoring import JSONSchema, exact_match_score, json_required_keys_score, parse_json_schema
-from .suite import EvalSuite
+from .suite import EvalCase, EvalSuite
 
 logger = logging.getLogger(__name__)
 
-
-def _read_predictions(path: Path) -> dict[str, Any]:
-    preds: dict[str, Any] = {}
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        obj = json.loads(line)
-        preds[str(obj["id"])] = obj.get("prediction")
-    logger.debug("Loaded %d predictions from %s", len(preds), path)
-    return preds
+DEFAULT_BATCH_SIZE = 64
+# Chunks scored at once by arun_suite.
+DEFAULT_CONCURRENCY = 8
+# Timer name prefixes: per-plugin-scorer call time and run phases.
+SCORER_TIMER_PREFIX = "scorer."
+PHASE_TIMER_PREFIX = "phase."
 
 
 def _resolve_plugin_scorers(scoring: dict[str, Any]) -> list[str]:
@@ -34,89 +40,317 @@ def _resolve_plugin_scorers(scoring: dict[str, Any]) -> list[str]:
     return []
 
 
-def run_suite(*, suite: EvalSuite, predictions_path: Path) -> EvalReport:
-    logger.info(
-        "Suite execution started: name=%s, cases=%d",
-        suite.name,
-        len(suite.cases),
-    )
-    suite_start = time.monotonic()
+@dataclass(frozen=True)
+class _ScoringContext:
+    """Per-run scoring configuration shipped to every chunk worker."""
+
+    schema: JSONSchema | None
+    # (name, callable, is_batch) in the order declared by the suite.
+    plugin_scorers: tuple[tuple[str, Any, bool], ...]
+    score_cache: ScoreCache | None = None
+    # Cases per batch-scorer call.
+    batch_size: int = DEFAULT_BATCH_SIZE
+    # Runs plugin scorers in worker processes when set.
+    sandbox: ScorerSandbox | None = None
+
+
+@dataclass
+class _ChunkOutcome:
+    """Scored chunk plus metrics to merge into the run's metrics collector."""
+
+    results: list[tuple[dict[str, Any], float]]
+    # MetricsCollector.to_state() of the worker's chunk-local collector.
+    metrics: dict[str, Any] = field(default_factory=dict)
+
+
+_BUILTIN_SCORER_VERSION = "1"
+
+
+def _call_plugin(
+    ctx: _ScoringContext, metrics: MetricsCollector, name: str, func: Any, **kwargs: Any
+) -> Any:
+    """Call a plugin scorer inline, or in the sandbox when isolation is enabled.
 
-    predictions = _read_predictions(predictions_path)
+    Each call's wall time is recorded under the ``scorer.<name>`` timer.
+    """
+    start = time.monotonic()
+    try:
+        if ctx.sandbox is not None:
+            return ctx.sandbox.call(name, **kwargs)
+        return call_scorer(func, **kwargs)
+    finally:
+        metrics.record_time(f"{SCORER_TIMER_PREFIX}{name}", time.monotonic() - start)
 
-    schema: JSONSchema | None = None
-    if "json_schema" in suite.scoring:
-        schema = parse_json_schema(dict(suite.scoring.get("json_schema") or {}))
-        logger.debug("JSON schema scoring enabled with keys: %s", schema.required_keys)
 
-    plugin_scorer_names = _resolve_plugin_scorers(suite.scoring)
-    plugin_scorers: list[tuple[str, Any]] = []
-    for name in plugin_scorer_names:
+def _plugin_error(exc: BaseException) -> dict[str, Any]:
+    """Result recorded for a plugin call that raised *exc*."""
+    if isinstance(exc, TimeoutError):
+        return {"score": 0.0, "error": "timeout"}
+    if isinstance(exc, MemoryError):
+        return {"score": 0.0, "error": "memory"}
+    if isinstance(exc, ChildProcessError):
+        return {"score": 0.0, "error": "crashed"}
+    return {"score": 0.0, "error": True}
+
+
+def _memoized(
+    ctx: _ScoringContext,
+    metrics: MetricsCollector,
+    digest: str,
+    scorer: str,
+    version: str,
+    compute: Callable[[], tuple[float, dict[str, Any]]],
+    config: Any = None,
+) -> tuple[float, dict[str, Any]]:
+    """Return ``compute()``, served from / stored to the score cache when enabled."""
+    cache = ctx.score_cache
+    if cache is None:
+        return compute()
+    key = score_key(scorer=scorer, version=version, case=digest, config=config)
+    hit = cache.get(key)
+    if hit is not None:
+        metrics.increment("score_cache.hits")
+        return hit
+    metrics.increment("score_cache.misses")
+    score, meta = compute()
+    cache.put(key, score, meta)
+    return score, meta
+
+
+def _batch_results(name: str, raw: Any, expected_len: int) -> list[tuple[float, dict[str, Any]]]:
+    """Validate a batch scorer's return value as ``expected_len`` ``(score, meta)`` pairs.
+
+    Raises:
+        ValueError: If the length differs or an element is not a ``(score, dict)`` pair.
+    """
+    scored: list[tuple[float, dict[str, Any]]] = []
+    for n, item in enumerate(raw):
         try:
-            plugin_scorers.append((name, get_scorer(name)))
-            logger.debug("Plugin scorer loaded: %s", name)
-        except KeyError:
-            logger.warning("Plugin scorer '%s' not found in registry, skipping", name)
+            score, meta = item
+            scored.append((float(score), dict(meta)))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"batch_scorer_bad_result:{name}:{n}:{item!r}") from e
+    if len(scored) != expected_len:
+        raise ValueError(f"batch_scorer_length_mismatch:{name}:{len(scored)}!={expected_len}")
+    return scored
 
-    case_results: list[dict[str, Any]] = []
-    metrics = SuiteMetrics()
 
-    for case in suite.cases:
-        case_start = time.monotonic()
-        predicted = predictions.get(case.id)
-        exact_score, exact_meta = exact_match_score(expected=case.expected, predicted=predicted)
-        json_score = 0.0
-        json_meta: dict[str, Any] = {"enabled": False}
-        if schema is not None:
-            json_score, json_meta = json_required_keys_score(schema=schema, predicted=predicted)
-            json_meta = {"enabled": True, **json_meta}
-
-        # Run plugin scorers and collect results
-        plugin_results: dict[str, dict[str, Any]] = {}
-        plugin_best_score = 0.0
-        for scorer_name, scorer_func in plugin_scorers:
+def _run_batch_scorers(
+    ctx: _ScoringContext,
+    chunk: list[tuple[EvalCase, Any]],
+    digests: list[str],
+    metrics: MetricsCollector,
+) -> tuple[list[dict[str, dict[str, Any]]], list[float]]:
+    """Run every batch scorer over *chunk* in slices of ``ctx.batch_size``.
+
+    Returns:
+        Per-case ``{scorer_name: result}`` dicts and the per-case share of
+        batch-scorer wall time (each call's time is split evenly over its cases).
+    """
+    results: list[dict[str, dict[str, Any]]] = [{} for _ in chunk]
+    elapsed = [0.0] * len(chunk)
+    cache = ctx.score_cache
+    for scorer_name, scorer_func, is_batch in ctx.plugin_scorers:
+        if not is_batch:
+            continue
+        version = scorer_version(scorer_func)
+        todo: list[tuple[int, str]] = []
+        for i, digest in enumerate(digests):
+            key = ""
+            if cache is not None:
+                key = score_key(scorer=scorer_name, version=version, case=digest)
+                hit = cache.get(key)
+                if hit is not None:
+                    metrics.increment("score_cache.hits")
+                    results[i][scorer_name] = {"score": hit[0], **hit[1]}
+                    continue
+                metrics.increment("score_cache.misses")
+            todo.append((i, key))
+        for batch in iter_chunks(todo, ctx.batch_size):
+            batch_start = time.monotonic()
+            scored: list[tuple[float, dict[str, Any]]] | None = None
+            failure: dict[str, Any] = {}
             try:
-                p_score, p_meta = scorer_func(
-                    expected=case.expected, predicted=predicted
+                scored = _batch_results(
+                    scorer_name,
+                    _call_plugin(
+                        ctx,
+                        metrics,
+                        scorer_name,
+                        scorer_func,
+                        expected=[chunk[i][0].expected for i, _ in batch],
+                        predicted=[chunk[i][1] for i, _ in batch],
+                    ),
+                    len(batch),
                 )
-                plugin_results[scorer_name] = {"score": p_score, **p_meta}
-                plugin_best_score = max(plugin_best_score, p_score)
-            except Exception:  # noqa: BLE001
+            except Exception as e:  # noqa: BLE001
                 logger.warning(
-                    "Plugin scorer '%s' failed on case %s", scorer_name, case.id,
+                    "Batch scorer '%s' failed on cases %s..%s",
+                    scorer_name,
+                    chunk[batch[0][0]][0].id,
+                    chunk[batch[-1][0]][0].id,
                     exc_info=True,
                 )
-                plugin_results[scorer_name] = {"score": 0.0, "error": True}
-
-        case_score = max(exact_score, json_score, plugin_best_score)
-        case_elapsed = time.monotonic() - case_start
-
-        result: dict[str, Any] = {
-            "id": case.id,
-            "tags": list(case.tags),
-            "score": case_score,
-            "exact": exact_meta,
-            "json": json_meta,
-        }
-        if plugin_results:
-            result["plugins"] = plugin_results
-
-        case_results.append(result)
-
-        metrics.record_case(score=case_score, elapsed=case_elapsed)
-
-        logger.debug(
-            "Case %s: score=%.2f, elapsed=%.4fs",
-            case.id,
-            case_score,
-            case_elapsed,
+                scored, failure = None, _plugin_error(e)
+            share = (time.monotonic() - batch_start) / len(batch)
+            for n, (i, key) in enumerate(batch):
+                elapsed[i] += share
+                if scored is None:
+                    results[i][scorer_name] = dict(failure)
+                    continue
+                p_score, p_meta = scored[n]
+                results[i][scorer_name] = {"score": p_score, **p_meta}
+                if cache is not None:
+                    cache.put(key, p_score, p_meta)
+    return results, elapsed
+
+
+def _score_case(
+    ctx: _ScoringContext,
+    case: EvalCase,
+    predicted: Any,
+    metrics: MetricsCollector,
+    digest: str,
+    batched: dict[str, dict[str, Any]],
+) -> tuple[dict[str, Any], float]:
+    """Score a single case; return the per-case result dict and elapsed seconds.
+
+    Batch scorer results are computed up front and passed in as *batched*.
+    """
+    case_start = time.monotonic()
+    exact_score, exact_meta = _memoized(
+        ctx,
+        metrics,
+        digest,
+        "exact_match",
+        _BUILTIN_SCORER_VERSION,
+        lambda: exact_match_score(expected=case.expected, predicted=predicted),
+    )
+    json_score = 0.0
+    json_meta: dict[str, Any] = {"enabled": False}
+    schema = ctx.schema
+    if schema is not None:
+        json_score, json_meta = _memoized(
+            ctx,
+            metrics,
+            digest,
+            "json_required_keys",
+            _BUILTIN_SCORER_VERSION,
+            lambda: json_required_keys_score(schema=schema, predicted=predicted),
+            config=asdict(schema),
         )
+        json_meta = {"enabled": True, **json_meta}
 
+    # Run plugin scorers and collect results
+    plugin_results: dict[str, dict[str, Any]] = {}
+    plugin_best_score = 0.0
+    for scorer_name, scorer_func, is_batch in ctx.plugin_scorers:
+        if is_batch:
+            plugin_results[scorer_name] = batched[scorer_name]
+            plugin_best_score = max(plugin_best_score, batched[scorer_name]["score"])
+            continue
+        try:
+            p_score, p_meta = _memoized(
+                ctx,
+                metrics,
+                digest,
+                scorer_name,
+                scorer_version(scorer_func),
+                lambda n=scorer_name, f=scorer_func: _call_plugin(
+                    ctx, metrics, n, f, expected=case.expected, predicted=predicted
+                ),
+            )
+            plugin_results[scorer_name] = {"score": p_score, **p_meta}
+            plugin_best_score = max(plugin_best_score, p_score)
+        except Exception as e:  # noqa: BLE001
+            logger.warning(
+                "Plugin scorer '%s' failed on case %s", scorer_name, case.id,
+                exc_info=True,
+            )
+            plugin_results[scorer_name] = _plugin_error(e)
+
+    case_score = max(exact_score, json_score, plugin_best_score)
+
+    result: dict[str, Any] = {
+        "id": case.id,
+        "tags": list(case.tags),
+        "score": case_score,
+        "exact": exact_meta,
+        "json": json_meta,
+    }
+    if plugin_results:
+        result["plugins"] = plugin_results
+    return result, time.monotonic() - case_start
+
+
+def _score_chunk(ctx: _ScoringContext, chunk: list[tuple[EvalCase, Any]]) -> _ChunkOutcome:
+    """Score a chunk of ``(case, prediction)`` pairs.  Runs inside pool workers."""
+    metrics = MetricsCollector()
+    if ctx.score_cache is not None:
+        digests = [case_digest(expected=c.expected, predicted=p) for c, p in chunk]
+    else:
+        digests = [""] * len(chunk)
+    if any(is_batch for _, _, is_batch in ctx.plugin_scorers):
+        batched, batch_elapsed = _run_batch_scorers(ctx, chunk, digests, metrics)
+    else:
+        batched, batch_elapsed = [{}] * len(chunk), [0.0] * len(chunk)
+    results: list[tuple[dict[str, Any], float]] = []
+    for (case, predicted), digest, case_batched, extra in zip(
+        chunk, digests, batched, batch_elapsed, strict=True
+    ):
+        result, case_elapsed = _score_case(ctx, case, predicted, metrics, digest, case_batched)
+        results.append((result, case_elapsed + extra))
+        metrics.record_time("case.score", case_elapsed + extra)
+    if ctx.score_cache is not None:
+        ctx.score_cache.commit()
+    return _ChunkOutcome(results=results, metrics=metrics.to_state())
+
+
+def _phase(collector: MetricsCollector | None, name: str) -> AbstractContextManager[Any]:
+    """Time a run phase under the ``phase.<name>`` timer when *collector* is set."""
+    if collector is None:
+        return nullcontext()
+    return collector.timer(f"{PHASE_TIMER_PREFIX}{name}")
+
+
+def _suite_schema(suite: EvalSuite) -> JSONSchema | None:
+    """Return the suite's ``json_schema`` scoring config, if it declares one."""
+    if "json_schema" not in suite.scoring:
+        return None
+    schema = parse_json_schema(dict(suite.scoring.get("json_schema") or {}))
+    logger.debug("JSON schema scoring enabled with keys: %s", schema.required_keys)
+    return schema
+
+
+def _load_plugin_scorers(suite: EvalSuite) -> list[tuple[str, Any, bool]]:
+    """Look up the suite's plugin scorers as ``(name, callable, is_batch)``.
+
+    Scorers missing from the registry are logged and skipped.
+    """
+    plugin_scorers: list[tuple[str, Any, bool]] = []
+    for name in _resolve_plugin_scorers(suite.scoring):
+        try:
+            plugin_scorers.append((name, get_scorer(name), is_batch_scorer(name)))
+            logger.debug("Plugin scorer loaded: %s (batch=%s)", name, plugin_scorers[-1][2])
+        except KeyError:
+            logger.warning("Plugin scorer '%s' not found in registry, skipping", name)
+    return plugin_scorers
+
+
+def _finish_report(
+    suite: EvalSuite,
+    metrics: SuiteMetrics,
+    case_results: list[dict[str, Any]] | ColumnarCases,
+    suite_start: float,
+) -> EvalReport:
+    """Build the run's report from its accumulated metrics and case results."""
     suite_elapsed = time.monotonic() - suite_start
     metrics.execution_time_seconds = suite_elapsed
 
     avg_score = metrics.average_score
-    summary = {"cases": metrics.total_cases, "score": avg_score}
+    summary: dict[str, Any] = {"cases": metrics.total_cases, "score": avg_score}
+    if metrics.by_tag:
+        summary["by_tag"] = metrics.tag_summary()
 
     logger.info(
         "Suite execution finished: name=%s, total=%d, passed=%d, failed=%d, "
@@ -131,3 +365,500 @@ def run_suite(*, suite: EvalSuite, predictions_path: Path) -> EvalReport:
     )
 
     return EvalReport(suite=suite.to_dict(), summary=summary, cases=case_results)
+
+
+def _update_run_gauges(
+    collector: MetricsCollector, metrics: SuiteMetrics, *, elapsed: float, workers: int
+) -> None:
+    """Refresh live throughput gauges after a chunk (read by metrics exporters)."""
+    collector.set_gauge("run.cases", metrics.total_cases)
+    if elapsed > 0:
+        collector.set_gauge("run.cases_per_second", metrics.total_cases / elapsed)
+        busy = metrics.case_latency.total
+        collector.set_gauge("run.worker_utilization", min(1.0, busy / (elapsed * max(workers, 1))))
+    hits = collector.get_counter("score_cache.hits")
+    lookups = hits + collector.get_counter("score_cache.misses")
+    if lookups:
+        collector.set_gauge("score_cache.hit_ratio", hits / lookups)
+
+
+def run_suite(
+    *,
+    suite: EvalSuite,
+    predictions_path: Path | None = None,
+    predictions: Mapping[str, Any] | None = None,
+    workers: int = 1,
+    executor: str = "thread",
+    chunk_size: int | None = None,
+    batch_size: int | None = None,
+    stream_predictions: bool = False,
+    journal: ResultJournal | None = None,
+    score_cache: ScoreCache | None = None,
+    collector: MetricsCollector | None = None,
+    isolation: SandboxLimits | None = None,
+    case_sink: Callable[[dict[str, Any]], None] | None = None,
+    columnar: bool = False,
+) -> EvalReport:
+    """Score every case in *suite* against the predictions JSONL.
+
+    Args:
+        suite: Suite to evaluate.
+        predictions_path: JSONL file with one ``{"id": ..., "prediction": ...}`` per line.
+        predictions: Predictions already in memory, keyed by case id; given
+            instead of *predictions_path*.
+        workers: Number of parallel scoring workers (``1`` scores inline).
+        executor: ``"thread"`` or ``"process"`` pool (see :mod:`.parallel`).
+        chunk_size: Cases per work unit; chosen automatically when ``None``
+            (or set to *batch_size* when that is given).
+        batch_size: Cases per call to batch plugin scorers (see
+            :class:`.plugins.BatchScorerFunc`); defaults to ``DEFAULT_BATCH_SIZE``
+            when the suite declares batch scorers.
+        stream_predictions: Join predictions to cases incrementally instead of
+            loading the whole file into memory (see :func:`.join_predictions`).
+        journal: Optional result journal.  Cases whose expected value,
+            prediction and scorer config match a journaled record are replayed
+            instead of rescored; newly scored cases are appended.
+        score_cache: Optional persistent memoization of individual scorer
+            results (see :mod:`.score_cache`).
+        collector: Optional metrics collector; receives ``score_cache.hits``
+            and ``score_cache.misses`` counters and the ``case.score`` timer,
+            merged from each pool worker's chunk-local metrics, plus
+            ``run.cases``, ``run.cases_per_second``, ``run.worker_utilization``
+            and ``score_cache.hit_ratio`` gauges refreshed after every chunk.
+            Also receives ``scorer.<name>`` timers (wall time of each plugin
+            scorer call) and ``phase.load_predictions`` / ``phase.score``
+            timers; see :mod:`.profiling`.
+        isolation: Run plugin scorers in sandboxed worker processes with these
+            limits (see :mod:`.sandbox`).  Timeouts are recorded as
+            ``{"score": 0.0, "error": "timeout"}``.
+        case_sink: Receives each case result, in suite order, as soon as its
+            chunk is scored (e.g. :meth:`.JsonlReportWriter.write_case`).  Results
+            are then not retained, so the returned report has no ``cases``.
+        columnar: Collect case results in a :class:`.ColumnarCases` store
+            instead of a list of dicts.
+
+    Returns:
+        The report, with ``cases`` in suite order regardless of *workers*.
+
+    Raises:
+        ValueError: If *batch_size* or *chunk_size* is less than 1, or not
+            exactly one of *predictions_path* and *predictions* is given.
+    """
+    if (predictions_path is None) == (predictions is None):
+        raise ValueError("exactly one of predictions_path or predictions is required")
+    if batch_size is not None and batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+    logger.info(
+        "Suite execution started: name=%s, cases=%d, workers=%d",
+        suite.name,
+        len(suite.cases),
+        workers,
+    )
+    suite_start = time.monotonic()
+
+    schema = _suite_schema(suite)
+    plugin_scorers = _load_plugin_scorers(suite)
+    if batch_size is None and any(is_batch for _, _, is_batch in plugin_scorers):
+        batch_size = DEFAULT_BATCH_SIZE
+    sandbox: ScorerSandbox | None = None
+    if isolation is not None and plugin_scorers:
+        sandbox = ScorerSandbox(
+            {name: func for name, func, _ in plugin_scorers},
+            isolation,
+            size=workers if executor == "thread" else 1,
+        )
+    ctx = _ScoringContext(
+        schema=schema,
+        plugin_scorers=tuple(plugin_scorers),
+        score_cache=score_cache,
+        batch_size=batch_size or DEFAULT_BATCH_SIZE,
+        sandbox=sandbox,
+    )
+    size = resolve_chunk_size(
+        total=len(suite.cases),
+        workers=workers,
+        chunk_size=chunk_size if chunk_size is not None else batch_size,
+    )
+    pairs: Iterator[tuple[EvalCase, Any]]
+    if predictions_path is not None and stream_predictions:
+        pairs = join_predictions(suite.cases, predictions_path)
+    else:
+        by_id: Mapping[str, Any] = predictions or {}
+        if predictions_path is not None:
+            with _phase(collector, "load_predictions"):
+                by_id = read_predictions(predictions_path)
+        pairs = ((case, by_id.get(case.id)) for case in suite.cases)
+
+    config_digest = (
+        scorer_config_digest(
+            suite.scoring,
+            {name: scorer_version(func) for name, func, _ in plugin_scorers},
+        )
+        if journal is not None
+        else ""
+    )
+    # Per-chunk (case id, journal key, replayed result) slots, consumed in
+    # lockstep with map_chunks' ordered output.
+    slots: deque[list[tuple[str, str, dict[str, Any] | None]]] = deque()
+
+    def pending_chunks() -> Iterator[list[tuple[EvalCase, Any]]]:
+        for chunk in iter_chunks(pairs, size):
+            chunk_slots: list[tuple[str, str, dict[str, Any] | None]] = []
+            todo: list[tuple[EvalCase, Any]] = []
+            for case, predicted in chunk:
+                key, replayed = "", None
+                if journal is not None:
+                    key = result_key(
+                        config_digest=config_digest, expected=case.expected, predicted=predicted
+                    )
+                    replayed = journal.lookup(case.id, key)
+                chunk_slots.append((case.id, key, replayed))
+                if replayed is None:
+                    todo.append((case, predicted))
+            slots.append(chunk_slots)
+            yield todo
+
+    case_results: list[dict[str, Any]] | ColumnarCases = ColumnarCases() if columnar else []
+    metrics = SuiteMetrics()
+
+    score_start = time.monotonic()
+    try:
+        for outcome in map_chunks(
+            _score_chunk,
+            pending_chunks(),
+            workers=workers,
+            executor=executor,
+            args=(ctx,),
+        ):
+            if collector is not None:
+                collector.merge_state(outcome.metrics)
+            scored = iter(outcome.results)
+            for case_id, key, replayed in slots.popleft():
+                if replayed is None:
+                    result, case_elapsed = next(scored)
+                    if journal is not None:
+                        journal.append(case_id, key, result)
+                else:
+                    result, case_elapsed = replayed, 0.0
+                if case_sink is not None:
+                    case_sink(result)
+                else:
+                    case_results.append(result)
+                metrics.record_case(
+                    score=result["score"], elapsed=case_elapsed, tags=result.get("tags") or ()
+                )
+                logger.debug(
+                    "Case %s: score=%.2f, elapsed=%.4fs",
+                    result["id"],
+                    result["score"],
+                    case_elapsed,
+                )
+            if journal is not None:
+                journal.flush()
+            if collector is not None:
+                _update_run_gauges(
+                    collector, metrics, elapsed=time.monotonic() - suite_start, workers=workers
+                )
+    finally:
+        if sandbox is not None:
+            sandbox.close()
+    if collector is not None:
+        collector.record_time(f"{PHASE_TIMER_PREFIX}score", time.monotonic() - score_start)
+
+    if journal is not None and journal.replayed:
+        logger.info("Replayed %d journaled case results", journal.replayed)
+
+    return _finish_report(suite, metrics, case_results, suite_start)
+
+
+async def _ascore_async_plugins(
+    ctx: _ScoringContext,
+    scorers: tuple[tuple[str, Any, bool], ...],
+    chunk: list[tuple[EvalCase, Any]],
+    metrics: MetricsCollector,
+) -> tuple[list[dict[str, dict[str, Any]]], list[float]]:
+    """Await every async plugin scorer over *chunk*, concurrently.
+
+    Returns:
+        Per-case ``{scorer_name: result}`` dicts and per-case scorer wall time
+        (batch calls split evenly over their cases).
+    """
+    results: list[dict[str, dict[str, Any]]] = [{} for _ in chunk]
+    elapsed = [0.0] * len(chunk)
+    if not scorers:
+        return results, elapsed
+    cache = ctx.score_cache
+    # Case indexes each scorer still has to score, and cache keys for them.
+    todo = {name: list(range(len(chunk))) for name, _, _ in scorers}
+    keys: dict[tuple[str, int], str] = {}
+    fresh: list[tuple[str, float, dict[str, Any]]] = []
+
+    # SQLite calls block, so cache I/O runs in a worker thread.  Each helper
+    # commits on the thread it ran on, as ScoreCache buffers per thread.
+    def lookup(cache: ScoreCache) -> None:
+        digests = [case_digest(expected=c.expected, predicted=p) for c, p in chunk]
+        for name, func, _ in scorers:
+            version = scorer_version(func)
+            misses = []
+            for i, digest in enumerate(digests):
+                key = score_key(scorer=name, version=version, case=digest)
+                hit = cache.get(key)
+                if hit is None:
+                    metrics.increment("score_cache.misses")
+                    keys[name, i] = key
+                    misses.append(i)
+                else:
+                    metrics.increment("score_cache.hits")
+                    results[i][name] = {"score": hit[0], **hit[1]}
+            todo[name] = misses
+        cache.commit()
+
+    def write(cache: ScoreCache) -> None:
+        for key, p_score, p_meta in fresh:
+            cache.put(key, p_score, p_meta)
+        cache.commit()
+
+    def store(name: str, i: int, p_score: float, p_meta: dict[str, Any]) -> None:
+        results[i][name] = {"score": p_score, **p_meta}
+        if cache is not None:
+            fresh.append((keys[name, i], p_score, p_meta))
+
+    async def score_one(name: str, func: Any, i: int) -> None:
+        case, predicted = chunk[i]
+        start = time.monotonic()
+        try:
+            p_score, p_meta = await func(expected=case.expected, predicted=predicted)
+            store(name, i, float(p_score), dict(p_meta))
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Plugin scorer '%s' failed on case %s", name, case.id, exc_info=True)
+            results[i][name] = _plugin_error(e)
+        finally:
+            took = time.monotonic() - start
+            metrics.record_time(f"{SCORER_TIMER_PREFIX}{name}", took)
+            elapsed[i] += took
+
+    async def score_batch(name: str, func: Any) -> None:
+        for batch in iter_chunks(todo[name], ctx.batch_size):
+            start = time.monotonic()
+            try:
+                raw = await func(
+                    expected=[chunk[i][0].expected for i in batch],
+                    predicted=[chunk[i][1] for i in batch],
+                )
+                scored = _batch_results(name, raw, len(batch))
+            except Exception as e:  # noqa: BLE001
+                logger.warning(
+                    "Batch scorer '%s' failed on cases %s..%s",
+                    name,
+                    chunk[batch[0]][0].id,
+                    chunk[batch[-1]][0].id,
+                    exc_info=True,
+                )
+                for i in batch:
+                    results[i][name] = _plugin_error(e)
+            else:
+                for i, (p_score, p_meta) in zip(batch, scored, strict=True):
+                    store(name, i, p_score, p_meta)
+            took = time.monotonic() - start
+            metrics.record_time(f"{SCORER_TIMER_PREFIX}{name}", took)
+            for i in batch:
+                elapsed[i] += took / len(batch)
+
+    if cache is not None:
+        await asyncio.to_thread(lookup, cache)
+    await asyncio.gather(
+        *(
+            score_batch(name, func) if is_batch else score_one(name, func, i)
+            for name, func, is_batch in scorers
+            for i in ([0] if is_batch else todo[name])
+        )
+    )
+    if cache is not None and fresh:
+        await asyncio.to_thread(write, cache)
+    return results, elapsed
+
+
+def _merge_async_results(
+    result: dict[str, Any], extra: dict[str, dict[str, Any]], order: list[str]
+) -> None:
+    """Fold async plugin results into a case result scored by :func:`_score_chunk`."""
+    if not extra:
+        return
+    plugins = {**result.get("plugins", {}), **extra}
+    result["plugins"] = {name: plugins[name] for name in order if name in plugins}
+    result["score"] = max(result["score"], *(r["score"] for r in extra.values()))
+
+
+async def arun_suite(
+    *,
+    suite: EvalSuite,
+    predictions: AsyncIterable[tuple[str, Any]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_pending: int | None = None,
+    batch_size: int | None = None,
+    score_cache: ScoreCache | None = None,
+    collector: MetricsCollector | None = None,
+    case_sink: Callable[[dict[str, Any]], None] | None = None,
+    columnar: bool = False,
+) -> EvalReport:
+    """Score *suite* against ``(case_id, prediction)`` pairs from an async iterator.
+
+    The asyncio counterpart of :func:`run_suite` for embedding in async
+    services: each prediction is scored as soon as it arrives, so scoring
+    overlaps with whatever produces the predictions (typically inference).
+
+    Up to *concurrency* scoring tasks run at once.  Each takes the
+    predictions waiting in the queue, up to *batch_size*, and scores them as
+    one chunk: async plugin scorers (see :func:`.plugins.is_async_scorer`)
+    are awaited on the event loop, while the built-in and synchronous plugin
+    scorers run in a worker thread so they never block it.  At most
+    *max_pending* predictions wait in the queue; while it is full
+    *predictions* is not advanced, so a producer faster than scoring is
+    throttled to the scoring rate.
+
+    Predictions may arrive in any order.  Ids not in the suite and repeats
+    of an id already received are logged and ignored; cases still without a
+    prediction when *predictions* is exhausted are scored against ``None``,
+    as :func:`run_suite` scores missing predictions.
+
+    Args:
+        suite: Suite to evaluate.
+        predictions: Async iterator of ``(case_id, prediction)`` pairs.
+        concurrency: Chunks scored at once.
+        max_pending: Predictions queued ahead of scoring before *predictions*
+            stops being read (default: ``concurrency * batch_size``).
+        batch_size: Most cases per chunk and per batch scorer call (default:
+            ``DEFAULT_BATCH_SIZE``).
+        score_cache: Optional persistent memoization of scorer results.
+        collector: Optional metrics collector; receives the same metrics as
+            with :func:`run_suite`, plus a ``run.pending`` gauge (queued
+            predictions).
+        case_sink: Receives each case result as soon as it is scored, in
+            completion order.  Results are then not retained, so the
+            returned report has no ``cases``.
+        columnar: Collect case results in a :class:`.ColumnarCases` store.
+
+    Returns:
+        The report, with ``cases`` in suite order.
+
+    Raises:
+        ValueError: If *concurrency*, *max_pending* or *batch_size* is less than 1.
+    """
+    for arg, value in (
+        ("concurrency", concurrency),
+        ("max_pending", max_pending),
+        ("batch_size", batch_size),
+    ):
+        if value is not None and value < 1:
+            raise ValueError(f"{arg} must be >= 1, got {value}")
+    logger.info(
+        "Async suite execution started: name=%s, cases=%d, concurrency=%d",
+        suite.name,
+        len(suite.cases),
+        concurrency,
+    )
+    suite_start = time.monotonic()
+    plugin_scorers = _load_plugin_scorers(suite)
+    order = [name for name, _, _ in plugin_scorers]
+    async_scorers = tuple(s for s in plugin_scorers if is_async_scorer(s[0]))
+    limit = batch_size or DEFAULT_BATCH_SIZE
+    ctx = _ScoringContext(
+        schema=_suite_schema(suite),
+        plugin_scorers=tuple(s for s in plugin_scorers if s not in async_scorers),
+        score_cache=score_cache,
+        batch_size=limit,
+    )
+
+    cases = list(suite.cases)
+    index = {case.id: i for i, case in enumerate(cases)}
+    received = bytearray(len(cases))
+    queue: asyncio.Queue[tuple[int, Any] | None] = asyncio.Queue(
+        maxsize=max_pending or concurrency * limit
+    )
+    slots: list[dict[str, Any] | None] = [None] * len(cases)
+    metrics = SuiteMetrics()
+
+    async def produce() -> None:
+        async for case_id, predicted in predictions:
+            i = index.get(str(case_id))
+            if i is None:
+                logger.warning("Ignoring prediction for unknown case id %r", case_id)
+                continue
+            if received[i]:
+                logger.warning("Ignoring repeated prediction for case %s", case_id)
+                continue
+            received[i] = 1
+            await queue.put((i, predicted))
+            if collector is not None:
+                collector.set_gauge("run.pending", queue.qsize())
+        missing = [i for i, seen in enumerate(received) if not seen]
+        if missing:
+            logger.info("Scoring %d cases without a prediction", len(missing))
+        for i in missing:
+            await queue.put((i, None))
+        for _ in range(concurrency):
+            await queue.put(None)
+
+    async def score(chunk: list[tuple[int, Any]]) -> None:
+        pairs = [(cases[i], predicted) for i, predicted in chunk]
+        chunk_metrics = MetricsCollector()
+        (extra, extra_elapsed), outcome = await asyncio.gather(
+            _ascore_async_plugins(ctx, async_scorers, pairs, chunk_metrics),
+            asyncio.to_thread(_score_chunk, ctx, pairs),
+        )
+        if collector is not None:
+            collector.merge_state(chunk_metrics.to_state())
+            collector.merge_state(outcome.metrics)
+        for (i, _), (result, case_elapsed), case_extra, took in zip(
+            chunk, outcome.results, extra, extra_elapsed, strict=True
+        ):
+            _merge_async_results(result, case_extra, order)
+            if case_sink is not None:
+                case_sink(result)
+            else:
+                slots[i] = result
+            metrics.record_case(
+                score=result["score"],
+                elapsed=case_elapsed + took,
+                tags=result.get("tags") or (),
+            )
+        if collector is not None:
+            _update_run_gauges(
+                collector, metrics, elapsed=time.monotonic() - suite_start, workers=concurrency
+            )
+
+    async def work() -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            chunk = [item]
+            done = False
+            while len(chunk) < limit and not queue.empty():
+                nxt = queue.get_nowait()
+                if nxt is None:
+                    done = True
+                    break
+                chunk.append(nxt)
+            await score(chunk)
+            if done:
+                return
+
+    score_start = time.monotonic()
+    tasks = [asyncio.ensure_future(produce())]
+    tasks += [asyncio.ensure_future(work()) for _ in range(concurrency)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+    if collector is not None:
+        collector.record_time(f"{PHASE_TIMER_PREFIX}score", time.monotonic() - score_start)
+
+    case_results: list[dict[str, Any]] | ColumnarCases = ColumnarCases() if columnar else []
+    if case_sink is None:
+        for result in slots:
+            if result is None:
+                raise RuntimeError("arun_suite finished with an unscored case")
+            case_results.append(result)
+    return _finish_report(suite, metrics, case_results, suite_start)
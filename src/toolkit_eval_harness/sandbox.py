@@ -0,0 +1,266 @@
+"""Process-isolated execution of plugin scorers.
+
+Plugin scorers normally run inline, so one that hangs or spins on a
+pathological prediction stalls the whole run.  :class:`ScorerSandbox` runs
+them in a small pool of worker processes instead:
+
+* every call has a wall-clock timeout; a worker that overruns is killed and
+  replaced, and the call raises :class:`TimeoutError`;
+* workers can be given an address-space ceiling (``RLIMIT_AS``, POSIX only);
+  a worker that dies (out of memory, segfault, ``os._exit``) raises
+  :class:`ChildProcessError` and is replaced;
+* workers are recycled after ``recycle_after`` calls to bound leaks.
+
+Workers are started lazily and inherit the scorer callables when the platform
+forks; under the ``spawn`` start method scorers must be picklable module-level
+functions.  The sandbox pickles to its configuration only, so it can be
+shipped to process-pool workers: every copy unpickled in the same pool
+worker shares one sandbox worker, which is reused (and recycled) across
+chunks and stopped when the pool worker exits.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import multiprocessing.util
+import os
+import queue
+import signal
+import traceback
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Any
+
+from .plugins import call_scorer
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SandboxLimits:
+    """Resource limits for sandboxed scorer calls.
+
+    Attributes:
+        timeout_seconds: Wall-clock limit for one scorer call (one batch for
+            batch scorers).
+        max_memory_bytes: Address-space ceiling per worker; ``0`` for none.
+        recycle_after: Replace a worker after this many calls; ``0`` never.
+    """
+
+    timeout_seconds: float = 30.0
+    max_memory_bytes: int = 0
+    recycle_after: int = 1000
+
+
+def _worker_main(
+    conn: Connection, scorers: Mapping[str, Callable[..., Any]], max_memory_bytes: int
+) -> None:
+    # The parent handles Ctrl-C and tears workers down.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if max_memory_bytes:
+        try:
+            import resource
+
+            resource.setrlimit(resource.RLIMIT_AS, (max_memory_bytes, max_memory_bytes))
+        except (ImportError, ValueError, OSError) as e:
+            logger.warning("Could not apply scorer memory limit: %s", e)
+    while True:
+        try:
+            msg = conn.recv()
+        except (EOFError, OSError):
+            return
+        if msg is None:
+            return
+        name, kwargs = msg
+        try:
+            conn.send(("ok", call_scorer(scorers[name], **kwargs)))
+        except MemoryError:
+            # The heap may be unusable now; report and let the parent replace us.
+            conn.send(("fatal", "MemoryError"))
+            return
+        except Exception:  # noqa: BLE001 -- reported to the parent
+            conn.send(("error", traceback.format_exc()))
+
+
+class _Worker:
+    def __init__(
+        self,
+        ctx: Any,
+        scorers: Mapping[str, Callable[..., Any]],
+        limits: SandboxLimits,
+    ) -> None:
+        self.conn, child = ctx.Pipe()
+        self.proc = ctx.Process(
+            target=_worker_main,
+            args=(child, scorers, limits.max_memory_bytes),
+            name="toolkit-eval-scorer",
+            daemon=True,
+        )
+        self.proc.start()
+        child.close()
+        self.calls = 0
+
+    def stop(self, *, kill: bool = False) -> None:
+        if kill:
+            self.proc.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except OSError:
+                pass
+        self.proc.join(timeout=5.0)
+        if self.proc.is_alive():
+            self.proc.kill()
+            self.proc.join()
+        self.conn.close()
+
+
+class _WorkerPool:
+    """Idle and live workers of a sandbox, owned by the process that made them."""
+
+    def __init__(self, size: int) -> None:
+        self.ctx = multiprocessing.get_context()
+        self.pid = os.getpid()
+        self.idle: queue.LifoQueue[_Worker | None] = queue.LifoQueue()
+        for _ in range(size):
+            self.idle.put(None)
+        self.live: set[_Worker] = set()
+
+    def close(self) -> None:
+        if os.getpid() != self.pid:
+            return
+        for worker in list(self.live):
+            self.live.discard(worker)
+            worker.stop()
+
+
+# Pools of sandbox copies unpickled in this process (a process-pool worker),
+# by sandbox token, so each chunk shipped to the worker reuses its pool.
+_shared_pools: dict[str, _WorkerPool] = {}
+
+
+def _close_shared_pools() -> None:
+    for pool in _shared_pools.values():
+        pool.close()
+    _shared_pools.clear()
+
+
+def _shared_pool(token: str) -> _WorkerPool:
+    pool = _shared_pools.get(token)
+    if pool is None or pool.pid != os.getpid():
+        if not _shared_pools:
+            # Runs when a pool worker process exits (atexit does not).
+            multiprocessing.util.Finalize(None, _close_shared_pools, exitpriority=10)
+        pool = _shared_pools[token] = _WorkerPool(1)
+    return pool
+
+
+class ScorerSandbox:
+    """Pool of worker processes that run plugin scorers with limits.
+
+    Safe to call from several threads at once; each call borrows one worker.
+
+    Args:
+        scorers: Scorer callables by name.
+        limits: Per-call resource limits.
+        size: Number of worker processes.
+    """
+
+    def __init__(
+        self,
+        scorers: Mapping[str, Callable[..., Any]],
+        limits: SandboxLimits | None = None,
+        *,
+        size: int = 1,
+    ) -> None:
+        if size < 1:
+            raise ValueError(f"size must be >= 1, got {size}")
+        self.scorers = dict(scorers)
+        self.limits = limits or SandboxLimits()
+        if self.limits.timeout_seconds <= 0:
+            raise ValueError(f"timeout_seconds must be > 0, got {self.limits.timeout_seconds}")
+        self.size = size
+        self._token = os.urandom(8).hex()
+        self._pool = _WorkerPool(size)
+
+    # A process-pool worker scores serially, so its copies share one sandbox worker.
+    def __getstate__(self) -> dict[str, Any]:
+        return {"scorers": self.scorers, "limits": self.limits, "token": self._token}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.scorers = state["scorers"]
+        self.limits = state["limits"]
+        self.size = 1
+        self._token = state["token"]
+        self._pool = _shared_pool(self._token)
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self._pool.ctx, self.scorers, self.limits)
+        self._pool.live.add(worker)
+        return worker
+
+    def _retire(self, worker: _Worker, *, kill: bool = False) -> None:
+        self._pool.live.discard(worker)
+        worker.stop(kill=kill)
+
+    def call(self, name: str, **kwargs: Any) -> Any:
+        """Run scorer *name* with *kwargs* in a worker and return its result.
+
+        Raises:
+            KeyError: If *name* is not one of the sandbox's scorers.
+            TimeoutError: If the call exceeds ``limits.timeout_seconds``.
+            MemoryError: If the scorer hit the worker's memory ceiling.
+            ChildProcessError: If the worker died during the call.
+            RuntimeError: If the scorer raised (message carries the traceback).
+        """
+        if name not in self.scorers:
+            raise KeyError(f"Scorer '{name}' is not available in the sandbox.")
+        if os.getpid() != self._pool.pid:
+            self._pool = _WorkerPool(self.size)
+        pool = self._pool
+        worker = pool.idle.get()
+        try:
+            if worker is None:
+                worker = self._spawn()
+            try:
+                worker.conn.send((name, kwargs))
+                ready = worker.conn.poll(self.limits.timeout_seconds)
+                reply = worker.conn.recv() if ready else None
+            except (EOFError, OSError) as e:
+                code = worker.proc.exitcode
+                self._retire(worker, kill=True)
+                worker = None
+                raise ChildProcessError(f"scorer_worker_died:{name}:exitcode={code}") from e
+            if reply is None:
+                self._retire(worker, kill=True)
+                worker = None
+                raise TimeoutError(f"scorer_timeout:{name}:{self.limits.timeout_seconds}s")
+            worker.calls += 1
+            status, payload = reply
+            if status == "fatal":
+                self._retire(worker)
+                worker = None
+                raise MemoryError(f"scorer_out_of_memory:{name}")
+            if status != "ok":
+                raise RuntimeError(f"scorer_failed:{name}:{payload}")
+            return payload
+        finally:
+            if worker is not None and (
+                self.limits.recycle_after and worker.calls >= self.limits.recycle_after
+            ):
+                logger.debug("Recycling scorer worker after %d calls", worker.calls)
+                self._retire(worker)
+                worker = None
+            pool.idle.put(worker)
+
+    def close(self) -> None:
+        """Stop every worker process."""
+        self._pool.close()
+
+    def __enter__(self) -> ScorerSandbox:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -0,0 +1,199 @@
+"""Persistent memoization of scorer results.
+
+Candidate runs often share most predictions with earlier runs, so the same
+``(scorer, expected, predicted)`` triple is scored again and again.
+:class:`ScoreCache` stores ``(score, metadata)`` in a SQLite database keyed by
+a digest of the scorer name and version plus the canonical JSON of expected
+and predicted values, so an unchanged case costs one indexed lookup.
+
+Plugin scorers can declare a ``version`` attribute; bump it whenever scoring
+logic changes so stale entries stop matching::
+
+    def my_scorer(*, expected, predicted, **kw): ...
+    my_scorer.version = "2"
+
+The database is opened lazily per thread and per process (so the cache can be
+handed to thread or process pools), uses WAL journaling for concurrent
+writers, and is trimmed least recently used first once the stored payload
+exceeds ``max_bytes``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from .hashing import canonical_json
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "TOOLKIT_EVAL_SCORE_CACHE_DIR"
+DEFAULT_MAX_BYTES = 1024**3
+_DB_NAME = "scores.sqlite"
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    key TEXT PRIMARY KEY,
+    score REAL NOT NULL,
+    meta TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_access INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_last_access ON scores (last_access);
+CREATE TABLE IF NOT EXISTS totals (id INTEGER PRIMARY KEY CHECK (id = 0), bytes INTEGER NOT NULL);
+INSERT OR IGNORE INTO totals VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS scores_ins AFTER INSERT ON scores
+    BEGIN UPDATE totals SET bytes = bytes + NEW.size WHERE id = 0; END;
+CREATE TRIGGER IF NOT EXISTS scores_del AFTER DELETE ON scores
+    BEGIN UPDATE totals SET bytes = bytes - OLD.size WHERE id = 0; END;
+"""
+
+
+def scorer_version(func: Any) -> str:
+    """Return a scorer's declared ``version`` (or ``__version__``), default ``"0"``."""
+    return str(getattr(func, "version", None) or getattr(func, "__version__", None) or "0")
+
+
+def case_digest(*, expected: Any, predicted: Any) -> str:
+    """Digest of a case's expected and predicted values, shared by all scorers."""
+    h = hashlib.sha256(canonical_json(expected))
+    h.update(b"\0")
+    h.update(canonical_json(predicted))
+    return h.hexdigest()
+
+
+def score_key(*, scorer: str, version: str, case: str, config: Any = None) -> str:
+    """Cache key for one scorer applied to one case digest."""
+    h = hashlib.sha256(f"{scorer}\0{version}\0{case}\0".encode())
+    if config is not None:
+        h.update(canonical_json(config))
+    return h.hexdigest()
+
+
+class ScoreCache:
+    """SQLite-backed, size-bounded LRU cache of ``(score, metadata)`` results.
+
+    Args:
+        cache_dir: Directory holding ``scores.sqlite`` (created if missing).
+        max_bytes: Bound on the stored key + metadata payload.
+    """
+
+    def __init__(self, cache_dir: Path, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must be >= 0, got {max_bytes}")
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+
+    # Connections are per thread and per process; only config is pickled.
+    def __getstate__(self) -> dict[str, Any]:
+        return {"cache_dir": self.cache_dir, "max_bytes": self.max_bytes}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.cache_dir = state["cache_dir"]
+        self.max_bytes = state["max_bytes"]
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        local = self._local
+        conn: sqlite3.Connection | None = getattr(local, "conn", None)
+        if conn is None or getattr(local, "pid", None) != os.getpid():
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.cache_dir / _DB_NAME), timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # Fire the delete trigger for rows replaced by INSERT OR REPLACE.
+            conn.execute("PRAGMA recursive_triggers=ON")
+            conn.executescript(_SCHEMA)
+            local.conn = conn
+            local.pid = os.getpid()
+            local.touched = set()
+            local.writes = []
+        return conn
+
+    def get(self, key: str) -> tuple[float, dict[str, Any]] | None:
+        """Return the cached ``(score, metadata)`` for *key*, or ``None``."""
+        row = self._conn().execute(
+            "SELECT score, meta FROM scores WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        self._local.touched.add(key)
+        return float(row[0]), json.loads(row[1])
+
+    def put(self, key: str, score: float, meta: dict[str, Any]) -> None:
+        """Buffer a result for writing on the next :meth:`commit`.
+
+        Results whose metadata is not JSON-serialisable are silently skipped.
+        """
+        try:
+            meta_json = json.dumps(meta, sort_keys=True)
+        except (TypeError, ValueError):
+            return
+        self._conn()
+        self._local.writes.append((key, float(score), meta_json, len(key) + len(meta_json)))
+
+    def commit(self) -> None:
+        """Write buffered results and access times, then enforce ``max_bytes``."""
+        conn = self._conn()
+        local = self._local
+        if not local.writes and not local.touched:
+            return
+        now = time.time_ns()
+        with conn:
+            if local.writes:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO scores VALUES (?, ?, ?, ?, ?)",
+                    [(k, s, m, size, now) for k, s, m, size in local.writes],
+                )
+            if local.touched:
+                conn.executemany(
+                    "UPDATE scores SET last_access = ? WHERE key = ?",
+                    [(now, k) for k in local.touched],
+                )
+        wrote = bool(local.writes)
+        local.writes = []
+        local.touched = set()
+        if wrote:
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = int(conn.execute("SELECT bytes FROM totals WHERE id = 0").fetchone()[0])
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        removed = 0
+        with conn:
+            rows = conn.execute("SELECT key, size FROM scores ORDER BY last_access, key")
+            victims: list[tuple[str]] = []
+            for key, size in rows:
+                if excess <= 0:
+                    break
+                victims.append((key,))
+                excess -= int(size)
+            conn.executemany("DELETE FROM scores WHERE key = ?", victims)
+            removed = len(victims)
+        logger.debug("Score cache evicted %d entries", removed)
+
+    def __len__(self) -> int:
+        return int(self._conn().execute("SELECT COUNT(*) FROM scores").fetchone()[0])
+
+    @property
+    def total_bytes(self) -> int:
+        """Stored key + metadata payload, as counted against ``max_bytes``."""
+        return int(self._conn().execute("SELECT bytes FROM totals WHERE id = 0").fetchone()[0])
+
+    def close(self) -> None:
+        """Commit pending writes and close this thread's connection."""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            return
+        self.commit()
+        conn.close()
+        self._local.conn = None
@@ -0,0 +1,383 @@
+"""Warm evaluation daemon (``toolkit-eval serve``).
+
+An :class:`EvalServer` keeps parsed suites and plugin scorers resident
+between requests, so repeated ``run`` / ``compare`` invocations from a
+thin client (:class:`.client.EvalClient`, ``run --server``) skip
+interpreter start-up, imports, suite parsing and entry-point loading::
+
+    with EvalServer(port=8765) as server:
+        EvalClient(server.url).run(suite, predictions_path=preds)
+
+Suites are keyed by the same content hash as :class:`.SuiteCache`
+(:func:`.suite_cache_key` of the suite files' SHA-256 digests), so an
+edited suite is reloaded and identical copies at different paths share one
+entry.  The hash is memoised per ``(path, mtime, size)`` so an unchanged
+suite is not re-read at all.  Plugin scorers stay registered for the life
+of the process once loaded.
+
+The daemon speaks JSON over HTTP on loopback.  It has no authentication
+and reads any path a request names, so it refuses to bind a non-loopback
+interface, and answers 403 to requests whose ``Host`` header is not a
+loopback name (a DNS-rebinding web page in a local browser sends its own):
+
+``POST /run``
+    ``{"suite": path, "predictions": {id: prediction} | [{"id", "prediction"}]
+    | "predictions_path": path, "case_ids": [...], "workers", "executor",
+    "batch_size"}`` -> the report ``toolkit-eval run`` would print.
+``POST /compare``
+    ``{"baseline": path | report, "candidate": path | report, "budget":
+    {CompareBudget fields}, "case_diff", "case_tolerance", "max_listed"}``
+    -> the ``toolkit-eval compare`` result.
+``GET /health``
+    Uptime, request counts and resident suites.
+``GET /metrics``
+    The daemon's :class:`.MetricsCollector` in Prometheus text format.
+
+Errors are ``{"error": message}`` with status 400 (bad request), 404 (a
+path that does not exist) or 500.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from .compare import CompareBudget, compare_reports
+from .metrics import MetricsCollector
+from .openmetrics import PROMETHEUS_CONTENT_TYPE, render
+from .pack import load_suite_from_path, suite_file_digests
+from .report import EvalReport, add_run_info
+from .runner import run_suite
+from .suite import EvalSuite
+from .suite_cache import suite_cache_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_MAX_SUITES = 16
+# Largest request body accepted, in bytes.
+MAX_REQUEST_BYTES = 256 * 1024 * 1024
+
+
+def _stat_signature(path: Path) -> tuple[int, ...]:
+    files = [path / "suite.json", path / "cases.jsonl"] if path.is_dir() else [path]
+    signature: list[int] = []
+    for f in files:
+        st = f.stat()
+        signature += [st.st_mtime_ns, st.st_size]
+    return tuple(signature)
+
+
+class SuiteStore:
+    """Parsed suites held in memory, keyed by content hash, LRU-bounded.
+
+    Args:
+        max_suites: Suites kept resident; the least recently used is
+            dropped beyond this.
+    """
+
+    def __init__(self, max_suites: int = DEFAULT_MAX_SUITES) -> None:
+        if max_suites < 1:
+            raise ValueError(f"max_suites must be >= 1, got {max_suites}")
+        self.max_suites = max_suites
+        self.hits = 0
+        self.misses = 0
+        self._suites: OrderedDict[str, EvalSuite] = OrderedDict()
+        self._keys: dict[tuple[str, tuple[int, ...]], str] = {}
+        self._lock = threading.Lock()
+
+    def key(self, path: Path) -> str:
+        """Return the content hash of the suite at *path*, memoised by stat."""
+        memo = (str(path), _stat_signature(path))
+        with self._lock:
+            key = self._keys.get(memo)
+        if key is None:
+            key = suite_cache_key(suite_file_digests(path))
+            with self._lock:
+                self._keys[memo] = key
+        return key
+
+    def get(self, path: Path) -> tuple[str, EvalSuite]:
+        """Return ``(key, suite)`` for *path*, loading it on a miss.
+
+        Raises:
+            FileNotFoundError: If *path* does not exist.
+            ValueError: If *path* is not a suite directory or pack.
+        """
+        key = self.key(path)
+        with self._lock:
+            suite = self._suites.get(key)
+            if suite is not None:
+                self._suites.move_to_end(key)
+                self.hits += 1
+                return key, suite
+            self.misses += 1
+        suite = load_suite_from_path(path)
+        with self._lock:
+            self._suites[key] = suite
+            self._suites.move_to_end(key)
+            while len(self._suites) > self.max_suites:
+                self._suites.popitem(last=False)
+        logger.info("Loaded suite %s (%s) into the daemon", suite.name, key[:12])
+        return key, suite
+
+    def describe(self) -> list[dict[str, Any]]:
+        """Return name, key and case count of each resident suite, oldest first."""
+        with self._lock:
+            return [
+                {"key": key, "name": suite.name, "cases": len(suite.cases)}
+                for key, suite in self._suites.items()
+            ]
+
+
+def _require(request: dict[str, Any], name: str) -> Any:
+    if request.get(name) in (None, ""):
+        raise ValueError(f"missing_field:{name}")
+    return request[name]
+
+
+def _predictions(value: Any) -> dict[str, Any]:
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, list):
+        return {str(row["id"]): row.get("prediction") for row in value}
+    raise ValueError("predictions must be an object or a list of {id, prediction} rows")
+
+
+def _report(value: Any) -> EvalReport:
+    if isinstance(value, dict):
+        return EvalReport.from_dict(value, columnar=True)
+    return EvalReport.load(Path(value), columnar=True)
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _host_is_loopback(header: str | None) -> bool:
+    """Whether a ``Host`` header (``name``, ``name:port``, ``[v6]:port``) is loopback."""
+    if not header:
+        return False
+    if header.startswith("["):
+        name = header[1:].partition("]")[0]
+    else:
+        name = header.rpartition(":")[0] if header.count(":") == 1 else header
+    return _is_loopback(name)
+
+
+class EvalServer:
+    """Serve ``run`` and ``compare`` requests from a warm process.
+
+    Args:
+        host: Loopback interface to bind.
+        port: TCP port; ``0`` picks a free one (see :attr:`port`).
+        max_suites: Parsed suites kept resident (see :class:`SuiteStore`).
+        workers: Default scoring workers for ``/run`` requests.
+        executor: Default pool kind for ``/run`` requests.
+
+    Raises:
+        ValueError: If *host* is not a loopback address.
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        max_suites: int = DEFAULT_MAX_SUITES,
+        workers: int = 1,
+        executor: str = "thread",
+    ) -> None:
+        if not _is_loopback(host):
+            raise ValueError(
+                f"refusing to serve on non-loopback host {host!r}: the daemon has no "
+                "authentication and reads any path a request names"
+            )
+        self.suites = SuiteStore(max_suites)
+        self.collector = MetricsCollector()
+        self.workers = workers
+        self.executor = executor
+        self._started = time.monotonic()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        """The bound TCP port."""
+        return int(self._httpd.server_address[1])
+
+    @property
+    def url(self) -> str:
+        """Base URL clients connect to."""
+        return f"http://{self._httpd.server_address[0]}:{self.port}"
+
+    def run(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Handle a ``/run`` request; returns the enriched report object."""
+        suite_path = Path(_require(request, "suite"))
+        key, suite = self.suites.get(suite_path)
+        if request.get("case_ids"):
+            suite = suite.select([str(i) for i in request["case_ids"]])
+        path = request.get("predictions_path")
+        predictions = request.get("predictions")
+        workers = int(request.get("workers") or self.workers)
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        batch_size = request.get("batch_size")
+        start = time.monotonic()
+        report = run_suite(
+            suite=suite,
+            predictions_path=Path(path) if path else None,
+            predictions=_predictions(predictions) if predictions is not None else None,
+            workers=workers,
+            executor=str(request.get("executor") or self.executor),
+            batch_size=int(batch_size) if batch_size is not None else None,
+            collector=self.collector,
+        )
+        result = add_run_info(report.to_dict(), elapsed=time.monotonic() - start)
+        result["metadata"]["suite_key"] = key
+        return result
+
+    def compare(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Handle a ``/compare`` request; returns the comparison result."""
+        budget = request.get("budget") or {}
+        if not isinstance(budget, dict):
+            raise ValueError("budget must be an object")
+        try:
+            compare_budget = CompareBudget(**budget)
+        except TypeError as e:
+            raise ValueError(f"invalid_budget:{e}") from e
+        max_listed = request.get("max_listed")
+        return compare_reports(
+            baseline=_report(_require(request, "baseline")),
+            candidate=_report(_require(request, "candidate")),
+            budget=compare_budget,
+            case_diff=bool(request.get("case_diff", False)),
+            case_tolerance=float(request.get("case_tolerance", 0.0)),
+            max_listed=int(max_listed) if max_listed is not None else None,
+        )
+
+    def health(self) -> dict[str, Any]:
+        """Return uptime, request counts and the resident suites."""
+        counters = self.collector.snapshot().get("counters", {})
+        return {
+            "status": "ok",
+            "uptime_seconds": round(time.monotonic() - self._started, 3),
+            "requests": {
+                name[len("server.requests."):]: count
+                for name, count in sorted(counters.items())
+                if name.startswith("server.requests.")
+            },
+            "suite_hits": self.suites.hits,
+            "suite_misses": self.suites.misses,
+            "suites": self.suites.describe(),
+        }
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+        routes = {"/run": server.run, "/compare": server.compare}
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send(self, status: int, body: bytes, content_type: str) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _json(self, status: int, obj: Any) -> None:
+                self._send(status, json.dumps(obj).encode("utf-8"), "application/json")
+
+            def _host_allowed(self) -> bool:
+                host = self.headers.get("Host")
+                if _host_is_loopback(host):
+                    return True
+                logger.warning("Rejected request with non-loopback Host header %r", host)
+                self._json(403, {"error": f"forbidden_host:{host}"})
+                return False
+
+            def do_GET(self) -> None:  # noqa: N802 -- http.server API
+                if not self._host_allowed():
+                    return
+                path = self.path.split("?", 1)[0]
+                if path == "/health":
+                    self._json(200, server.health())
+                elif path == "/metrics":
+                    body = render(server.collector).encode("utf-8")
+                    self._send(200, body, PROMETHEUS_CONTENT_TYPE)
+                else:
+                    self._json(404, {"error": f"unknown_endpoint:{path}"})
+
+            def do_POST(self) -> None:  # noqa: N802 -- http.server API
+                if not self._host_allowed():
+                    return
+                path = self.path.split("?", 1)[0]
+                handle = routes.get(path)
+                if handle is None:
+                    self._json(404, {"error": f"unknown_endpoint:{path}"})
+                    return
+                server.collector.increment(f"server.requests.{path[1:]}")
+                try:
+                    length = int(self.headers.get("Content-Length") or 0)
+                    if length > MAX_REQUEST_BYTES:
+                        raise ValueError(f"request_too_large:{length}")
+                    request = json.loads(self.rfile.read(length) or b"{}")
+                    if not isinstance(request, dict):
+                        raise ValueError("request body must be a JSON object")
+                    with server.collector.timer(f"server.{path[1:]}"):
+                        result = handle(request)
+                except FileNotFoundError as e:
+                    self._json(404, {"error": f"not_found:{e.filename or e}"})
+                except (ValueError, KeyError, TypeError) as e:
+                    self._json(400, {"error": str(e.args[0] if e.args else e)})
+                except Exception as e:
+                    logger.exception("%s request failed", path)
+                    self._json(500, {"error": f"{type(e).__name__}: {e}"})
+                else:
+                    self._json(200, result)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug("eval daemon: " + format, *args)
+
+        return Handler
+
+    def start(self) -> EvalServer:
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="toolkit-eval-serve", daemon=True
+        )
+        self._thread.start()
+        logger.info("Serving evaluations on %s", self.url)
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread until interrupted."""
+        logger.info("Serving evaluations on %s", self.url)
+        self._httpd.serve_forever()
+
+    def close(self) -> None:
+        """Stop serving and release the port."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> EvalServer:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
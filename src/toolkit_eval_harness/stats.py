@@ -0,0 +1,137 @@
+"""Paired bootstrap statistics for report comparisons.
+
+Given per-case baseline and candidate scores of the same cases,
+:func:`paired_bootstrap` resamples cases with replacement to estimate a
+confidence interval for the mean score change and a two-sided p-value for
+"no change".  Resampling is vectorised with NumPy when it is installed
+(``pip install toolkit-eval-harness[stats]``) and falls back to the standard
+library otherwise; both are deterministic for a given seed, but the two
+backends draw different samples.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import random
+from collections.abc import Sequence
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy  # noqa: F401
+
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+# Resample indices drawn per NumPy batch; bounds peak memory to ~128 MB.
+_NUMPY_BATCH_ELEMENTS = 8_000_000
+# Above this many distinct deltas, resample case indices instead of counts.
+_MAX_MULTINOMIAL_VALUES = 256
+
+
+def _resampled_means_numpy(deltas: Sequence[float], resamples: int, seed: int) -> list[float]:
+    import numpy as np
+
+    values = np.asarray(deltas, dtype=np.float64)
+    n = len(values)
+    rng = np.random.default_rng(seed)
+    uniques, counts = np.unique(values, return_counts=True)
+    if len(uniques) <= _MAX_MULTINOMIAL_VALUES:
+        # Eval scores are usually discrete (0/1, a few partial-credit levels):
+        # drawing n cases with replacement is then a multinomial over the
+        # distinct deltas, O(distinct) per resample instead of O(n).
+        draws = rng.multinomial(n, counts / n, size=resamples)
+        return (draws @ uniques / n).tolist()
+    rows = max(1, _NUMPY_BATCH_ELEMENTS // n)
+    means = np.empty(resamples, dtype=np.float64)
+    for start in range(0, resamples, rows):
+        stop = min(resamples, start + rows)
+        idx = rng.integers(0, n, size=(stop - start, n), dtype=np.int64)
+        means[start:stop] = values[idx].mean(axis=1)
+    return means.tolist()
+
+
+def _resampled_means_python(deltas: Sequence[float], resamples: int, seed: int) -> list[float]:
+    values = list(deltas)
+    n = len(values)
+    # Bootstrap resampling, not crypto.
+    rng = random.Random(seed)  # nosec B311
+    return [math.fsum(rng.choices(values, k=n)) / n for _ in range(resamples)]
+
+
+def _quantile(sorted_values: Sequence[float], q: float) -> float:
+    """Linear-interpolated quantile of an ascending sequence."""
+    pos = q * (len(sorted_values) - 1)
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def paired_bootstrap(
+    baseline: Sequence[float],
+    candidate: Sequence[float],
+    *,
+    resamples: int = 10_000,
+    seed: int = 0,
+    confidence: float = 0.95,
+    use_numpy: bool | None = None,
+) -> dict[str, Any]:
+    """Bootstrap the mean per-case score change ``candidate - baseline``.
+
+    Args:
+        baseline: Baseline scores, one per case.
+        candidate: Candidate scores for the same cases, in the same order.
+        resamples: Number of bootstrap resamples.
+        seed: RNG seed.
+        confidence: Two-sided confidence level of the interval.
+        use_numpy: Force (``True``) or disable (``False``) the NumPy backend;
+            defaults to NumPy when installed.
+
+    Returns:
+        ``cases``, ``mean_delta``, ``ci_low``/``ci_high`` for the mean delta,
+        the two-sided ``p_value`` against zero change, and the ``backend``.
+
+    Raises:
+        ValueError: On mismatched lengths, no cases, or invalid parameters.
+        RuntimeError: If ``use_numpy=True`` but NumPy is not installed.
+    """
+    if len(baseline) != len(candidate):
+        raise ValueError(f"length mismatch: {len(baseline)} != {len(candidate)}")
+    if not baseline:
+        raise ValueError("paired_bootstrap needs at least one paired case")
+    if resamples < 1:
+        raise ValueError(f"resamples must be >= 1, got {resamples}")
+    if not 0.0 < confidence < 1.0:
+        raise ValueError(f"confidence must be in (0, 1), got {confidence}")
+    if use_numpy and not _HAS_NUMPY:
+        raise RuntimeError("missing_optional_dep:stats:numpy")
+    numpy_backend = _HAS_NUMPY if use_numpy is None else use_numpy
+
+    deltas = [c - b for b, c in zip(baseline, candidate, strict=True)]
+    n = len(deltas)
+    observed = math.fsum(deltas) / n
+    if numpy_backend:
+        means = _resampled_means_numpy(deltas, resamples, seed)
+    else:
+        means = _resampled_means_python(deltas, resamples, seed)
+    means.sort()
+
+    alpha = 1.0 - confidence
+    # Shifting the bootstrap distribution to mean zero gives the null distribution.
+    extreme = sum(1 for m in means if abs(m - observed) >= abs(observed) - 1e-12)
+    result = {
+        "cases": n,
+        "resamples": resamples,
+        "seed": seed,
+        "confidence": confidence,
+        "mean_delta": observed,
+        "ci_low": _quantile(means, alpha / 2),
+        "ci_high": _quantile(means, 1 - alpha / 2),
+        "p_value": (extreme + 1) / (resamples + 1),
+        "backend": "numpy" if numpy_backend else "python",
+    }
+    logger.debug("Paired bootstrap: %s", result)
+    return result
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import logging
+import mmap
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any
+from typing import Any, overload
+
+from .io import jsonl_line_id
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -21,7 +29,28 @@ class EvalSuite:
     description: str
     created_at: str
     scoring: dict[str, Any]
-    cases: list[EvalCase]
+    cases: Sequence[EvalCase]
+
+    def select(self, ids: Iterable[str]) -> EvalSuite:
+        """Return a copy of this suite restricted to *ids*, in the given order.
+
+        Uses the O(1) id index of a :class:`LazyCaseList`, so only the selected
+        cases are decoded.
+
+        Raises:
+            KeyError: If an id is not part of the suite.
+        """
+        if isinstance(self.cases, LazyCaseList):
+            lookup = self.cases.get
+        else:
+            lookup = {case.id: case for case in self.cases}.get
+        selected: list[EvalCase] = []
+        for case_id in ids:
+            case = lookup(case_id)
+            if case is None:
+                raise KeyError(f"Case '{case_id}' not found in suite '{self.name}'.")
+            selected.append(case)
+        return replace(self, cases=selected)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -34,32 +63,139 @@ class EvalSuite:
         }
 
 
-def read_suite_dir(suite_dir: Path) -> EvalSuite:
-    meta = json.loads((suite_dir / "suite.json").read_text(encoding="utf-8"))
-    schema_version = int(meta.get("schema_version", 1))
-    name = str(meta.get("name", "unnamed"))
-    description = str(meta.get("description", ""))
-    created_at = str(meta.get("created_at", ""))
-    scoring = dict(meta.get("scoring") or {})
-
-    cases: list[EvalCase] = []
-    for line in (suite_dir / "cases.jsonl").read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        obj = json.loads(line)
-        cases.append(
-            EvalCase(
-                id=str(obj["id"]),
-                input=obj.get("input"),
-                expected=obj.get("expected"),
-                tags=[str(x) for x in obj.get("tags", [])],
-            )
-        )
+def suite_from_parts(meta: dict[str, Any], cases: Iterable[EvalCase]) -> EvalSuite:
+    """Build an :class:`EvalSuite` from parsed ``suite.json`` metadata and cases."""
     return EvalSuite(
-        schema_version=schema_version,
-        name=name,
-        description=description,
-        created_at=created_at,
-        scoring=scoring,
-        cases=cases,
+        schema_version=int(meta.get("schema_version", 1)),
+        name=str(meta.get("name", "unnamed")),
+        description=str(meta.get("description", "")),
+        created_at=str(meta.get("created_at", "")),
+        scoring=dict(meta.get("scoring") or {}),
+        cases=cases if isinstance(cases, LazyCaseList) else list(cases),
+    )
+
+
+def case_from_obj(obj: dict[str, Any]) -> EvalCase:
+    """Build an :class:`EvalCase` from one parsed ``cases.jsonl`` record."""
+    return EvalCase(
+        id=str(obj["id"]),
+        input=obj.get("input"),
+        expected=obj.get("expected"),
+        tags=[str(x) for x in obj.get("tags", [])],
     )
+
+
+def iter_cases(lines: Iterable[str | bytes]) -> Iterator[EvalCase]:
+    """Parse ``cases.jsonl`` lines lazily, skipping blank lines."""
+    for line in lines:
+        if not line.strip():
+            continue
+        yield case_from_obj(json.loads(line))
+
+
+def read_suite_dir(suite_dir: Path) -> EvalSuite:
+    meta = json.loads((suite_dir / "suite.json").read_text(encoding="utf-8"))
+    with (suite_dir / "cases.jsonl").open("r", encoding="utf-8") as f:
+        return suite_from_parts(meta, iter_cases(f))
+
+
+class LazyCaseList(Sequence[EvalCase]):
+    """Read-only, memory-mapped view of a ``cases.jsonl`` file.
+
+    The file is scanned once to build a byte-offset index keyed by case id;
+    :class:`EvalCase` objects are decoded from the mapping only when accessed,
+    so ``input``/``expected`` payloads that are never touched are never
+    parsed.  Indexing by position and :meth:`get` by id are both O(1).
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file = path.open("rb")
+        self._map: mmap.mmap | None = None
+        self._starts = array("q")
+        self._ends = array("q")
+        self._ids: list[str] = []
+        self._positions: dict[str, int] = {}
+        if path.stat().st_size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._build_index(self._map)
+        logger.debug("Indexed %d cases in %s", len(self._ids), path)
+
+    def _build_index(self, mm: mmap.mmap) -> None:
+        pos, size = 0, len(mm)
+        while pos < size:
+            nl = mm.find(b"\n", pos)
+            end = size if nl == -1 else nl
+            line = mm[pos:end]
+            if line.strip():
+                case_id = jsonl_line_id(line)
+                # Last duplicate wins for id lookups; positional access keeps all.
+                self._positions[case_id] = len(self._ids)
+                self._ids.append(case_id)
+                self._starts.append(pos)
+                self._ends.append(end)
+            pos = end + 1
+
+    @property
+    def ids(self) -> list[str]:
+        """Case ids in file order (no payloads decoded)."""
+        return list(self._ids)
+
+    def _decode(self, i: int) -> EvalCase:
+        mm = self._map
+        if mm is None:
+            raise ValueError(f"LazyCaseList for {self.path} is closed")
+        return case_from_obj(json.loads(mm[self._starts[i] : self._ends[i]]))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @overload
+    def __getitem__(self, index: int) -> EvalCase: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[EvalCase]: ...
+
+    def __getitem__(self, index: int | slice) -> EvalCase | list[EvalCase]:
+        if isinstance(index, slice):
+            return [self._decode(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("case index out of range")
+        return self._decode(index)
+
+    def __iter__(self) -> Iterator[EvalCase]:
+        for i in range(len(self)):
+            yield self._decode(i)
+
+    def get(self, case_id: str) -> EvalCase | None:
+        """Return the case with *case_id*, or ``None`` if absent."""
+        i = self._positions.get(case_id)
+        return None if i is None else self._decode(i)
+
+    def __contains__(self, value: object) -> bool:
+        if isinstance(value, str):
+            return value in self._positions
+        return isinstance(value, EvalCase) and self.get(value.id) == value
+
+    def close(self) -> None:
+        """Release the memory mapping and file handle."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+        self._ids.clear()
+        self._positions.clear()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (LazyCaseList, (self.path,))
+
+    def __repr__(self) -> str:
+        return f"LazyCaseList(path={str(self.path)!r}, cases={len(self)})"
+
+
+def open_suite_lazy(suite_dir: Path) -> EvalSuite:
+    """Open a suite directory with a memory-mapped :class:`LazyCaseList` backend."""
+    meta = json.loads((suite_dir / "suite.json").read_text(encoding="utf-8"))
+    return suite_from_parts(meta, LazyCaseList(suite_dir / "cases.jsonl"))
@@ -0,0 +1,214 @@
+"""Content-addressed on-disk cache of parsed suites.
+
+Parsing ``cases.jsonl`` into :class:`~.suite.EvalCase` objects dominates load
+time for large suites.  :class:`SuiteCache` stores the parsed
+:class:`~.suite.EvalSuite` as one compact JSON document (cases as
+``[id, input, expected, tags]`` rows) keyed by the SHA-256 digests of
+``suite.json`` and ``cases.jsonl`` -- the same digests recorded in a pack's
+``manifest.json`` -- so an unchanged suite is loaded with a single
+``json.loads`` instead of a per-line parse and validation.
+
+The cache directory can be shared by concurrent processes: entries are
+written to a temp file and atomically renamed into place, and readers treat a
+missing or unreadable entry as a miss.  Entries are evicted least recently
+used first (access time tracked via file mtime) once the directory exceeds
+``max_bytes``.
+
+Entries are plain data, never unpickled, so a shared or tampered cache
+directory can at worst yield a wrong suite, not run code.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from .suite import EvalCase, EvalSuite
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "TOOLKIT_EVAL_SUITE_CACHE_DIR"
+DEFAULT_MAX_BYTES = 4 * 1024**3
+_FORMAT_VERSION = 2
+_SUFFIX = ".suite.json"
+# Entries of format 1 (pickles); never read, removed on the next eviction pass.
+_LEGACY_SUFFIX = ".suite.pkl"
+
+
+def default_cache_dir() -> Path:
+    """Return ``$TOOLKIT_EVAL_SUITE_CACHE_DIR``, else the per-user XDG cache location."""
+    env = os.environ.get(CACHE_DIR_ENV)
+    if env:
+        return Path(env)
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "toolkit-eval-harness" / "suites"
+
+
+def _encode(suite: EvalSuite) -> bytes:
+    doc = {
+        "format": _FORMAT_VERSION,
+        "schema_version": suite.schema_version,
+        "name": suite.name,
+        "description": suite.description,
+        "created_at": suite.created_at,
+        "scoring": suite.scoring,
+        "cases": [[c.id, c.input, c.expected, c.tags] for c in suite.cases],
+    }
+    return json.dumps(doc, separators=(",", ":")).encode("utf-8")
+
+
+def _decode(payload: bytes) -> EvalSuite | None:
+    """Rebuild a suite from :func:`_encode` output; ``None`` for another format.
+
+    Raises:
+        ValueError, KeyError, TypeError: If the payload is malformed.
+    """
+    doc: dict[str, Any] = json.loads(payload)
+    if doc.get("format") != _FORMAT_VERSION:
+        return None
+    return EvalSuite(
+        schema_version=int(doc["schema_version"]),
+        name=str(doc["name"]),
+        description=str(doc["description"]),
+        created_at=str(doc["created_at"]),
+        scoring=dict(doc["scoring"]),
+        cases=[
+            EvalCase(id=str(case_id), input=inp, expected=expected, tags=list(tags))
+            for case_id, inp, expected, tags in doc["cases"]
+        ],
+    )
+
+
+def suite_cache_key(file_digests: dict[str, str]) -> str:
+    """Derive a cache key from per-file SHA-256 digests (``{"suite.json": ..., ...}``)."""
+    h = hashlib.sha256(f"toolkit-eval-suite-cache:{_FORMAT_VERSION}".encode())
+    for name in sorted(file_digests):
+        h.update(f"\n{name}={file_digests[name]}".encode())
+    return h.hexdigest()
+
+
+class SuiteCache:
+    """LRU, size-bounded cache of parsed suites keyed by content digest.
+
+    Args:
+        cache_dir: Directory holding cache entries (created on first write).
+            Defaults to :func:`default_cache_dir`.
+        max_bytes: Upper bound on the total size of all entries.
+    """
+
+    def __init__(
+        self, cache_dir: Path | None = None, *, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must be >= 0, got {max_bytes}")
+        self.cache_dir = cache_dir if cache_dir is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _entry(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{_SUFFIX}"
+
+    def get(self, key: str) -> EvalSuite | None:
+        """Return the cached suite for *key*, or ``None`` on a miss."""
+        entry = self._entry(key)
+        try:
+            suite = _decode(entry.read_bytes())
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError, TypeError):  # corrupt/truncated entry
+            logger.warning("Discarding unreadable suite cache entry %s", entry, exc_info=True)
+            self._discard(entry)
+            self.misses += 1
+            return None
+        if suite is None:
+            self._discard(entry)
+            self.misses += 1
+            return None
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        self.hits += 1
+        logger.debug("Suite cache hit: %s", key)
+        return suite
+
+    def put(self, key: str, suite: EvalSuite) -> None:
+        """Store *suite* under *key*, then evict old entries beyond ``max_bytes``."""
+        payload = _encode(suite)
+        if len(payload) > self.max_bytes:
+            logger.debug("Suite too large for cache (%d bytes), not storing", len(payload))
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-", suffix=_SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, self._entry(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        logger.debug("Suite cache store: %s (%d bytes)", key, len(payload))
+        self.evict(keep=key)
+
+    def get_or_load(self, key: str, loader: Callable[[], EvalSuite]) -> EvalSuite:
+        """Return the cached suite for *key*, calling *loader* and storing on a miss."""
+        suite = self.get(key)
+        if suite is None:
+            suite = loader()
+            try:
+                self.put(key, suite)
+            except (OSError, ValueError) as e:
+                logger.warning("Could not write suite cache entry: %s", e)
+        return suite
+
+    def evict(self, *, keep: str | None = None) -> int:
+        """Delete least recently used entries until under ``max_bytes``.
+
+        Returns:
+            Number of entries removed.
+        """
+        entries: list[tuple[float, int, Path]] = []
+        try:
+            paths = list(self.cache_dir.glob(f"*{_SUFFIX}"))
+            legacy = list(self.cache_dir.glob(f"*{_LEGACY_SUFFIX}"))
+        except OSError:
+            return 0
+        for p in legacy:
+            self._discard(p)
+        for p in paths:
+            if p.name.startswith(".tmp-"):
+                continue
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+        total = sum(size for _, size, _ in entries)
+        removed = len(legacy)
+        keep_name = f"{keep}{_SUFFIX}" if keep else None
+        for _, size, p in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            if p.name == keep_name:
+                continue
+            self._discard(p)
+            total -= size
+            removed += 1
+        if removed:
+            logger.debug("Suite cache evicted %d entries", removed)
+        return removed
+
+    @staticmethod
+    def _discard(entry: Path) -> None:
+        try:
+            entry.unlink()
+        except OSError:
+            pass
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
 SRC = Path(__file__).resolve().parents[1] / "src"
 sys.path.insert(0, str(SRC))
+
+# Keep the suite from writing the entry-point cache under ~/.cache; tests that
+# exercise the cache point it at a temporary path.
+os.environ.setdefault("TOOLKIT_EVAL_ENTRY_POINT_CACHE", "")
@@ -0,0 +1,255 @@
+"""Tests for the asyncio run API and async plugin scorers."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from toolkit_eval_harness.metrics import MetricsCollector
+from toolkit_eval_harness.plugins import (
+    _reset_registry,
+    batch_scorer,
+    is_async_scorer,
+    register_scorer,
+)
+from toolkit_eval_harness.runner import arun_suite, run_suite
+from toolkit_eval_harness.score_cache import ScoreCache
+from toolkit_eval_harness.suite import EvalCase, EvalSuite
+
+IN_FLIGHT = {"now": 0, "max": 0}
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry() -> Any:
+    _reset_registry()
+    IN_FLIGHT.update(now=0, max=0)
+    yield
+    _reset_registry()
+
+
+async def _remote(*, expected: Any, predicted: Any, **kw: Any) -> tuple[float, dict[str, Any]]:
+    IN_FLIGHT["now"] += 1
+    IN_FLIGHT["max"] = max(IN_FLIGHT["max"], IN_FLIGHT["now"])
+    await asyncio.sleep(0.01)
+    IN_FLIGHT["now"] -= 1
+    return (0.75 if predicted is not None else 0.0), {"remote": True}
+
+
+@batch_scorer
+async def _remote_batch(
+    *, expected: list[Any], predicted: list[Any], **kw: Any
+) -> list[tuple[float, dict[str, Any]]]:
+    await asyncio.sleep(0)
+    return [(0.5, {"batch": len(predicted)}) for _ in predicted]
+
+
+def _local(*, expected: Any, predicted: Any, **kw: Any) -> tuple[float, dict[str, Any]]:
+    return 0.25, {}
+
+
+def _suite(n: int, scorers: list[str]) -> EvalSuite:
+    return EvalSuite(
+        schema_version=1,
+        name="async",
+        description="",
+        created_at="",
+        scoring={"scorers": scorers},
+        cases=[EvalCase(id=f"c{i}", input=None, expected=i, tags=["t"]) for i in range(n)],
+    )
+
+
+async def _stream(
+    pairs: list[tuple[str, Any]], log: list[str] | None = None
+) -> AsyncIterator[tuple[str, Any]]:
+    for case_id, prediction in pairs:
+        await asyncio.sleep(0)
+        if log is not None:
+            log.append("produced")
+        yield case_id, prediction
+
+
+def test_async_scorers_detected_at_registration() -> None:
+    class Scorer:
+        async def __call__(self, *, expected: Any, predicted: Any) -> tuple[float, dict]:
+            return 1.0, {}
+
+    register_scorer("remote", _remote)
+    register_scorer("object", Scorer())
+    register_scorer("local", _local)
+    assert is_async_scorer("remote") and is_async_scorer("object")
+    assert not is_async_scorer("local")
+
+
+def test_arun_matches_run_suite_with_mixed_scorers() -> None:
+    register_scorer("remote", _remote)
+    register_scorer("remote_batch", _remote_batch)
+    register_scorer("local", _local)
+    suite = _suite(10, ["local", "remote", "remote_batch"])
+    pairs = [(f"c{i}", i if i % 3 else None) for i in reversed(range(10))]
+    report = asyncio.run(arun_suite(suite=suite, predictions=_stream(pairs), batch_size=4))
+    # The synchronous runner drives async scorers with asyncio.run.
+    expected = run_suite(suite=suite, predictions=dict(pairs), batch_size=4)
+    assert [c["id"] for c in report.cases] == [f"c{i}" for i in range(10)]
+    for got, want in zip(report.cases, expected.cases, strict=True):
+        assert list(got["plugins"]) == ["local", "remote", "remote_batch"]
+        assert got["score"] == want["score"]
+        assert got["plugins"]["remote"] == want["plugins"]["remote"]
+    assert report.summary["score"] == expected.summary["score"]
+    assert report.summary["by_tag"]["t"]["cases"] == 10
+
+
+def test_concurrency_limits_in_flight_scorer_calls() -> None:
+    register_scorer("remote", _remote)
+    pairs = [(f"c{i}", i) for i in range(12)]
+    collector = MetricsCollector()
+    report = asyncio.run(
+        arun_suite(
+            suite=_suite(12, ["remote"]),
+            predictions=_stream(pairs),
+            concurrency=3,
+            batch_size=1,
+            collector=collector,
+        )
+    )
+    assert report.summary["cases"] == 12
+    assert IN_FLIGHT["max"] == 3
+    assert collector.get_histogram("scorer.remote").count == 12  # type: ignore[union-attr]
+
+
+def test_backpressure_bounds_predictions_read_ahead() -> None:
+    register_scorer("remote", _remote)
+    log: list[str] = []
+    lead: list[int] = []
+
+    def sink(result: dict[str, Any]) -> None:
+        log.append("scored")
+        lead.append(log.count("produced") - log.count("scored"))
+
+    report = asyncio.run(
+        arun_suite(
+            suite=_suite(20, ["remote"]),
+            predictions=_stream([(f"c{i}", i) for i in range(20)], log),
+            concurrency=1,
+            max_pending=2,
+            batch_size=1,
+            case_sink=sink,
+        )
+    )
+    assert report.summary["cases"] == 20
+    assert report.cases == []
+    # At most max_pending queued, one being scored and one blocked in put().
+    assert max(lead) <= 4
+
+
+def test_unknown_repeated_and_missing_predictions() -> None:
+    pairs = [("c0", 0), ("zz", 1), ("c0", 5), ("c2", 2)]
+    report = asyncio.run(arun_suite(suite=_suite(3, []), predictions=_stream(pairs)))
+    assert [c["score"] for c in report.cases] == [1.0, 0.0, 1.0]
+    assert report.summary["cases"] == 3
+
+
+def test_async_scorer_errors_are_recorded() -> None:
+    async def broken(*, expected: Any, predicted: Any) -> tuple[float, dict[str, Any]]:
+        raise asyncio.TimeoutError
+
+    register_scorer("broken", broken)
+    report = asyncio.run(
+        arun_suite(suite=_suite(2, ["broken"]), predictions=_stream([("c0", 0), ("c1", 1)]))
+    )
+    assert report.cases[0]["plugins"]["broken"] == {"score": 0.0, "error": "timeout"}
+    assert report.cases[0]["score"] == 1.0
+
+
+def test_malformed_async_batch_element_marks_batch_failed() -> None:
+    @batch_scorer
+    async def bare_floats(*, expected: list[Any], predicted: list[Any], **kw: Any) -> list[Any]:
+        return [1.0 for _ in predicted]
+
+    register_scorer("bare_floats", bare_floats)
+    pairs = [(f"c{i}", i) for i in range(3)]
+    report = asyncio.run(arun_suite(suite=_suite(3, ["bare_floats"]), predictions=_stream(pairs)))
+    for case in report.cases:
+        assert case["plugins"]["bare_floats"] == {"score": 0.0, "error": True}
+
+
+def test_sync_and_async_scorers_run_concurrently() -> None:
+    started = threading.Event()
+
+    def sync_side(*, expected: Any, predicted: Any, **kw: Any) -> tuple[float, dict[str, Any]]:
+        started.set()
+        return 0.0, {}
+
+    async def async_side(*, expected: Any, predicted: Any, **kw: Any) -> tuple[float, dict]:
+        # Only succeeds if the sync half starts while this is still pending.
+        for _ in range(200):
+            if started.is_set():
+                return 0.5, {}
+            await asyncio.sleep(0.01)
+        return 0.0, {}
+
+    register_scorer("sync_side", sync_side)
+    register_scorer("async_side", async_side)
+    report = asyncio.run(
+        arun_suite(
+            suite=_suite(1, ["async_side", "sync_side"]), predictions=_stream([("c0", None)])
+        )
+    )
+    assert report.cases[0]["plugins"]["async_side"] == {"score": 0.5}
+
+
+def test_score_cache_io_runs_off_the_event_loop(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    threads: set[int] = set()
+    get, commit = ScoreCache.get, ScoreCache.commit
+
+    def record_get(self: ScoreCache, key: str) -> Any:
+        threads.add(threading.get_ident())
+        return get(self, key)
+
+    def record_commit(self: ScoreCache) -> None:
+        threads.add(threading.get_ident())
+        commit(self)
+
+    monkeypatch.setattr(ScoreCache, "get", record_get)
+    monkeypatch.setattr(ScoreCache, "commit", record_commit)
+    register_scorer("remote", _remote)
+    cache = ScoreCache(tmp_path)
+    pairs = [(f"c{i}", i) for i in range(4)]
+    collectors = [MetricsCollector(), MetricsCollector()]
+    for collector in collectors:
+        report = asyncio.run(
+            arun_suite(
+                suite=_suite(4, ["remote"]),
+                predictions=_stream(pairs),
+                score_cache=cache,
+                collector=collector,
+            )
+        )
+        assert report.cases[0]["plugins"]["remote"] == {"score": 0.75, "remote": True}
+    # Built-in exact_match is memoized too.
+    assert collectors[1].get_counter("score_cache.hits") == 8
+    assert collectors[1].get_counter("score_cache.misses") == 0
+    assert threads and threading.get_ident() not in threads
+
+
+def test_run_suite_inside_running_loop() -> None:
+    register_scorer("remote", _remote)
+
+    async def call() -> Any:
+        return run_suite(suite=_suite(2, ["remote"]), predictions={"c0": 0, "c1": 1})
+
+    report = asyncio.run(call())
+    assert [c["plugins"]["remote"] for c in report.cases] == [
+        {"score": 0.75, "remote": True}
+    ] * 2
+
+
+def test_invalid_limits_rejected() -> None:
+    with pytest.raises(ValueError, match="concurrency"):
+        asyncio.run(arun_suite(suite=_suite(1, []), predictions=_stream([]), concurrency=0))
@@ -0,0 +1,180 @@
+"""Tests for batch plugin scorers."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from toolkit_eval_harness.cli import EXIT_SUCCESS, main
+from toolkit_eval_harness.plugins import (
+    _reset_registry,
+    batch_scorer,
+    is_batch_scorer,
+    register_scorer,
+    unregister_scorer,
+)
+from toolkit_eval_harness.runner import run_suite
+from toolkit_eval_harness.score_cache import ScoreCache
+from toolkit_eval_harness.suite import EvalCase, EvalSuite
+
+BATCHES: list[int] = []
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry() -> Any:
+    _reset_registry()
+    BATCHES.clear()
+    yield
+    _reset_registry()
+
+
+@batch_scorer
+def _overlap(
+    *, expected: list[Any], predicted: list[Any], **kwargs: Any
+) -> list[tuple[float, dict[str, Any]]]:
+    BATCHES.append(len(expected))
+    return [(0.5 if p else 0.0, {"batch": len(expected)}) for p in predicted]
+
+
+def _per_case(*, expected: Any, predicted: Any, **kwargs: Any) -> tuple[float, dict[str, Any]]:
+    return 0.25, {}
+
+
+def _suite(n: int, scorers: list[str]) -> EvalSuite:
+    return EvalSuite(
+        schema_version=1,
+        name="batch",
+        description="",
+        created_at="",
+        scoring={"scorers": scorers},
+        cases=[EvalCase(id=f"c{i:03d}", input=None, expected=i, tags=[]) for i in range(n)],
+    )
+
+
+def _preds(tmp_path: Path, n: int) -> Path:
+    path = tmp_path / "p.jsonl"
+    path.write_text(
+        "".join(json.dumps({"id": f"c{i:03d}", "prediction": f"p{i}"}) + "\n" for i in range(n)),
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_registration_flag() -> None:
+    register_scorer("overlap", _overlap)
+    register_scorer("plain", _per_case)
+    register_scorer("forced", _per_case, batch=True)
+    assert is_batch_scorer("overlap")
+    assert not is_batch_scorer("plain")
+    assert is_batch_scorer("forced")
+    unregister_scorer("overlap")
+    assert not is_batch_scorer("overlap")
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_batches_respect_batch_size_and_order(tmp_path: Path, workers: int) -> None:
+    register_scorer("overlap", _overlap)
+    register_scorer("plain", _per_case)
+    report = run_suite(
+        suite=_suite(10, ["plain", "overlap"]),
+        predictions_path=_preds(tmp_path, 10),
+        workers=workers,
+        batch_size=4,
+    )
+    assert sorted(BATCHES) == [2, 4, 4]
+    assert [c["id"] for c in report.cases] == [f"c{i:03d}" for i in range(10)]
+    assert list(report.cases[0]["plugins"]) == ["plain", "overlap"]
+    assert report.cases[0]["plugins"]["overlap"] == {"score": 0.5, "batch": 4}
+    assert report.summary["score"] == 0.5
+
+
+def test_failing_or_short_batch_marks_errors(tmp_path: Path) -> None:
+    def boom(*, expected: list[Any], predicted: list[Any], **kw: Any) -> list[Any]:
+        raise RuntimeError("model unavailable")
+
+    def short(*, expected: list[Any], predicted: list[Any], **kw: Any) -> list[Any]:
+        return [(1.0, {})]
+
+    register_scorer("boom", boom, batch=True)
+    register_scorer("short", short, batch=True)
+    report = run_suite(
+        suite=_suite(3, ["boom", "short"]), predictions_path=_preds(tmp_path, 3)
+    )
+    for case in report.cases:
+        assert case["plugins"]["boom"] == {"score": 0.0, "error": True}
+        assert case["plugins"]["short"] == {"score": 0.0, "error": True}
+
+
+def test_malformed_batch_element_marks_batch_failed(tmp_path: Path) -> None:
+    def bare_floats(*, expected: list[Any], predicted: list[Any], **kw: Any) -> list[Any]:
+        return [1.0 for _ in predicted]
+
+    def bad_meta(*, expected: list[Any], predicted: list[Any], **kw: Any) -> list[Any]:
+        return [(1.0, {}), (1.0, "not a dict"), (1.0, {})]
+
+    register_scorer("bare_floats", bare_floats, batch=True)
+    register_scorer("bad_meta", bad_meta, batch=True)
+    report = run_suite(
+        suite=_suite(3, ["bare_floats", "bad_meta"]), predictions_path=_preds(tmp_path, 3)
+    )
+    for case in report.cases:
+        assert case["plugins"]["bare_floats"] == {"score": 0.0, "error": True}
+        assert case["plugins"]["bad_meta"] == {"score": 0.0, "error": True}
+
+
+def test_batch_results_are_memoized(tmp_path: Path) -> None:
+    register_scorer("overlap", _overlap)
+    cache = ScoreCache(tmp_path / "cache")
+    preds = _preds(tmp_path, 5)
+    first = run_suite(suite=_suite(5, ["overlap"]), predictions_path=preds, score_cache=cache)
+    assert BATCHES == [5]
+    second = run_suite(suite=_suite(5, ["overlap"]), predictions_path=preds, score_cache=cache)
+    assert BATCHES == [5]
+    assert first.cases == second.cases
+    cache.close()
+
+
+def test_invalid_batch_size(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="batch_size"):
+        run_suite(suite=_suite(1, []), predictions_path=_preds(tmp_path, 1), batch_size=0)
+
+
+def test_cli_batch_size(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    register_scorer("overlap", _overlap)
+    suite_dir = tmp_path / "suite"
+    suite_dir.mkdir()
+    (suite_dir / "suite.json").write_text(
+        json.dumps(
+            {
+                "schema_version": 1,
+                "name": "batch",
+                "description": "",
+                "created_at": "",
+                "scoring": {"scorers": ["overlap"]},
+            }
+        ),
+        encoding="utf-8",
+    )
+    (suite_dir / "cases.jsonl").write_text(
+        "".join(json.dumps({"id": f"c{i:03d}", "expected": i}) + "\n" for i in range(6)),
+        encoding="utf-8",
+    )
+    rc = main(
+        [
+            "run",
+            "--suite",
+            str(suite_dir),
+            "--predictions",
+            str(_preds(tmp_path, 6)),
+            "--workers",
+            "1",
+            "--batch-size",
+            "3",
+        ]
+    )
+    assert rc == EXIT_SUCCESS
+    assert BATCHES == [3, 3]
+    assert main(["run", "--suite", str(suite_dir), "--predictions", "x", "--batch-size", "0"]) == 2
@@ -0,0 +1,67 @@
+"""Tests for the benchmark workload generator and harness."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from toolkit_eval_harness.benchmarks import WorkloadSpec, generate_workload, run_benchmarks
+from toolkit_eval_harness.benchmarks.harness import percentile
+from toolkit_eval_harness.cli import EXIT_SUCCESS, main
+from toolkit_eval_harness.plugins import list_scorers
+from toolkit_eval_harness.suite import read_suite_dir
+
+
+@pytest.mark.parametrize("payload", ["string", "json", "nested"])
+def test_generate_workload_is_deterministic(tmp_path: Path, payload: str) -> None:
+    spec = WorkloadSpec(cases=20, payload=payload, seed=7)
+    a = generate_workload(spec, tmp_path / "a")
+    b = generate_workload(spec, tmp_path / "b")
+    assert a.predictions_path.read_bytes() == b.predictions_path.read_bytes()
+    suite = read_suite_dir(a.suite_dir)
+    assert len(suite.cases) == 20
+    ids = [json.loads(line)["id"] for line in a.predictions_path.read_text().splitlines()]
+    assert sorted(ids) == [c.id for c in suite.cases]
+
+
+def test_spec_validation() -> None:
+    with pytest.raises(ValueError, match="unsupported_payload"):
+        WorkloadSpec(payload="xml")
+    with pytest.raises(ValueError):
+        WorkloadSpec(cases=0)
+
+
+def test_percentile() -> None:
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 50) == 0.0
+
+
+def test_run_benchmarks_with_plugins(tmp_path: Path) -> None:
+    workload = generate_workload(WorkloadSpec(cases=50, plugin_scorers=True), tmp_path)
+    result = run_benchmarks(workload, repeat=2, only=["run_suite", "verify_pack"])
+    assert set(result["benchmarks"]) == {"run_suite", "verify_pack"}
+    bench = result["benchmarks"]["run_suite"]
+    assert bench["repeat"] == 2 and bench["cases"] == 50
+    assert bench["seconds"]["min"] <= bench["seconds"]["p50"] <= bench["seconds"]["max"]
+    assert "bench_token_overlap" not in list_scorers()
+    with pytest.raises(ValueError, match="unknown_benchmark"):
+        run_benchmarks(workload, only=["nope"])
+
+
+def test_cli_bench(tmp_path: Path) -> None:
+    out = tmp_path / "bench.json"
+    rc = main(["-o", str(out), "bench", "--cases", "30", "--repeat", "1", "--payload", "nested"])
+    assert rc == EXIT_SUCCESS
+    result = json.loads(out.read_text(encoding="utf-8"))
+    assert result["workload"]["payload"] == "nested"
+    assert set(result["benchmarks"]) == {
+        "read_suite_dir",
+        "verify_pack",
+        "run_suite",
+        "format_report",
+    }
+    assert main(["bench", "--only", "bogus", "--cases", "5"]) == 2
@@ -0,0 +1,116 @@
+"""Tests for paired bootstrap comparisons."""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from toolkit_eval_harness.cli import EXIT_SUCCESS, EXIT_VALIDATION_FAILED, main
+from toolkit_eval_harness.compare import CompareBudget, compare_reports, paired_scores
+from toolkit_eval_harness.report import EvalReport
+from toolkit_eval_harness.stats import paired_bootstrap
+
+
+def _scores(n: int, p: float, seed: int) -> list[float]:
+    rng = random.Random(seed)
+    return [float(rng.random() < p) for _ in range(n)]
+
+
+def _report(scores: list[float]) -> EvalReport:
+    cases = [{"id": f"c{i:05d}", "score": s, "tags": []} for i, s in enumerate(scores)]
+    return EvalReport(
+        suite={}, summary={"score": sum(scores) / len(scores), "cases": len(scores)}, cases=cases
+    )
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_bootstrap_is_seeded_and_brackets_the_mean(use_numpy: bool) -> None:
+    if use_numpy:
+        pytest.importorskip("numpy")
+    base, cand = _scores(500, 0.8, 1), _scores(500, 0.6, 2)
+    a = paired_bootstrap(base, cand, resamples=500, seed=3, use_numpy=use_numpy)
+    b = paired_bootstrap(base, cand, resamples=500, seed=3, use_numpy=use_numpy)
+    assert a == b
+    assert a["backend"] == ("numpy" if use_numpy else "python")
+    assert a["ci_low"] <= a["mean_delta"] <= a["ci_high"] < 0
+    assert a["p_value"] < 0.01
+
+
+def test_bootstrap_numpy_handles_continuous_scores() -> None:
+    pytest.importorskip("numpy")
+    rng = random.Random(0)
+    base = [rng.random() for _ in range(2000)]
+    cand = [b + rng.gauss(0, 0.1) for b in base]
+    out = paired_bootstrap(base, cand, resamples=300, use_numpy=True)
+    assert out["ci_low"] <= out["mean_delta"] <= out["ci_high"]
+    assert out["p_value"] > 0.01
+
+
+def test_no_change_has_p_value_one() -> None:
+    scores = _scores(50, 0.5, 0)
+    out = paired_bootstrap(scores, scores, resamples=100, use_numpy=False)
+    assert out["mean_delta"] == 0.0 and out["p_value"] == 1.0
+
+
+def test_bootstrap_validation() -> None:
+    with pytest.raises(ValueError):
+        paired_bootstrap([1.0], [1.0, 0.0])
+    with pytest.raises(ValueError):
+        paired_bootstrap([], [])
+    with pytest.raises(ValueError):
+        paired_bootstrap([1.0], [0.0], confidence=1.5)
+
+
+def test_paired_scores_only_matched_cases() -> None:
+    base = EvalReport(suite={}, summary={}, cases=[{"id": "b", "score": 1.0}, {"id": "a"}])
+    cand = EvalReport(suite={}, summary={}, cases=[{"id": "a", "score": 0.5}, {"id": "z"}])
+    b, c = paired_scores(baseline=base, candidate=cand)
+    assert list(b) == [0.0] and list(c) == [0.5]
+
+
+def test_bootstrap_gate_tolerates_noise_on_small_suites() -> None:
+    # 20 cases, one flipped: 5% point regression but not significant.
+    base = [1.0] * 20
+    cand = [1.0] * 19 + [0.0]
+    point = compare_reports(
+        baseline=_report(base), candidate=_report(cand), budget=CompareBudget()
+    )
+    assert point["passed"] is False
+    boot = compare_reports(
+        baseline=_report(base),
+        candidate=_report(cand),
+        budget=CompareBudget(bootstrap_resamples=1000),
+    )
+    assert boot["passed"] is True
+    low, high = boot["bootstrap"]["score_regression_pct_ci"]
+    assert low <= boot["score_regression_pct"] <= high
+
+
+def test_bootstrap_gate_fails_clear_regressions() -> None:
+    result = compare_reports(
+        baseline=_report(_scores(2000, 0.9, 1)),
+        candidate=_report(_scores(2000, 0.7, 2)),
+        budget=CompareBudget(bootstrap_resamples=500, bootstrap_seed=7),
+    )
+    assert result["passed"] is False
+    assert result["reason"] == "significant_score_regression"
+
+
+def test_cli_compare_bootstrap(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    for name, scores in (("base", [1.0] * 20), ("cand", [1.0] * 19 + [0.0])):
+        (tmp_path / f"{name}.json").write_text(json.dumps(_report(scores).to_dict()))
+    argv = [
+        "compare",
+        "--baseline",
+        str(tmp_path / "base.json"),
+        "--candidate",
+        str(tmp_path / "cand.json"),
+    ]
+    assert main(argv) == EXIT_VALIDATION_FAILED
+    capsys.readouterr()
+    assert main([*argv, "--bootstrap", "500", "--bootstrap-seed", "1"]) == EXIT_SUCCESS
+    out = json.loads(capsys.readouterr().out)
+    assert out["bootstrap"]["resamples"] == 500
@@ -0,0 +1,117 @@
+"""Tests for the case-level report diff."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from toolkit_eval_harness.cli import EXIT_SUCCESS, main
+from toolkit_eval_harness.compare import CompareBudget, compare_reports, diff_cases
+from toolkit_eval_harness.report import EvalReport, write_report_jsonl
+
+
+def _case(cid: str, score: float, *tags: str) -> dict[str, Any]:
+    return {"id": cid, "score": score, "tags": list(tags)}
+
+
+BASE = [
+    _case("a", 1.0, "x"),
+    _case("b", 1.0, "x", "y"),
+    _case("c", 0.0, "y"),
+    _case("d", 0.5),
+]
+CAND = [
+    _case("a", 1.0, "x"),
+    _case("b", 0.0, "x", "y"),
+    _case("c", 1.0, "y"),
+    _case("e", 1.0),
+]
+
+
+def _report(cases: list[dict[str, Any]]) -> EvalReport:
+    score = sum(c["score"] for c in cases) / len(cases)
+    return EvalReport(suite={}, summary={"score": score, "cases": len(cases)}, cases=cases)
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_diff_classifies_cases(shuffle: bool) -> None:
+    base, cand = list(BASE), list(CAND)
+    if shuffle:
+        base.reverse()
+        cand = cand[2:] + cand[:2]
+    diff = diff_cases(baseline=_report(base), candidate=_report(cand))
+    assert diff["counts"] == {
+        "matched": 3,
+        "regressed": 1,
+        "improved": 1,
+        "unchanged": 1,
+        "added": 1,
+        "removed": 1,
+    }
+    assert diff["regressed"] == [
+        {"id": "b", "baseline": 1.0, "candidate": 0.0, "delta": -1.0, "tags": ["x", "y"]}
+    ]
+    assert [c["id"] for c in diff["improved"]] == ["c"]
+    assert diff["added"] == ["e"] and diff["removed"] == ["d"]
+    assert diff["by_tag"]["x"] == {
+        "cases": 2,
+        "baseline_score": 1.0,
+        "candidate_score": 0.5,
+        "delta": -0.5,
+    }
+    assert diff["by_tag"]["y"]["delta"] == 0.0
+    assert diff["truncated"] is False
+
+
+def test_duplicate_ids_last_wins_and_tolerance() -> None:
+    base = _report([_case("a", 0.5), _case("a", 1.0)])
+    cand = _report([_case("a", 0.95)])
+    assert diff_cases(baseline=base, candidate=cand)["counts"]["regressed"] == 1
+    assert diff_cases(baseline=base, candidate=cand, tolerance=0.1)["counts"]["unchanged"] == 1
+
+
+def test_max_listed_truncates_lists_not_counts() -> None:
+    base = _report([_case(f"c{i}", 1.0) for i in range(5)])
+    cand = _report([_case(f"c{i}", 0.0) for i in range(5)])
+    diff = diff_cases(baseline=base, candidate=cand, max_listed=2)
+    assert diff["counts"]["regressed"] == 5 and len(diff["regressed"]) == 2
+    assert diff["truncated"] is True
+
+
+def test_compare_reports_case_diff_on_streamed_reports(tmp_path: Path) -> None:
+    write_report_jsonl(_report(BASE), tmp_path / "base.jsonl")
+    write_report_jsonl(_report(list(reversed(CAND))), tmp_path / "cand.jsonl")
+    result = compare_reports(
+        baseline=EvalReport.load(tmp_path / "base.jsonl"),
+        candidate=EvalReport.load(tmp_path / "cand.jsonl"),
+        budget=CompareBudget(max_score_regression_pct=100.0),
+        case_diff=True,
+    )
+    assert result["passed"] is True
+    assert result["case_diff"]["counts"]["regressed"] == 1
+    assert "case_diff" not in compare_reports(
+        baseline=_report(BASE), candidate=_report(CAND), budget=CompareBudget()
+    )
+
+
+def test_cli_compare_cases(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    for name, cases in (("base", BASE), ("cand", CAND)):
+        (tmp_path / f"{name}.json").write_text(json.dumps(_report(cases).to_dict()))
+    argv = [
+        "compare",
+        "--baseline",
+        str(tmp_path / "base.json"),
+        "--candidate",
+        str(tmp_path / "cand.json"),
+        "--max-score-regression-pct",
+        "50",
+        "--cases",
+        "--max-listed",
+        "10",
+    ]
+    assert main(argv) == EXIT_SUCCESS
+    out = json.loads(capsys.readouterr().out)
+    assert out["case_diff"]["removed"] == ["d"]
@@ -0,0 +1,86 @@
+"""Tests for the columnar case store."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from toolkit_eval_harness.columnar import ColumnarCases
+from toolkit_eval_harness.compare import diff_cases, tag_scores
+from toolkit_eval_harness.formatters import format_csv, format_json, format_table
+from toolkit_eval_harness.report import EvalReport, write_report_json
+from toolkit_eval_harness.runner import run_suite
+from toolkit_eval_harness.suite import EvalCase, EvalSuite
+
+CASES: list[dict[str, Any]] = [
+    {"id": "a", "tags": ["x", "y"], "score": 1.0, "exact": {"match": True}},
+    {"id": "b", "tags": [], "score": 0.0, "error": "timeout"},
+    {"id": "c", "tags": ["y", "y"], "score": 0.5, "plugins": {"p": {"score": 0.5}}},
+    {"id": "d", "tags": ["x"], "score": 0.25},
+]
+
+
+def test_round_trip_is_lossless() -> None:
+    cols = ColumnarCases(CASES)
+    assert len(cols) == 4 and cols.to_cases() == CASES
+    assert cols[2] == CASES[2] and cols[-1] == CASES[-1] and cols[1:3] == CASES[1:3]
+    assert cols.tag_vocab == ["x", "y"] and list(cols.tag_offsets) == [0, 2, 2, 4, 5]
+    with pytest.raises(IndexError):
+        cols[4]
+
+
+def test_aggregates_match_dict_form() -> None:
+    cols = ColumnarCases(CASES)
+    assert cols.tag_scores() == tag_scores(CASES)
+    assert tag_scores(cols)["y"] == {"cases": 2, "score": 0.75}
+    assert cols.summary() == {"cases": 4, "score": pytest.approx(1.75 / 4)}
+    assert ColumnarCases().tag_scores() == {} and ColumnarCases().mean_score() == 0.0
+
+
+def test_columnar_reports_load_diff_and_format(tmp_path: Path) -> None:
+    report = EvalReport(suite={"name": "s"}, summary={"cases": 4, "score": 0.4}, cases=CASES)
+    write_report_json(report, tmp_path / "r.json")
+    loaded = EvalReport.load(tmp_path / "r.json", columnar=True)
+    assert isinstance(loaded.cases, ColumnarCases)
+    assert loaded.to_dict() == report.to_dict()
+    assert loaded.columnar() is loaded.cases
+    zeroed = [c | {"score": 0.0} for c in CASES]
+    as_columns = EvalReport(suite={}, summary={}, cases=ColumnarCases(zeroed))
+    as_dicts = EvalReport(suite={}, summary={}, cases=zeroed)
+    assert diff_cases(baseline=loaded, candidate=as_columns) == diff_cases(
+        baseline=report, candidate=as_dicts
+    )
+    data = loaded.to_dict() | {"cases": loaded.cases}
+    assert json.loads(format_json(data))["cases"] == CASES
+    assert format_table(data) == format_table(report.to_dict())
+    assert format_csv(data) == format_csv(report.to_dict())
+
+
+def test_run_suite_columnar(tmp_path: Path) -> None:
+    suite = EvalSuite(
+        schema_version=1,
+        name="cols",
+        description="",
+        created_at="",
+        scoring={},
+        cases=[EvalCase(id=f"c{i}", input=None, expected=i, tags=["t"]) for i in range(6)],
+    )
+    preds = tmp_path / "p.jsonl"
+    preds.write_text(
+        "".join(json.dumps({"id": f"c{i}", "prediction": i % 2}) + "\n" for i in range(6)),
+        encoding="utf-8",
+    )
+    plain = run_suite(suite=suite, predictions_path=preds)
+    cols = run_suite(suite=suite, predictions_path=preds, workers=2, chunk_size=2, columnar=True)
+    assert isinstance(cols.cases, ColumnarCases)
+    assert cols.cases.to_cases() == plain.cases
+    # Six cases share two distinct exact-match results and one json result.
+    assert len(cols.cases._fields["exact"].vocab) == 2
+    assert len(cols.cases._fields["json"].vocab) == 1
+    assert cols.cases.summary() == {k: plain.summary[k] for k in ("cases", "score")}
+    assert cols.cases.tag_scores()["t"]["score"] == pytest.approx(
+        plain.summary["by_tag"]["t"]["score"]
+    )
@@ -0,0 +1,91 @@
+"""Tests for multi-candidate comparison."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from toolkit_eval_harness.cli import EXIT_VALIDATION_FAILED, main
+from toolkit_eval_harness.compare import CompareBudget, compare_many, tag_scores
+from toolkit_eval_harness.formatters import format_csv, format_table
+from toolkit_eval_harness.report import EvalReport, write_report_json, write_report_jsonl
+
+
+def _case(cid: str, score: float, *tags: str) -> dict[str, Any]:
+    return {"id": cid, "score": score, "tags": list(tags)}
+
+
+def _report(*scores: float) -> EvalReport:
+    cases = [_case(f"c{i}", s, "even" if i % 2 == 0 else "odd") for i, s in enumerate(scores)]
+    summary = {"score": sum(scores) / len(scores), "cases": len(cases)}
+    return EvalReport(suite={}, summary=summary, cases=cases)
+
+
+@pytest.fixture()
+def reports(tmp_path: Path) -> tuple[EvalReport, list[tuple[str, Path]]]:
+    write_report_json(_report(1.0, 0.0, 1.0, 0.0), tmp_path / "worse.json")
+    write_report_jsonl(_report(1.0, 1.0, 1.0, 1.0), tmp_path / "better.jsonl")
+    (tmp_path / "broken.json").write_text("{not json")
+    names = ["worse.json", "better.jsonl", "broken.json"]
+    return _report(1.0, 1.0, 1.0, 0.0), [(n, tmp_path / n) for n in names]
+
+
+def test_tag_scores() -> None:
+    scores = tag_scores([_case("a", 1.0, "x", "x"), _case("b", 0.0, "x", "y")])
+    assert scores == {"x": {"cases": 2, "score": 0.5}, "y": {"cases": 1, "score": 0.0}}
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_compare_many_ranks_candidates(
+    reports: tuple[EvalReport, list[tuple[str, Path]]], workers: int
+) -> None:
+    baseline, candidates = reports
+    result = compare_many(
+        baseline=baseline, candidates=candidates, budget=CompareBudget(), workers=workers
+    )
+    assert [(r["rank"], r["name"]) for r in result["candidates"]] == [
+        (1, "better.jsonl"),
+        (2, "worse.json"),
+        (3, "broken.json"),
+    ]
+    better, worse, broken = result["candidates"]
+    assert better["passed"] and better["delta"] == pytest.approx(0.25)
+    assert better["by_tag"] == {"even": 0.0, "odd": pytest.approx(0.5)}
+    assert worse["reason"] == "score_regression" and worse["by_tag"]["odd"] == -0.5
+    assert broken["reason"] == "unreadable_report" and broken["score"] is None
+    assert result["tags"] == ["even", "odd"]
+    assert result["baseline"]["by_tag"]["odd"] == {"cases": 2, "score": 0.5}
+    assert result["passed"] is False
+
+
+def test_matrix_table_and_csv(reports: tuple[EvalReport, list[tuple[str, Path]]]) -> None:
+    baseline, candidates = reports
+    result = compare_many(baseline=baseline, candidates=candidates[:2], budget=CompareBudget())
+    table = format_table(result).splitlines()
+    assert table[0].split() == [
+        "rank", "candidate", "score", "delta", "regression_pct", "passed", "even", "odd"
+    ]
+    assert table[2].split() == ["(baseline)", "0.7500", "1.0000", "0.5000"]
+    assert table[3].split()[:2] == ["1", "better.jsonl"]
+    rows = list(csv.reader(io.StringIO(format_csv(result))))
+    assert rows[0][-2:] == ["even", "odd"] and len(rows) == 4
+    assert rows[3][1] == "worse.json" and rows[3][-1] == "-0.5000"
+
+
+def test_cli_compare_many(
+    tmp_path: Path,
+    reports: tuple[EvalReport, list[tuple[str, Path]]],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    baseline, candidates = reports
+    write_report_json(baseline, tmp_path / "base.json")
+    argv = ["compare-many", "--baseline", str(tmp_path / "base.json"), "--candidates"]
+    argv += [str(p) for _, p in candidates[:2]]
+    assert main(argv) == EXIT_VALIDATION_FAILED
+    out = json.loads(capsys.readouterr().out)
+    assert [r["passed"] for r in out["candidates"]] == [True, False]
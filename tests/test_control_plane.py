@@ -4,7 +4,7 @@ Tests for toolkit-eval-harness control_plane adapter.
 Coverage:
   - contracts: PermissionScope, ApprovalPolicy, AuthorityBoundary, ToolSpec, framework flag
   - config: build_config_hierarchy (defaults, toolkit config, CLI overrides)
-  - tool_specs: TOOLKIT_TOOL_SPECS covers all 6 commands, get_tool_spec lookup
+  - tool_specs: TOOLKIT_TOOL_SPECS covers all 9 commands, get_tool_spec lookup
 """
 
 from __future__ import annotations
@@ -105,7 +105,17 @@ class TestBuildConfigHierarchy:
 
 
 class TestToolkitToolSpecs:
-    EXPECTED_COMMANDS = {"keygen", "pack", "run", "compare", "validate-report", "check-deps"}
+    EXPECTED_COMMANDS = {
+        "keygen",
+        "pack",
+        "run",
+        "compare",
+        "compare-many",
+        "serve",
+        "validate-report",
+        "bench",
+        "check-deps",
+    }
 
     def test_all_commands_present(self) -> None:
         assert set(TOOLKIT_TOOL_SPECS.keys()) == self.EXPECTED_COMMANDS
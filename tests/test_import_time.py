@@ -0,0 +1,98 @@
+"""CLI startup stays light: no heavy imports and an ``-X importtime`` budget.
+
+Absolute timings depend on the machine, so the default budget is lenient
+enough for shared CI runners (it still catches NumPy or the runner creeping
+back in); set ``TOOLKIT_EVAL_IMPORT_BUDGET_MS`` (e.g. ``=50`` on a quiet
+workstation) to tighten it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import toolkit_eval_harness
+from toolkit_eval_harness import runner
+
+SRC = Path(toolkit_eval_harness.__file__).resolve().parents[1]
+# Cumulative import time budget for toolkit_eval_harness.cli, best of a few runs.
+IMPORT_BUDGET_ENV = "TOOLKIT_EVAL_IMPORT_BUDGET_MS"
+DEFAULT_IMPORT_BUDGET_MS = 150.0
+# Modules short subcommands must not import.
+HEAVY_MODULES = (
+    "numpy",
+    "importlib.metadata",
+    "http.server",
+    "sqlite3",
+    "multiprocessing",
+    "concurrent.futures",
+    "toolkit_eval_harness.compare",
+    "toolkit_eval_harness.runner",
+    "toolkit_eval_harness.benchmarks.workload",
+)
+
+
+def _python(code: str, *args: str) -> subprocess.CompletedProcess[str]:
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    # Let the first run write bytecode so later runs measure imports, not compiles.
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=60,
+    )
+
+
+def _cli_import_us() -> int:
+    stderr = _python("import toolkit_eval_harness.cli", "-X", "importtime").stderr
+    for line in stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == "toolkit_eval_harness.cli":
+            return int(cumulative)
+    raise AssertionError(stderr)
+
+
+def test_cli_import_within_budget() -> None:
+    budget_ms = float(os.environ.get(IMPORT_BUDGET_ENV) or DEFAULT_IMPORT_BUDGET_MS)
+    _cli_import_us()
+    best = min(_cli_import_us() for _ in range(3))
+    assert best / 1000 < budget_ms, f"cli import took {best / 1000:.1f} ms"
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["validate-report", "--report", "{tmp}/report.json"],
+        ["pack", "verify", "--suite", "{tmp}/missing.zip"],
+        ["--help"],
+    ],
+)
+def test_short_commands_skip_heavy_imports(tmp_path: Path, argv: list[str]) -> None:
+    report = {"suite": {}, "summary": {"cases": 0, "score": 0.0}, "cases": []}
+    (tmp_path / "report.json").write_text(json.dumps(report), encoding="utf-8")
+    code = (
+        "import sys\n"
+        "from toolkit_eval_harness.cli import main\n"
+        "try:\n"
+        f"    main({[a.format(tmp=tmp_path) for a in argv]!r})\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules], file=sys.stderr)\n"
+    )
+    assert _python(code).stderr.strip().splitlines()[-1] == "[]"
+
+
+def test_package_exports_resolve_lazily() -> None:
+    assert toolkit_eval_harness.run_suite is runner.run_suite
+    assert "run_suite" in dir(toolkit_eval_harness)
+    assert isinstance(toolkit_eval_harness.__version__, str)
+    with pytest.raises(AttributeError):
+        toolkit_eval_harness.no_such_name  # noqa: B018
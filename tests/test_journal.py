@@ -0,0 +1,130 @@
+"""Tests for the resumable per-case result journal."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from toolkit_eval_harness.cli import EXIT_CLI_ERROR, EXIT_SUCCESS, main
+from toolkit_eval_harness.journal import ResultJournal, result_key, scorer_config_digest
+from toolkit_eval_harness.plugins import _reset_registry, register_scorer
+from toolkit_eval_harness.runner import run_suite
+from toolkit_eval_harness.suite import read_suite_dir
+
+CALLS: list[str] = []
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry() -> Any:
+    _reset_registry()
+    CALLS.clear()
+    yield
+    _reset_registry()
+
+
+def _counting_scorer(
+    *, expected: Any, predicted: Any, **kwargs: Any
+) -> tuple[float, dict[str, Any]]:
+    CALLS.append(str(expected))
+    if predicted == "boom":
+        raise KeyboardInterrupt
+    return 0.5, {}
+
+
+def _make_suite(tmp_path: Path, n: int = 6) -> Path:
+    suite_dir = tmp_path / "suite"
+    suite_dir.mkdir()
+    (suite_dir / "suite.json").write_text(
+        json.dumps({"name": "j", "scoring": {"scorers": ["counting"]}}), encoding="utf-8"
+    )
+    (suite_dir / "cases.jsonl").write_text(
+        "".join(json.dumps({"id": f"c{i}", "expected": f"e{i}"}) + "\n" for i in range(n)),
+        encoding="utf-8",
+    )
+    return suite_dir
+
+
+def _write_preds(path: Path, preds: dict[str, Any]) -> Path:
+    path.write_text(
+        "".join(json.dumps({"id": k, "prediction": v}) + "\n" for k, v in preds.items()),
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_result_key_sensitivity() -> None:
+    cfg = scorer_config_digest({"scorers": ["a"]}, {"a": "1"})
+    base = result_key(config_digest=cfg, expected={"a": 1, "b": 2}, predicted="x")
+    assert base == result_key(config_digest=cfg, expected={"b": 2, "a": 1}, predicted="x")
+    assert base != result_key(config_digest=cfg, expected={"a": 1, "b": 2}, predicted="y")
+    other_cfg = scorer_config_digest({"scorers": ["a", "b"]}, {"a": "1", "b": "1"})
+    assert base != result_key(config_digest=other_cfg, expected={"a": 1, "b": 2}, predicted="x")
+    upgraded = scorer_config_digest({"scorers": ["a"]}, {"a": "2"})
+    assert base != result_key(config_digest=upgraded, expected={"a": 1, "b": 2}, predicted="x")
+
+
+def test_journal_ignores_truncated_tail(tmp_path: Path) -> None:
+    path = tmp_path / "j.jsonl"
+    with ResultJournal(path) as journal:
+        journal.append("c1", "k1", {"id": "c1", "score": 1.0})
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"id": "c2", "key": "k2", "res')
+    resumed = ResultJournal(path, resume=True)
+    resumed.close()
+    assert len(resumed) == 1
+    assert resumed.lookup("c1", "k1") == {"id": "c1", "score": 1.0}
+    assert resumed.lookup("c1", "stale") is None
+
+
+def test_resume_after_interrupt_scores_only_missing(tmp_path: Path) -> None:
+    register_scorer("counting", _counting_scorer)
+    suite = read_suite_dir(_make_suite(tmp_path))
+    journal_path = tmp_path / "run.journal"
+    preds = {f"c{i}": f"p{i}" for i in range(6)}
+    preds["c3"] = "boom"
+
+    with pytest.raises(KeyboardInterrupt), ResultJournal(journal_path) as journal:
+        run_suite(
+            suite=suite,
+            predictions_path=_write_preds(tmp_path / "p1.jsonl", preds),
+            journal=journal,
+            chunk_size=1,
+        )
+    assert CALLS == ["e0", "e1", "e2", "e3"]
+
+    CALLS.clear()
+    preds["c3"] = "fixed"
+    preds["c1"] = "changed"
+    with ResultJournal(journal_path, resume=True) as journal:
+        report = run_suite(
+            suite=suite,
+            predictions_path=_write_preds(tmp_path / "p2.jsonl", preds),
+            journal=journal,
+        )
+        assert journal.replayed == 2
+    assert CALLS == ["e1", "e3", "e4", "e5"]
+    assert [c["id"] for c in report.cases] == [f"c{i}" for i in range(6)]
+
+    fresh = run_suite(suite=suite, predictions_path=tmp_path / "p2.jsonl")
+    assert fresh.cases == report.cases
+
+
+def test_cli_resume(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    register_scorer("counting", _counting_scorer)
+    suite_dir = _make_suite(tmp_path, n=3)
+    preds = _write_preds(tmp_path / "p.jsonl", {"c0": "a", "c1": "b", "c2": "c"})
+    journal = tmp_path / "out" / "run.journal"
+    base = ["run", "--suite", str(suite_dir), "--predictions", str(preds)]
+
+    assert main([*base, "--resume"]) == EXIT_CLI_ERROR
+    assert main([*base, "--journal", str(journal)]) == EXIT_SUCCESS
+    assert len(CALLS) == 3
+    assert main([*base, "--journal", str(journal), "--resume"]) == EXIT_SUCCESS
+    assert len(CALLS) == 3
+    out = capsys.readouterr().out
+    first, end = json.JSONDecoder().raw_decode(out)
+    second = json.loads(out[end:])
+    assert first["cases"] == second["cases"]
@@ -0,0 +1,107 @@
+"""Tests for the memory-mapped lazy suite backend."""
+
+from __future__ import annotations
+
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+
+from toolkit_eval_harness.cli import EXIT_CLI_ERROR, EXIT_SUCCESS, main
+from toolkit_eval_harness.pack import create_pack, load_suite_from_path
+from toolkit_eval_harness.runner import run_suite
+from toolkit_eval_harness.suite import LazyCaseList, open_suite_lazy, read_suite_dir
+
+
+def _make_suite(tmp_path: Path, n: int = 6) -> Path:
+    suite_dir = tmp_path / "suite"
+    suite_dir.mkdir()
+    (suite_dir / "suite.json").write_text(json.dumps({"name": "lazy"}), encoding="utf-8")
+    lines = [
+        json.dumps({"id": f"c{i}", "input": {"blob": "x" * 100}, "expected": i, "tags": ["t"]})
+        for i in range(n)
+    ]
+    lines.insert(2, "")
+    lines.append(json.dumps({"expected": "late-id", "id": "tail"}))
+    (suite_dir / "cases.jsonl").write_text("\r\n".join(lines), encoding="utf-8")
+    return suite_dir
+
+
+def test_lazy_matches_eager(tmp_path: Path) -> None:
+    suite_dir = _make_suite(tmp_path)
+    eager = read_suite_dir(suite_dir)
+    lazy = open_suite_lazy(suite_dir)
+    assert isinstance(lazy.cases, LazyCaseList)
+    assert len(lazy.cases) == len(eager.cases) == 7
+    assert list(lazy.cases) == list(eager.cases)
+    assert lazy.cases[-1] == eager.cases[-1]
+    assert lazy.cases[1:3] == eager.cases[1:3]
+    assert lazy.to_dict() == eager.to_dict()
+
+
+def test_lazy_random_access_by_id(tmp_path: Path) -> None:
+    cases = open_suite_lazy(_make_suite(tmp_path)).cases
+    assert isinstance(cases, LazyCaseList)
+    case = cases.get("c4")
+    assert case is not None and case.expected == 4
+    assert cases.get("missing") is None
+    assert "tail" in cases
+    assert cases.ids[:2] == ["c0", "c1"]
+    with pytest.raises(IndexError):
+        cases[100]
+
+
+def test_lazy_pickles_by_path(tmp_path: Path) -> None:
+    cases = open_suite_lazy(_make_suite(tmp_path)).cases
+    clone = pickle.loads(pickle.dumps(cases))
+    assert list(clone) == list(cases)
+
+
+def test_lazy_empty_file(tmp_path: Path) -> None:
+    suite_dir = tmp_path / "empty"
+    suite_dir.mkdir()
+    (suite_dir / "suite.json").write_text("{}", encoding="utf-8")
+    (suite_dir / "cases.jsonl").write_text("", encoding="utf-8")
+    assert len(open_suite_lazy(suite_dir).cases) == 0
+
+
+def test_select_subset(tmp_path: Path) -> None:
+    suite = open_suite_lazy(_make_suite(tmp_path))
+    subset = suite.select(["c3", "c0"])
+    assert [c.id for c in subset.cases] == ["c3", "c0"]
+    assert subset.to_dict()["cases_count"] == 2
+    with pytest.raises(KeyError, match="nope"):
+        suite.select(["nope"])
+    eager = read_suite_dir(tmp_path / "suite")
+    assert [c.id for c in eager.select(["c1"]).cases] == ["c1"]
+
+
+def test_lazy_run_and_zip_fallback(tmp_path: Path) -> None:
+    suite_dir = _make_suite(tmp_path)
+    preds = tmp_path / "preds.jsonl"
+    preds.write_text(json.dumps({"id": "c2", "prediction": 2}) + "\n", encoding="utf-8")
+    lazy = run_suite(suite=load_suite_from_path(suite_dir, lazy=True), predictions_path=preds)
+    eager = run_suite(suite=read_suite_dir(suite_dir), predictions_path=preds)
+    assert lazy.cases == eager.cases
+
+    pack = tmp_path / "suite.zip"
+    create_pack(suite_dir=suite_dir, out_zip=pack)
+    assert not isinstance(load_suite_from_path(pack, lazy=True).cases, LazyCaseList)
+
+
+def test_cli_lazy_with_case_ids(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    suite_dir = _make_suite(tmp_path)
+    preds = tmp_path / "preds.jsonl"
+    preds.write_text(json.dumps({"id": "c5", "prediction": 5}) + "\n", encoding="utf-8")
+    ids = tmp_path / "ids.txt"
+    ids.write_text("c5\nc1\n", encoding="utf-8")
+    base = ["run", "--suite", str(suite_dir), "--predictions", str(preds), "--lazy"]
+
+    assert main([*base, "--case-ids", str(ids)]) == EXIT_SUCCESS
+    out = json.loads(capsys.readouterr().out)
+    assert [c["id"] for c in out["cases"]] == ["c5", "c1"]
+    assert out["summary"]["pass_count"] == 1
+
+    ids.write_text("unknown\n", encoding="utf-8")
+    assert main([*base, "--case-ids", str(ids)]) == EXIT_CLI_ERROR
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import json
 import logging
+import math
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -11,7 +14,14 @@ import pytest
 from toolkit_eval_harness.cli import EXIT_SUCCESS, build_parser, main
 from toolkit_eval_harness.health import check_health
 from toolkit_eval_harness.logging_config import JSONFormatter, setup_logging
-from toolkit_eval_harness.metrics import MetricsCollector, SuiteMetrics
+from toolkit_eval_harness.metrics import (
+    RECENT_TIMINGS,
+    LogHistogram,
+    MetricsCollector,
+    SuiteMetrics,
+)
+from toolkit_eval_harness.runner import run_suite
+from toolkit_eval_harness.suite import EvalCase, EvalSuite
 
 # ---------------------------------------------------------------------------
 # Structured logging (JSON formatter)
@@ -524,3 +534,110 @@ class TestRunnerLogging:
             run_suite(suite=suite, predictions_path=preds)
 
         assert "Case c1" in caplog.text
+
+
+# ---------------------------------------------------------------------------
+# LogHistogram
+# ---------------------------------------------------------------------------
+
+
+class TestLogHistogram:
+    def test_quantiles_within_relative_error(self) -> None:
+        hist = LogHistogram()
+        values = [i / 1000 for i in range(1, 10_001)]
+        for v in values:
+            hist.add(v)
+        for q in (0.5, 0.9, 0.99, 0.999):
+            exact = values[math.ceil(q * len(values)) - 1]
+            assert hist.quantile(q) == pytest.approx(exact, rel=0.011)
+        assert hist.count == 10_000 and hist.min == 0.001 and hist.max == 10.0
+        assert len(hist._buckets) < 1000
+
+    def test_zero_and_merge(self) -> None:
+        left, right = LogHistogram(), LogHistogram()
+        left.add(0.0)
+        right.add(2.0)
+        left.merge(right)
+        assert left.quantile(0.5) == 0.0 and left.quantile(1.0) == 2.0
+        assert LogHistogram().quantile(0.5) == 0.0
+        with pytest.raises(ValueError):
+            left.merge(LogHistogram(relative_error=0.05))
+
+    def test_timers_bounded_and_report_percentiles(self) -> None:
+        mc = MetricsCollector()
+        for i in range(RECENT_TIMINGS + 10):
+            mc.record_time("t", float(i))
+        assert len(mc.get_timer("t")) == RECENT_TIMINGS
+        assert mc.get_timer("t")[-1] == float(RECENT_TIMINGS + 9)
+        snap = mc.snapshot()["timers"]["t"]
+        assert snap["count"] == RECENT_TIMINGS + 10
+        assert set(snap) >= {"p50_seconds", "p90_seconds", "p99_seconds", "p999_seconds"}
+        sm = SuiteMetrics()
+        sm.record_case(score=1.0, elapsed=0.25)
+        assert sm.to_dict()["case_latency"]["p99_seconds"] == pytest.approx(0.25)
+
+
+# ---------------------------------------------------------------------------
+# Sharded MetricsCollector
+# ---------------------------------------------------------------------------
+
+
+class TestShardedMetrics:
+    def test_concurrent_updates_are_merged(self) -> None:
+        mc = MetricsCollector()
+
+        def work(i: int) -> None:
+            for _ in range(1000):
+                mc.increment("n")
+            mc.record_time("t", i / 100)
+            mc.set_gauge("g", float(i))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(work, range(8)))
+        snap = mc.snapshot()
+        assert snap["counters"] == {"n": 8000}
+        assert snap["timers"]["t"]["count"] == 8
+        assert snap["gauges"]["g"] in {float(i) for i in range(8)}
+        assert len(mc.get_timer("t")) == 8
+
+    def test_state_round_trip_merges(self) -> None:
+        worker = MetricsCollector()
+        worker.increment("hits", 3)
+        worker.record_time("t", 0.5)
+        worker.set_gauge("g", 2.0)
+        state = json.loads(json.dumps(worker.to_state()))
+        parent = MetricsCollector()
+        parent.increment("hits")
+        parent.merge_state(state)
+        parent.merge_state(state)
+        assert parent.get_counter("hits") == 7
+        assert parent.snapshot()["timers"]["t"]["count"] == 2
+        assert parent.get_gauge("g") == 2.0
+        clone = pickle.loads(pickle.dumps(parent))
+        assert clone.snapshot() == parent.snapshot()
+
+    def test_hot_path_logging_is_opt_in(self, caplog: pytest.LogCaptureFixture) -> None:
+        caplog.set_level(logging.DEBUG, logger="toolkit_eval_harness.metrics")
+        MetricsCollector().increment("quiet")
+        assert not caplog.records
+        MetricsCollector(log_updates=True).increment("loud")
+        assert "metrics.counter loud" in caplog.text
+
+    def test_process_pool_workers_send_metrics_back(self, tmp_path: Path) -> None:
+        cases = [EvalCase(id=f"c{i}", input=None, expected=i, tags=[]) for i in range(12)]
+        suite = EvalSuite(
+            schema_version=1, name="m", description="", created_at="", scoring={}, cases=cases
+        )
+        preds = tmp_path / "p.jsonl"
+        rows = [{"id": f"c{i}", "prediction": i} for i in range(12)]
+        preds.write_text("".join(json.dumps(row) + "\n" for row in rows))
+        mc = MetricsCollector()
+        run_suite(
+            suite=suite,
+            predictions_path=preds,
+            workers=2,
+            executor="process",
+            chunk_size=3,
+            collector=mc,
+        )
+        assert mc.snapshot()["timers"]["case.score"]["count"] == 12
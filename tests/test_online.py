@@ -0,0 +1,155 @@
+"""Tests for online scoring (``run --online``)."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from toolkit_eval_harness.cli import EXIT_CLI_ERROR, EXIT_SUCCESS, main
+from toolkit_eval_harness.online import follow_predictions, run_online
+from toolkit_eval_harness.suite import EvalCase, EvalSuite
+
+
+def _suite(n: int) -> EvalSuite:
+    return EvalSuite(
+        schema_version=1,
+        name="online",
+        description="",
+        created_at="",
+        scoring={},
+        cases=[EvalCase(id=f"c{i}", input=None, expected=i, tags=["t"]) for i in range(n)],
+    )
+
+
+def _line(case_id: str, prediction: Any) -> bytes:
+    return (json.dumps({"id": case_id, "prediction": prediction}) + "\n").encode()
+
+
+def _append_slowly(path: Path, chunks: list[bytes], delay: float) -> threading.Thread:
+    def write() -> None:
+        for chunk in chunks:
+            time.sleep(delay)
+            with path.open("ab") as f:
+                f.write(chunk)
+
+    thread = threading.Thread(target=write)
+    thread.start()
+    return thread
+
+
+async def _collect(path: Path, **kwargs: Any) -> list[tuple[str, Any]]:
+    return [pair async for pair in follow_predictions(path, poll_interval=0.01, **kwargs)]
+
+
+def test_follow_yields_complete_lines_until_every_case_arrives(tmp_path: Path) -> None:
+    path = tmp_path / "preds.jsonl"
+    whole = _line("c0", 0) + _line("c1", 1)
+    # The second line is written in two pieces; it must not be parsed half-written.
+    writer = _append_slowly(path, [whole[:20], whole[20:30], whole[30:]], delay=0.05)
+    pairs = asyncio.run(_collect(path, case_ids=["c0", "c1"], idle_timeout=5))
+    writer.join()
+    assert pairs == [("c0", 0), ("c1", 1)]
+
+
+def test_follow_stops_when_idle_and_skips_malformed_lines(tmp_path: Path) -> None:
+    path = tmp_path / "preds.jsonl"
+    path.write_bytes(_line("c0", 0) + b"{not json\n" + _line("c1", 1))
+    start = time.monotonic()
+    pairs = asyncio.run(_collect(path, case_ids=["c0", "c1", "c2"], idle_timeout=0.2))
+    assert pairs == [("c0", 0), ("c1", 1)]
+    assert time.monotonic() - start < 3
+
+
+def test_follow_waits_for_the_file_to_appear(tmp_path: Path) -> None:
+    path = tmp_path / "later.jsonl"
+    writer = _append_slowly(path, [_line("c0", 0)], delay=0.1)
+    assert asyncio.run(_collect(path, case_ids=["c0"], idle_timeout=5)) == [("c0", 0)]
+    writer.join()
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(_collect(tmp_path / "never.jsonl", idle_timeout=0.05))
+
+
+def test_scoring_overlaps_with_generation(tmp_path: Path) -> None:
+    path = tmp_path / "preds.jsonl"
+    path.touch()
+    scored_at: list[float] = []
+    writer = _append_slowly(path, [_line(f"c{i}", i) for i in range(5)], delay=0.05)
+    report = run_online(
+        suite=_suite(5),
+        source=path,
+        poll_interval=0.01,
+        case_sink=lambda result: scored_at.append(time.monotonic()),
+    )
+    writer_done = time.monotonic()
+    writer.join()
+    assert report.summary["cases"] == 5
+    assert report.summary["score"] == 1.0
+    assert len(scored_at) == 5
+    assert scored_at[0] < writer_done - 0.1
+
+
+def test_stream_source_snapshots_and_missing_cases() -> None:
+    snapshots: list[dict[str, Any]] = []
+    stream = io.BytesIO(_line("c2", 2) + _line("c0", 9))
+    report = run_online(suite=_suite(4), source=stream, on_snapshot=snapshots.append)
+    assert [c["id"] for c in report.cases] == ["c0", "c1", "c2", "c3"]
+    assert [c["score"] for c in report.cases] == [0.0, 0.0, 1.0, 0.0]
+    final = snapshots[-1]
+    assert final["cases_scored"] == final["cases_total"] == 4
+    assert final["score_bounds"] == [0.25, 0.25]
+
+
+def _write_suite_dir(tmp_path: Path, n: int) -> Path:
+    suite_dir = tmp_path / "suite"
+    suite_dir.mkdir()
+    meta = {"schema_version": 1, "name": "online", "description": "", "created_at": ""}
+    (suite_dir / "suite.json").write_text(json.dumps(meta), encoding="utf-8")
+    (suite_dir / "cases.jsonl").write_text(
+        "".join(json.dumps({"id": f"c{i}", "expected": i}) + "\n" for i in range(n)),
+        encoding="utf-8",
+    )
+    return suite_dir
+
+
+def test_cli_online_matches_offline_run(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    suite_dir = _write_suite_dir(tmp_path, 6)
+    preds = tmp_path / "preds.jsonl"
+    preds.write_bytes(b"".join(_line(f"c{i}", i % 2 * i) for i in reversed(range(6))))
+    argv = ["run", "--suite", str(suite_dir), "--predictions", str(preds)]
+    assert main(argv) == EXIT_SUCCESS
+    offline = json.loads(capsys.readouterr().out)
+    assert main([*argv, "--online", "--snapshot-interval", "0"]) == EXIT_SUCCESS
+    captured = capsys.readouterr()
+    online = json.loads(captured.out)
+    assert online["summary"]["score"] == offline["summary"]["score"]
+    assert online["cases"] == offline["cases"]
+    snapshot = json.loads(captured.err.strip().splitlines()[-1])["snapshot"]
+    assert snapshot["cases_scored"] == 6
+
+
+def test_cli_online_reads_stdin(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    suite_dir = _write_suite_dir(tmp_path, 2)
+    stdin = io.TextIOWrapper(io.BytesIO(_line("c0", 0) + _line("c1", 5)))
+    monkeypatch.setattr("sys.stdin", stdin)
+    argv = ["run", "--suite", str(suite_dir), "--predictions", "-", "--online"]
+    assert main(argv) == EXIT_SUCCESS
+    assert json.loads(capsys.readouterr().out)["summary"]["score"] == 0.5
+
+
+def test_cli_online_rejects_offline_only_flags(tmp_path: Path) -> None:
+    suite_dir = _write_suite_dir(tmp_path, 1)
+    argv = ["run", "--suite", str(suite_dir), "--predictions", "-"]
+    assert main(argv) == EXIT_CLI_ERROR
+    journal = ["--journal", str(tmp_path / "j.jsonl")]
+    assert main([*argv, "--online", *journal]) == EXIT_CLI_ERROR
@@ -0,0 +1,99 @@
+"""Tests for OpenMetrics / Prometheus exposition."""
+
+from __future__ import annotations
+
+import json
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from toolkit_eval_harness.cli import EXIT_SUCCESS, main
+from toolkit_eval_harness.metrics import MetricsCollector
+from toolkit_eval_harness.openmetrics import (
+    OPENMETRICS_CONTENT_TYPE,
+    MetricsServer,
+    metric_name,
+    render,
+    write_textfile,
+)
+
+
+def _collector() -> MetricsCollector:
+    mc = MetricsCollector()
+    mc.increment("score_cache.hits", 3)
+    for elapsed in (0.0002, 0.003, 0.003, 2.0):
+        mc.record_time("case.score", elapsed)
+    mc.set_gauge("run.cases_per_second", 125.5)
+    return mc
+
+
+def test_metric_name() -> None:
+    assert metric_name("score_cache.hits") == "toolkit_eval_score_cache_hits"
+    assert metric_name("9x", prefix="") == "_9x"
+
+
+def test_render_openmetrics() -> None:
+    text = render(_collector(), buckets=(0.001, 0.005, 1.0))
+    lines = text.splitlines()
+    assert "# TYPE toolkit_eval_score_cache_hits counter" in lines
+    assert "toolkit_eval_score_cache_hits_total 3" in lines
+    assert "# TYPE toolkit_eval_case_score_seconds histogram" in lines
+    assert 'toolkit_eval_case_score_seconds_bucket{le="0.001"} 1' in lines
+    assert 'toolkit_eval_case_score_seconds_bucket{le="0.005"} 3' in lines
+    assert 'toolkit_eval_case_score_seconds_bucket{le="1"} 3' in lines
+    assert 'toolkit_eval_case_score_seconds_bucket{le="+Inf"} 4' in lines
+    assert "toolkit_eval_case_score_seconds_count 4" in lines
+    assert "toolkit_eval_run_cases_per_second 125.5" in lines
+    assert lines[-1] == "# EOF"
+
+
+def test_textfile_uses_prometheus_format(tmp_path: Path) -> None:
+    path = tmp_path / "textfile" / "eval.prom"
+    write_textfile(_collector(), path)
+    text = path.read_text(encoding="utf-8")
+    assert "# TYPE toolkit_eval_score_cache_hits_total counter" in text
+    assert "# EOF" not in text
+    assert [p.name for p in path.parent.iterdir()] == ["eval.prom"]
+
+
+def test_metrics_server_serves_live_metrics() -> None:
+    mc = _collector()
+    with MetricsServer(mc) as server:
+        url = f"http://127.0.0.1:{server.port}/metrics"
+        request = urllib.request.Request(url, headers={"Accept": "application/openmetrics-text"})
+        with urllib.request.urlopen(request, timeout=5) as resp:
+            assert resp.headers["Content-Type"] == OPENMETRICS_CONTENT_TYPE
+            assert "toolkit_eval_score_cache_hits_total 3" in resp.read().decode()
+        mc.increment("score_cache.hits")
+        with urllib.request.urlopen(url, timeout=5) as resp:
+            body = resp.read().decode()
+        assert "toolkit_eval_score_cache_hits_total 4" in body and "# EOF" not in body
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://127.0.0.1:{server.port}/other", timeout=5)
+
+
+def test_cli_run_writes_textfile(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    suite_dir = tmp_path / "suite"
+    suite_dir.mkdir()
+    suite = {"schema_version": 1, "name": "m", "description": "", "created_at": "", "scoring": {}}
+    (suite_dir / "suite.json").write_text(json.dumps(suite), encoding="utf-8")
+    (suite_dir / "cases.jsonl").write_text(
+        "".join(json.dumps({"id": f"c{i}", "expected": i}) + "\n" for i in range(5)),
+        encoding="utf-8",
+    )
+    preds = tmp_path / "p.jsonl"
+    preds.write_text(
+        "".join(json.dumps({"id": f"c{i}", "prediction": i}) + "\n" for i in range(5)),
+        encoding="utf-8",
+    )
+    prom = tmp_path / "eval.prom"
+    argv = ["run", "--suite", str(suite_dir), "--predictions", str(preds)]
+    assert main([*argv, "--metrics-textfile", str(prom), "--metrics-port", "0"]) == EXIT_SUCCESS
+    capsys.readouterr()
+    text = prom.read_text(encoding="utf-8")
+    assert "toolkit_eval_run_cases 5" in text
+    assert "toolkit_eval_case_score_seconds_count 5" in text
+    assert "toolkit_eval_run_cases_per_second" in text
+    assert "toolkit_eval_run_worker_utilization" in text
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import json
+import zipfile
 from pathlib import Path
 
+import pytest
+
 from toolkit_eval_harness.pack import create_pack, load_suite_from_path
 
 
@@ -33,3 +36,32 @@ def test_load_suite_from_zip_twice_cleans_unpack_dir(tmp_path: Path) -> None:
     b = load_suite_from_path(pack)
     assert a.name == "demo"
     assert b.name == "demo"
+
+
+def test_load_suite_from_zip_writes_nothing_to_disk(tmp_path: Path) -> None:
+    suite_dir = tmp_path / "suite"
+    suite_dir.mkdir()
+    (suite_dir / "suite.json").write_text(json.dumps({"name": "inzip"}), encoding="utf-8")
+    (suite_dir / "cases.jsonl").write_text(
+        "".join(
+            json.dumps({"id": f"c{i}", "expected": i, "tags": ["t"]}) + "\n" for i in range(5)
+        ),
+        encoding="utf-8",
+    )
+    packs = tmp_path / "packs"
+    pack = packs / "suite.zip"
+    create_pack(suite_dir=suite_dir, out_zip=pack)
+    before = sorted(packs.iterdir())
+
+    suite = load_suite_from_path(pack)
+    assert [c.id for c in suite.cases] == [f"c{i}" for i in range(5)]
+    assert suite.cases[3].expected == 3
+    assert sorted(packs.iterdir()) == before
+
+
+def test_load_suite_from_zip_missing_member_raises(tmp_path: Path) -> None:
+    pack = tmp_path / "broken.zip"
+    with zipfile.ZipFile(pack, "w") as zf:
+        zf.writestr("suite.json", json.dumps({"name": "x"}))
+    with pytest.raises(ValueError, match="missing_member:cases.jsonl"):
+        load_suite_from_path(pack)
@@ -0,0 +1,135 @@
+"""Tests for parallel, chunked suite scoring."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from toolkit_eval_harness.cli import EXIT_CLI_ERROR, EXIT_SUCCESS, build_parser, main
+from toolkit_eval_harness.parallel import iter_chunks, map_chunks, resolve_chunk_size
+from toolkit_eval_harness.plugins import _reset_registry, register_scorer
+from toolkit_eval_harness.runner import run_suite
+from toolkit_eval_harness.suite import read_suite_dir
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry() -> Any:
+    _reset_registry()
+    yield
+    _reset_registry()
+
+
+def _length_scorer(*, expected: Any, predicted: Any, **kwargs: Any) -> tuple[float, dict[str, Any]]:
+    same = len(str(expected)) == len(str(predicted))
+    return (1.0 if same else 0.0), {"same_length": same}
+
+
+def _square(offset: int, chunk: list[int]) -> list[int]:
+    return [offset + x * x for x in chunk]
+
+
+def _make_suite(tmp_path: Path, n: int, scoring: dict[str, Any] | None = None) -> Path:
+    suite_dir = tmp_path / "suite"
+    suite_dir.mkdir()
+    (suite_dir / "suite.json").write_text(
+        json.dumps({"schema_version": 1, "name": "par", "scoring": scoring or {}}),
+        encoding="utf-8",
+    )
+    (suite_dir / "cases.jsonl").write_text(
+        "".join(
+            json.dumps({"id": f"c{i:04d}", "input": i, "expected": f"v{i}", "tags": [f"t{i % 3}"]})
+            + "\n"
+            for i in range(n)
+        ),
+        encoding="utf-8",
+    )
+    return suite_dir
+
+
+def _write_preds(tmp_path: Path, n: int) -> Path:
+    preds = tmp_path / "preds.jsonl"
+    preds.write_text(
+        "".join(
+            json.dumps({"id": f"c{i:04d}", "prediction": f"v{i}" if i % 2 else f"w{i}"}) + "\n"
+            for i in reversed(range(n))
+        ),
+        encoding="utf-8",
+    )
+    return preds
+
+
+class TestChunking:
+    def test_iter_chunks_sizes(self) -> None:
+        assert list(iter_chunks(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+        assert list(iter_chunks([], 3)) == []
+
+    def test_resolve_chunk_size(self) -> None:
+        assert resolve_chunk_size(total=10, workers=1) == 3
+        assert resolve_chunk_size(total=10_000_000, workers=4) == 256
+        assert resolve_chunk_size(total=0, workers=4) == 1
+        assert resolve_chunk_size(total=100, workers=4, chunk_size=7) == 7
+        with pytest.raises(ValueError, match="chunk_size"):
+            resolve_chunk_size(total=100, workers=4, chunk_size=0)
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_map_chunks_preserves_order(self, executor: str) -> None:
+        chunks = list(iter_chunks(range(50), 4))
+        out = list(map_chunks(_square, chunks, workers=3, executor=executor, args=(1,)))
+        assert [x for chunk in out for x in chunk] == [1 + x * x for x in range(50)]
+
+    def test_map_chunks_unknown_executor(self) -> None:
+        with pytest.raises(ValueError, match="Unknown executor"):
+            list(map_chunks(_square, [[1]], workers=2, executor="gpu", args=(0,)))
+
+
+class TestParallelRunSuite:
+    @pytest.mark.parametrize(("workers", "executor"), [(4, "thread"), (2, "process")])
+    def test_parallel_matches_serial(
+        self, tmp_path: Path, workers: int, executor: str
+    ) -> None:
+        register_scorer("length", _length_scorer)
+        suite = read_suite_dir(_make_suite(tmp_path, 40, {"scorers": ["length"]}))
+        preds = _write_preds(tmp_path, 40)
+
+        serial = run_suite(suite=suite, predictions_path=preds)
+        parallel = run_suite(
+            suite=suite,
+            predictions_path=preds,
+            workers=workers,
+            executor=executor,
+            chunk_size=3,
+        )
+        assert [c["id"] for c in parallel.cases] == [c.id for c in suite.cases]
+        assert parallel.cases == serial.cases
+        assert parallel.summary == serial.summary
+
+
+class TestRunWorkersFlag:
+    def test_workers_flag_parsed(self) -> None:
+        args = build_parser().parse_args(
+            ["run", "--suite", "s", "--predictions", "p", "--workers", "8", "--executor", "process"]
+        )
+        assert args.workers == 8
+        assert args.executor == "process"
+
+    def test_run_with_workers(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        suite_dir = _make_suite(tmp_path, 10)
+        preds = _write_preds(tmp_path, 10)
+        rc = main(
+            ["run", "--suite", str(suite_dir), "--predictions", str(preds), "--workers", "3"]
+        )
+        assert rc == EXIT_SUCCESS
+        out = json.loads(capsys.readouterr().out)
+        assert [c["id"] for c in out["cases"]] == [f"c{i:04d}" for i in range(10)]
+        assert out["summary"]["pass_count"] == 5
+
+    def test_run_rejects_zero_workers(self, tmp_path: Path) -> None:
+        suite_dir = _make_suite(tmp_path, 2)
+        preds = _write_preds(tmp_path, 2)
+        rc = main(
+            ["run", "--suite", str(suite_dir), "--predictions", str(preds), "--workers", "0"]
+        )
+        assert rc == EXIT_CLI_ERROR
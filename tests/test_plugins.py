@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import json
+import sys
+from pathlib import Path
 from typing import Any
 
 import pytest
 
+from toolkit_eval_harness import plugins
+from toolkit_eval_harness.cli import EXIT_SUCCESS, main
 from toolkit_eval_harness.plugins import (
+    ENTRY_POINT_CACHE_ENV,
+    ENTRY_POINT_GROUP,
     _reset_registry,
     get_scorer,
+    is_batch_scorer,
     list_scorers,
     register_scorer,
     unregister_scorer,
@@ -96,3 +104,93 @@ def test_scorer_returns_tuple() -> None:
     assert len(result) == 2
     assert isinstance(result[0], float)
     assert isinstance(result[1], dict)
+
+
+# ---------------------------------------------------------------------------
+# Entry-point discovery
+# ---------------------------------------------------------------------------
+
+
+_PLUGIN_MODULE = '''
+from toolkit_eval_harness.plugins import batch_scorer
+
+def score(*, expected, predicted, **kw):
+    return 1.0, {}
+
+@batch_scorer
+def batch(*, expected, predicted, **kw):
+    return [(1.0, {}) for _ in predicted]
+'''
+
+
+@pytest.fixture()
+def plugin_dist(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """An installed-looking distribution declaring three scorer entry points."""
+    site = tmp_path / "site"
+    dist = site / "fake_scorers-1.0.dist-info"
+    dist.mkdir(parents=True)
+    (dist / "METADATA").write_text("Metadata-Version: 2.1\nName: fake-scorers\nVersion: 1.0\n")
+    (dist / "entry_points.txt").write_text(
+        f"[{ENTRY_POINT_GROUP}]\n"
+        "fake_score = fake_scorers_mod:score\n"
+        "fake_batch = fake_scorers_mod:batch\n"
+        "fake_broken = fake_scorers_missing:score\n"
+    )
+    (site / "fake_scorers_mod.py").write_text(_PLUGIN_MODULE)
+    monkeypatch.syspath_prepend(str(site))
+    monkeypatch.delitem(sys.modules, "fake_scorers_mod", raising=False)
+    monkeypatch.setenv(ENTRY_POINT_CACHE_ENV, str(tmp_path / "cache" / "eps.json"))
+    return site
+
+
+def test_entry_points_listed_without_import(plugin_dist: Path) -> None:
+    assert {"fake_score", "fake_batch", "fake_broken"} <= set(list_scorers())
+    assert "fake_scorers_mod" not in sys.modules
+    assert get_scorer("fake_score")(expected=1, predicted=1) == (1.0, {})
+    assert "fake_scorers_mod" in sys.modules
+    assert is_batch_scorer("fake_batch") and not is_batch_scorer("fake_score")
+    with pytest.raises(KeyError, match="not found"):
+        get_scorer("fake_broken")
+    assert "fake_broken" not in list_scorers()
+
+
+def test_check_deps_resolves_entry_point_scorers(
+    plugin_dist: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    assert main(["check-deps"]) == EXIT_SUCCESS
+    result = json.loads(capsys.readouterr().out)
+    assert {"fake_score", "fake_batch"} <= set(result["registered_scorers"])
+    assert result["unavailable_scorers"] == ["fake_broken"]
+
+
+def test_entry_point_cache_reused_until_environment_changes(
+    plugin_dist: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    list_scorers()
+    cache = json.loads((tmp_path / "cache" / "eps.json").read_text())
+    assert cache["scorers"]["fake_score"] == "fake_scorers_mod:score"
+
+    def no_scan() -> dict[str, str]:
+        raise AssertionError("entry points rescanned despite a valid cache")
+
+    _reset_registry()
+    with monkeypatch.context() as m:
+        m.setattr(plugins, "_scan_entry_points", no_scan)
+        assert "fake_batch" in list_scorers()
+
+    # Installing another distribution changes the fingerprint.
+    other = plugin_dist / "other_scorers-2.0.dist-info"
+    other.mkdir()
+    (other / "METADATA").write_text("Metadata-Version: 2.1\nName: other-scorers\nVersion: 2.0\n")
+    (other / "entry_points.txt").write_text(f"[{ENTRY_POINT_GROUP}]\nother = other_mod:score\n")
+    _reset_registry()
+    assert "other" in list_scorers()
+    assert "other" in json.loads((tmp_path / "cache" / "eps.json").read_text())["scorers"]
+
+
+def test_registered_scorer_shadows_entry_point(plugin_dist: Path) -> None:
+    register_scorer("fake_score", _dummy_scorer)
+    assert get_scorer("fake_score") is _dummy_scorer
+    unregister_scorer("fake_score")
+    with pytest.raises(KeyError):
+        get_scorer("fake_score")
@@ -0,0 +1,129 @@
+"""Tests for predictions readers and the streaming case/prediction join."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from toolkit_eval_harness.cli import EXIT_SUCCESS, main
+from toolkit_eval_harness.diskindex import DiskIndex
+from toolkit_eval_harness.io import jsonl_line_id
+from toolkit_eval_harness.predictions import join_predictions, read_predictions
+from toolkit_eval_harness.runner import run_suite
+from toolkit_eval_harness.suite import EvalCase, EvalSuite
+
+
+def _cases(ids: list[str]) -> list[EvalCase]:
+    return [EvalCase(id=i, input=None, expected=f"v-{i}", tags=[]) for i in ids]
+
+
+def _write(path: Path, rows: list[dict[str, Any]]) -> Path:
+    path.write_text("".join(json.dumps(r) + "\n" for r in rows) + "\n", encoding="utf-8")
+    return path
+
+
+class TestJsonlLineId:
+    @pytest.mark.parametrize(
+        ("line", "expected"),
+        [
+            (b'{"id": "c1", "prediction": "x"}\n', "c1"),
+            (b'{"id": 7, "prediction": "x"}\n', "7"),
+            (b'{"prediction": "x", "id": "late"}\n', "late"),
+            (b'{"id": "a\\"b", "prediction": 1}', 'a"b'),
+            (b'{"id": "' + b"x" * 1000 + b'"}', "x" * 1000),
+        ],
+    )
+    def test_extracts_id(self, line: bytes, expected: str) -> None:
+        assert jsonl_line_id(line) == expected
+
+    def test_missing_id_raises(self) -> None:
+        with pytest.raises(KeyError):
+            jsonl_line_id(b'{"prediction": "x"}')
+
+
+class TestDiskIndex:
+    def test_put_get_and_order(self) -> None:
+        with DiskIndex() as idx:
+            assert idx.put_many([("b", 2), ("a", 1), ("b", 3)]) == 3
+            assert idx.get("b") == 3
+            assert idx.get("missing") is None
+            assert list(idx.items()) == [("a", 1), ("b", 3)]
+            assert len(idx) == 2
+
+
+class TestJoinPredictions:
+    @pytest.mark.parametrize("sorted_preds", [True, False])
+    def test_join_matches_dict_reader(self, tmp_path: Path, sorted_preds: bool) -> None:
+        ids = [f"c{i:03d}" for i in range(30)]
+        rows = [{"id": i, "prediction": f"p-{i}"} for i in ids if i != "c007"]
+        if not sorted_preds:
+            rows.reverse()
+        rows.append({"id": "c003", "prediction": "override"})
+        rows.append({"id": "zzz-unknown", "prediction": "ignored"})
+        if sorted_preds:
+            rows.sort(key=lambda r: r["id"])
+        preds = _write(tmp_path / "preds.jsonl", rows)
+
+        expected = read_predictions(preds)
+        joined = list(join_predictions(_cases(ids), preds))
+        assert [c.id for c, _ in joined] == ids
+        assert {c.id: p for c, p in joined} == {i: expected.get(i) for i in ids}
+        assert dict((c.id, p) for c, p in joined)["c003"] == "override"
+        assert dict((c.id, p) for c, p in joined)["c007"] is None
+
+    def test_unsorted_cases_use_index(self, tmp_path: Path) -> None:
+        preds = _write(
+            tmp_path / "preds.jsonl",
+            [{"id": "a", "prediction": 1}, {"id": "b", "prediction": 2}],
+        )
+        joined = list(join_predictions(_cases(["b", "a", "b"]), preds))
+        assert [p for _, p in joined] == [2, 1, 2]
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            join_predictions(_cases(["a"]), tmp_path / "nope.jsonl")
+
+
+class TestStreamingRunSuite:
+    def test_streaming_matches_in_memory(self, tmp_path: Path) -> None:
+        ids = [f"c{i}" for i in range(12)]
+        suite = EvalSuite(
+            schema_version=1,
+            name="stream",
+            description="",
+            created_at="",
+            scoring={},
+            cases=_cases(ids),
+        )
+        preds = _write(
+            tmp_path / "preds.jsonl",
+            [{"id": i, "prediction": f"v-{i}" if n % 3 else "nope"} for n, i in enumerate(ids)],
+        )
+        a = run_suite(suite=suite, predictions_path=preds)
+        b = run_suite(suite=suite, predictions_path=preds, stream_predictions=True)
+        assert a.cases == b.cases
+        assert a.summary == b.summary
+
+    def test_cli_stream_predictions(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        suite_dir = tmp_path / "suite"
+        suite_dir.mkdir()
+        (suite_dir / "suite.json").write_text(json.dumps({"name": "s"}), encoding="utf-8")
+        _write(suite_dir / "cases.jsonl", [{"id": "c1", "expected": "y"}])
+        preds = _write(tmp_path / "preds.jsonl", [{"id": "c1", "prediction": "y"}])
+        rc = main(
+            [
+                "run",
+                "--suite",
+                str(suite_dir),
+                "--predictions",
+                str(preds),
+                "--stream-predictions",
+            ]
+        )
+        assert rc == EXIT_SUCCESS
+        assert json.loads(capsys.readouterr().out)["summary"]["score"] == 1.0
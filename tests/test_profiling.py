@@ -0,0 +1,129 @@
+"""Tests for run phase / per-scorer profiling."""
+
+from __future__ import annotations
+
+import json
+import pstats
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from toolkit_eval_harness.cli import EXIT_SUCCESS, main
+from toolkit_eval_harness.metrics import MetricsCollector
+from toolkit_eval_harness.plugins import _reset_registry, batch_scorer, register_scorer
+from toolkit_eval_harness.profiling import RunProfiler
+from toolkit_eval_harness.runner import run_suite
+from toolkit_eval_harness.suite import EvalCase, EvalSuite
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry() -> Any:
+    _reset_registry()
+    yield
+    _reset_registry()
+
+
+def _slow(*, expected: Any, predicted: Any, **kw: Any) -> tuple[float, dict[str, Any]]:
+    time.sleep(0.01)
+    return 1.0, {}
+
+
+def _fast(*, expected: Any, predicted: Any, **kw: Any) -> tuple[float, dict[str, Any]]:
+    return 0.0, {}
+
+
+@batch_scorer
+def _batched(*, expected: list[Any], predicted: list[Any], **kw: Any) -> list[Any]:
+    return [(0.5, {}) for _ in predicted]
+
+
+def _write_suite(tmp_path: Path, scorers: list[str], n: int = 4) -> tuple[Path, Path]:
+    suite_dir = tmp_path / "suite"
+    suite_dir.mkdir()
+    suite = {
+        "schema_version": 1,
+        "name": "prof",
+        "description": "",
+        "created_at": "",
+        "scoring": {"scorers": scorers},
+    }
+    (suite_dir / "suite.json").write_text(json.dumps(suite), encoding="utf-8")
+    (suite_dir / "cases.jsonl").write_text(
+        "".join(json.dumps({"id": f"c{i}", "expected": i}) + "\n" for i in range(n)),
+        encoding="utf-8",
+    )
+    preds = tmp_path / "p.jsonl"
+    preds.write_text(
+        "".join(json.dumps({"id": f"c{i}", "prediction": i}) + "\n" for i in range(n)),
+        encoding="utf-8",
+    )
+    return suite_dir, preds
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_scorer_time_attributed_per_plugin(tmp_path: Path, executor: str) -> None:
+    register_scorer("slow", _slow)
+    register_scorer("fast", _fast)
+    register_scorer("batched", _batched)
+    _, preds = _write_suite(tmp_path, [])
+    suite = EvalSuite(
+        schema_version=1,
+        name="prof",
+        description="",
+        created_at="",
+        scoring={"scorers": ["slow", "fast", "batched"]},
+        cases=[EvalCase(id=f"c{i}", input=None, expected=i, tags=[]) for i in range(4)],
+    )
+    profiler = RunProfiler(MetricsCollector())
+    with profiler:
+        run_suite(
+            suite=suite,
+            predictions_path=preds,
+            workers=2,
+            executor=executor,
+            batch_size=2,
+            collector=profiler.collector,
+        )
+    breakdown = profiler.breakdown()
+    scorers = breakdown["scorers"]
+    assert set(scorers) == {"slow", "fast", "batched"}
+    assert scorers["slow"]["calls"] == 4 and scorers["slow"]["seconds"] >= 0.035
+    assert scorers["fast"]["seconds"] < scorers["slow"]["seconds"]
+    assert scorers["batched"]["calls"] == 2
+    assert list(breakdown["phases"]) == ["load_predictions", "score"]
+
+
+def test_cli_profile_writes_breakdown_and_pstats(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    register_scorer("slow", _slow)
+    suite_dir, preds = _write_suite(tmp_path, ["slow"])
+    out = tmp_path / "out" / "report.json"
+    argv = ["run", "--suite", str(suite_dir), "--predictions", str(preds), "--out", str(out)]
+    assert main([*argv, "--workers", "1", "--profile", "cprofile"]) == EXIT_SUCCESS
+    assert json.loads(capsys.readouterr().out)["summary"]["cases"] == 4
+    breakdown = json.loads((tmp_path / "out" / "report.json.profile.json").read_text())
+    assert list(breakdown["phases"]) == [
+        "load_suite",
+        "load_predictions",
+        "score",
+        "serialize",
+        "write",
+    ]
+    assert breakdown["scorers"]["slow"]["calls"] == 4
+    assert 0 < breakdown["phases"]["score"]["pct"] <= 100
+    stats = pstats.Stats(str(tmp_path / "out" / "report.json.pstats"))
+    assert any(func[2] == "_slow" for func in stats.stats)  # type: ignore[attr-defined]
+
+
+def test_cli_without_profile_writes_nothing(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    suite_dir, preds = _write_suite(tmp_path, [])
+    out = tmp_path / "report.json"
+    argv = ["run", "--suite", str(suite_dir), "--predictions", str(preds), "--out", str(out)]
+    assert main(argv) == EXIT_SUCCESS
+    capsys.readouterr()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["p.jsonl", "report.json", "suite"]
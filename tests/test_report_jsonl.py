@@ -0,0 +1,141 @@
+"""Tests for the streaming JSONL report format."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from toolkit_eval_harness.cli import EXIT_CLI_ERROR, EXIT_SUCCESS, EXIT_VALIDATION_FAILED, main
+from toolkit_eval_harness.report import (
+    EvalReport,
+    JsonlReportWriter,
+    write_report_json,
+    write_report_jsonl,
+)
+from toolkit_eval_harness.runner import run_suite
+from toolkit_eval_harness.suite import EvalCase, EvalSuite
+
+
+def _report(n: int) -> EvalReport:
+    cases = [{"id": f"c{i}", "score": float(i % 2), "tags": ["t"]} for i in range(n)]
+    return EvalReport(
+        suite={"name": "s"},
+        summary={"cases": n, "score": 0.5},
+        cases=cases,
+        metadata={"tool_version": "x"},
+    )
+
+
+def test_jsonl_round_trip_streams_cases(tmp_path: Path) -> None:
+    report = _report(5)
+    path = tmp_path / "r.jsonl"
+    write_report_jsonl(report, path)
+    loaded = EvalReport.load(path)
+    assert loaded.cases == () and loaded.cases_path == path
+    assert loaded.summary == report.summary and loaded.metadata == report.metadata
+    assert list(loaded.iter_cases()) == report.cases
+    assert loaded.to_dict() == report.to_dict()
+
+
+def test_load_reads_json_reports(tmp_path: Path) -> None:
+    path = tmp_path / "r.json"
+    write_report_json(_report(3), path)
+    loaded = EvalReport.load(path)
+    assert loaded.cases_path is None
+    assert list(loaded.iter_cases()) == _report(3).cases
+
+
+def test_load_rejects_directories(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="not a file"):
+        EvalReport.load(tmp_path)
+    report = tmp_path / "r.json"
+    write_report_json(_report(1), report)
+    rc = main(["compare", "--baseline", str(tmp_path), "--candidate", str(report)])
+    assert rc == EXIT_CLI_ERROR
+
+
+def test_interrupted_writer_leaves_no_report(tmp_path: Path) -> None:
+    path = tmp_path / "r.jsonl"
+    with pytest.raises(RuntimeError):
+        with JsonlReportWriter(path, suite={}) as writer:
+            writer.write_case({"id": "c0"})
+            raise RuntimeError("killed")
+    assert not path.exists()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_missing_trailer_is_rejected(tmp_path: Path) -> None:
+    path = tmp_path / "r.jsonl"
+    write_report_jsonl(_report(2), path)
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    path.write_text("".join(lines[:-1]), encoding="utf-8")
+    with pytest.raises(ValueError, match="missing_summary"):
+        EvalReport.load(path)
+
+
+def test_run_suite_case_sink_keeps_order(tmp_path: Path) -> None:
+    suite = EvalSuite(
+        schema_version=1,
+        name="sink",
+        description="",
+        created_at="",
+        scoring={},
+        cases=[EvalCase(id=f"c{i}", input=None, expected=i, tags=[]) for i in range(20)],
+    )
+    preds = tmp_path / "p.jsonl"
+    preds.write_text(
+        "".join(json.dumps({"id": f"c{i}", "prediction": i}) + "\n" for i in range(20)),
+        encoding="utf-8",
+    )
+    seen: list[dict[str, Any]] = []
+    report = run_suite(
+        suite=suite, predictions_path=preds, workers=3, chunk_size=2, case_sink=seen.append
+    )
+    assert report.cases == []
+    assert [c["id"] for c in seen] == [f"c{i}" for i in range(20)]
+    assert report.summary == {"cases": 20, "score": 1.0}
+
+
+def _write_suite(tmp_path: Path) -> tuple[Path, Path]:
+    suite_dir = tmp_path / "suite"
+    suite_dir.mkdir()
+    (suite_dir / "suite.json").write_text(
+        json.dumps(
+            {"schema_version": 1, "name": "cli", "description": "", "created_at": "", "scoring": {}}
+        ),
+        encoding="utf-8",
+    )
+    (suite_dir / "cases.jsonl").write_text(
+        "".join(json.dumps({"id": f"c{i}", "expected": i}) + "\n" for i in range(4)),
+        encoding="utf-8",
+    )
+    preds = tmp_path / "p.jsonl"
+    preds.write_text(
+        "".join(json.dumps({"id": f"c{i}", "prediction": i if i else -1}) + "\n" for i in range(4)),
+        encoding="utf-8",
+    )
+    return suite_dir, preds
+
+
+def test_cli_run_streams_jsonl_report(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    suite_dir, preds = _write_suite(tmp_path)
+    out = tmp_path / "report.jsonl"
+    argv = ["run", "--suite", str(suite_dir), "--predictions", str(preds), "--out", str(out)]
+    assert main(argv) == EXIT_SUCCESS
+    emitted = json.loads(capsys.readouterr().out)
+    assert "cases" not in emitted and emitted["report_path"] == str(out)
+    assert emitted["summary"]["pass_count"] == 3 and emitted["summary"]["fail_count"] == 1
+
+    loaded = EvalReport.load(out)
+    assert loaded.summary["pass_count"] == 3
+    assert [c["id"] for c in loaded.iter_cases()] == ["c0", "c1", "c2", "c3"]
+    assert loaded.metadata["tool_version"]
+
+    assert main(["validate-report", "--report", str(out)]) == EXIT_SUCCESS
+    assert main(["compare", "--baseline", str(out), "--candidate", str(out)]) == EXIT_SUCCESS
+
+    out.write_text(out.read_text(encoding="utf-8").splitlines()[0] + "\n", encoding="utf-8")
+    assert main(["validate-report", "--report", str(out)]) == EXIT_VALIDATION_FAILED
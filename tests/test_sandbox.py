@@ -0,0 +1,181 @@
+"""Tests for process-isolated plugin scorers."""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from toolkit_eval_harness.cli import EXIT_SUCCESS, main
+from toolkit_eval_harness.plugins import _reset_registry, batch_scorer, register_scorer
+from toolkit_eval_harness.runner import run_suite
+from toolkit_eval_harness.sandbox import SandboxLimits, ScorerSandbox
+from toolkit_eval_harness.suite import EvalCase, EvalSuite
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry() -> Any:
+    _reset_registry()
+    yield
+    _reset_registry()
+
+
+def _pid(*, expected: Any, predicted: Any, **kw: Any) -> tuple[float, dict[str, Any]]:
+    return 1.0, {"pid": os.getpid()}
+
+
+def _hang_on_slow(*, expected: Any, predicted: Any, **kw: Any) -> tuple[float, dict[str, Any]]:
+    if predicted == "slow":
+        time.sleep(30)
+    return 0.5, {}
+
+
+def _die(*, expected: Any, predicted: Any, **kw: Any) -> tuple[float, dict[str, Any]]:
+    os._exit(3)
+
+
+def _raise(*, expected: Any, predicted: Any, **kw: Any) -> tuple[float, dict[str, Any]]:
+    raise ValueError("bad prediction")
+
+
+def _hog(*, expected: Any, predicted: Any, **kw: Any) -> tuple[float, dict[str, Any]]:
+    blob = bytearray(512 * 1024 * 1024)
+    return float(len(blob)), {}
+
+
+def test_calls_run_in_worker_and_recycle() -> None:
+    scorers = {"pid": _pid}
+    with ScorerSandbox(scorers, SandboxLimits(recycle_after=2)) as sandbox:
+        pids = [sandbox.call("pid", expected=1, predicted=1)[1]["pid"] for _ in range(4)]
+    assert os.getpid() not in pids
+    assert pids[0] == pids[1] and pids[2] == pids[3] and pids[1] != pids[2]
+
+
+def test_timeout_crash_and_error_recover() -> None:
+    scorers = {"hang": _hang_on_slow, "die": _die, "raise": _raise}
+    with ScorerSandbox(scorers, SandboxLimits(timeout_seconds=0.5)) as sandbox:
+        start = time.monotonic()
+        with pytest.raises(TimeoutError):
+            sandbox.call("hang", expected=1, predicted="slow")
+        assert time.monotonic() - start < 10
+        assert sandbox.call("hang", expected=1, predicted="ok") == (0.5, {})
+        with pytest.raises(ChildProcessError):
+            sandbox.call("die", expected=1, predicted=1)
+        with pytest.raises(RuntimeError, match="bad prediction"):
+            sandbox.call("raise", expected=1, predicted=1)
+        with pytest.raises(KeyError):
+            sandbox.call("missing", expected=1, predicted=1)
+
+
+def test_memory_ceiling() -> None:
+    pytest.importorskip("resource")
+    limits = SandboxLimits(max_memory_bytes=256 * 1024 * 1024)
+    with ScorerSandbox({"hog": _hog, "pid": _pid}, limits) as sandbox:
+        with pytest.raises((MemoryError, ChildProcessError)):
+            sandbox.call("hog", expected=1, predicted=1)
+        assert sandbox.call("pid", expected=1, predicted=1)[0] == 1.0
+
+
+def test_pickles_to_config() -> None:
+    sandbox = ScorerSandbox({"pid": _pid}, SandboxLimits(timeout_seconds=5), size=3)
+    clone = pickle.loads(pickle.dumps(sandbox))
+    assert clone.limits == sandbox.limits and clone.size == 1
+    assert clone.call("pid", expected=1, predicted=1)[0] == 1.0
+    clone.close()
+
+
+def _suite(scorers: list[str], n: int = 3) -> EvalSuite:
+    return EvalSuite(
+        schema_version=1,
+        name="sandbox",
+        description="",
+        created_at="",
+        scoring={"scorers": scorers},
+        cases=[EvalCase(id=f"c{i}", input=None, expected=i, tags=[]) for i in range(n)],
+    )
+
+
+def _preds(tmp_path: Path, values: list[Any]) -> Path:
+    path = tmp_path / "p.jsonl"
+    path.write_text(
+        "".join(json.dumps({"id": f"c{i}", "prediction": v}) + "\n" for i, v in enumerate(values)),
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_run_suite_records_timeouts(tmp_path: Path, executor: str) -> None:
+    register_scorer("hang", _hang_on_slow)
+    report = run_suite(
+        suite=_suite(["hang"]),
+        predictions_path=_preds(tmp_path, ["ok", "slow", "ok"]),
+        workers=2,
+        executor=executor,
+        chunk_size=1,
+        isolation=SandboxLimits(timeout_seconds=0.5),
+    )
+    plugins = [c["plugins"]["hang"] for c in report.cases]
+    assert plugins == [{"score": 0.5}, {"score": 0.0, "error": "timeout"}, {"score": 0.5}]
+
+
+def test_process_pool_workers_reuse_their_sandbox(tmp_path: Path) -> None:
+    register_scorer("pid", _pid)
+    report = run_suite(
+        suite=_suite(["pid"], n=20),
+        predictions_path=_preds(tmp_path, list(range(20))),
+        workers=2,
+        executor="process",
+        chunk_size=1,
+        isolation=SandboxLimits(),
+    )
+    # One sandbox worker per pool worker, not one per chunk.
+    assert len({c["plugins"]["pid"]["pid"] for c in report.cases}) <= 2
+
+
+def test_run_suite_isolates_batch_scorers(tmp_path: Path) -> None:
+    @batch_scorer
+    def where(*, expected: list[Any], predicted: list[Any], **kw: Any) -> list[Any]:
+        return [(1.0, {"pid": os.getpid()}) for _ in predicted]
+
+    register_scorer("where", where)
+    report = run_suite(
+        suite=_suite(["where"]),
+        predictions_path=_preds(tmp_path, [1, 2, 3]),
+        isolation=SandboxLimits(),
+    )
+    assert {c["plugins"]["where"]["pid"] for c in report.cases} != {os.getpid()}
+
+
+def test_cli_isolate_plugins(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    register_scorer("hang", _hang_on_slow)
+    suite_dir = tmp_path / "suite"
+    suite_dir.mkdir()
+    (suite_dir / "suite.json").write_text(
+        json.dumps(
+            {
+                "schema_version": 1,
+                "name": "sandbox",
+                "description": "",
+                "created_at": "",
+                "scoring": {"scorers": ["hang"]},
+            }
+        ),
+        encoding="utf-8",
+    )
+    (suite_dir / "cases.jsonl").write_text(
+        "".join(json.dumps({"id": f"c{i}", "expected": i}) + "\n" for i in range(2)),
+        encoding="utf-8",
+    )
+    out = tmp_path / "report.json"
+    argv = ["run", "--suite", str(suite_dir), "--predictions", str(_preds(tmp_path, ["slow", 1]))]
+    rc = main([*argv, "--isolate-plugins", "--plugin-timeout", "0.5", "--out", str(out)])
+    assert rc == EXIT_SUCCESS
+    cases = json.loads(out.read_text(encoding="utf-8"))["cases"]
+    assert cases[0]["plugins"]["hang"]["error"] == "timeout"
+    assert main([*argv, "--isolate-plugins", "--plugin-timeout", "0"]) == 2
@@ -0,0 +1,164 @@
+"""Tests for persistent scorer memoization."""
+
+from __future__ import annotations
+
+import json
+import pickle
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from toolkit_eval_harness.cli import EXIT_SUCCESS, main
+from toolkit_eval_harness.metrics import MetricsCollector
+from toolkit_eval_harness.plugins import _reset_registry, register_scorer
+from toolkit_eval_harness.runner import run_suite
+from toolkit_eval_harness.score_cache import ScoreCache, case_digest, score_key, scorer_version
+from toolkit_eval_harness.suite import EvalCase, EvalSuite
+
+CALLS: list[Any] = []
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry() -> Any:
+    _reset_registry()
+    CALLS.clear()
+    yield
+    _reset_registry()
+
+
+def _slow_scorer(*, expected: Any, predicted: Any, **kwargs: Any) -> tuple[float, dict[str, Any]]:
+    CALLS.append(predicted)
+    return (0.5 if predicted else 0.0), {"parsed": [1, 2]}
+
+
+def _suite(n: int) -> EvalSuite:
+    return EvalSuite(
+        schema_version=1,
+        name="memo",
+        description="",
+        created_at="",
+        scoring={"scorers": ["slow"], "json_schema": {"required_keys": ["a"]}},
+        cases=[EvalCase(id=f"c{i}", input=None, expected={"a": i}, tags=[]) for i in range(n)],
+    )
+
+
+def _preds(tmp_path: Path, values: dict[str, Any], name: str = "p.jsonl") -> Path:
+    path = tmp_path / name
+    path.write_text(
+        "".join(json.dumps({"id": k, "prediction": v}) + "\n" for k, v in values.items()),
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_keys_depend_on_scorer_version_and_config() -> None:
+    digest = case_digest(expected={"a": 1}, predicted="x")
+    base = score_key(scorer="s", version="1", case=digest)
+    assert base != score_key(scorer="s", version="2", case=digest)
+    assert base != score_key(scorer="s", version="1", case=digest, config={"k": 1})
+
+    def versioned(**kw: Any) -> tuple[float, dict[str, Any]]:
+        return 0.0, {}
+
+    assert scorer_version(versioned) == "0"
+    versioned.version = 3  # type: ignore[attr-defined]
+    assert scorer_version(versioned) == "3"
+
+
+def test_cache_put_get_commit(tmp_path: Path) -> None:
+    cache = ScoreCache(tmp_path)
+    cache.put("k", 0.25, {"m": True})
+    cache.put("bad", 1.0, {"obj": object()})
+    assert cache.get("k") is None
+    cache.commit()
+    assert cache.get("k") == (0.25, {"m": True})
+    assert cache.get("bad") is None
+    clone = pickle.loads(pickle.dumps(cache))
+    assert clone.get("k") == (0.25, {"m": True})
+    cache.close()
+
+
+def test_lru_eviction(tmp_path: Path) -> None:
+    cache = ScoreCache(tmp_path, max_bytes=10_000)
+    for i in range(3):
+        cache.put(f"k{i}", 1.0, {"pad": "x" * 50})
+        cache.commit()
+    cache.get("k0")
+    cache.commit()
+    per_entry = cache.total_bytes // 3
+    cache.max_bytes = per_entry * 3
+    cache.put("k3", 1.0, {"pad": "x" * 50})
+    cache.commit()
+    assert len(cache) == 3
+    assert cache.total_bytes <= cache.max_bytes
+    assert cache.get("k1") is None
+    assert cache.get("k0") is not None
+
+
+@pytest.mark.parametrize(("workers", "executor"), [(1, "thread"), (3, "thread"), (2, "process")])
+def test_run_suite_memoizes_unchanged_cases(tmp_path: Path, workers: int, executor: str) -> None:
+    register_scorer("slow", _slow_scorer)
+    suite = _suite(6)
+    cache = ScoreCache(tmp_path / "cache")
+    first_preds = {f"c{i}": {"a": i} for i in range(6)}
+    baseline = run_suite(suite=suite, predictions_path=_preds(tmp_path, first_preds))
+
+    collector = MetricsCollector()
+    run_suite(
+        suite=suite,
+        predictions_path=_preds(tmp_path, first_preds),
+        score_cache=cache,
+        collector=collector,
+        workers=workers,
+        executor=executor,
+        chunk_size=2,
+    )
+    assert collector.get_counter("score_cache.misses") == 18
+    assert collector.get_counter("score_cache.hits") == 0
+
+    CALLS.clear()
+    collector.reset()
+    second_preds = dict(first_preds, c2={"a": "changed"})
+    report = run_suite(
+        suite=suite,
+        predictions_path=_preds(tmp_path, second_preds, "p2.jsonl"),
+        score_cache=cache,
+        collector=collector,
+        workers=workers,
+        executor=executor,
+        chunk_size=2,
+    )
+    assert collector.get_counter("score_cache.hits") == 15
+    assert collector.get_counter("score_cache.misses") == 3
+    if executor == "thread":
+        assert CALLS == [{"a": "changed"}]
+    uncached = run_suite(suite=suite, predictions_path=tmp_path / "p2.jsonl")
+    assert report.cases == uncached.cases
+    assert report.cases[0] == baseline.cases[0]
+
+
+def test_cli_score_cache_reports_metrics(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    suite_dir = tmp_path / "suite"
+    suite_dir.mkdir()
+    (suite_dir / "suite.json").write_text(json.dumps({"name": "s"}), encoding="utf-8")
+    (suite_dir / "cases.jsonl").write_text(
+        json.dumps({"id": "c1", "expected": "y"}) + "\n", encoding="utf-8"
+    )
+    preds = _preds(tmp_path, {"c1": "y"})
+    argv = [
+        "run",
+        "--suite",
+        str(suite_dir),
+        "--predictions",
+        str(preds),
+        "--score-cache-dir",
+        str(tmp_path / "cache"),
+    ]
+    assert main(argv) == EXIT_SUCCESS
+    capsys.readouterr()
+    assert main(argv) == EXIT_SUCCESS
+    out = json.loads(capsys.readouterr().out)
+    assert out["metadata"]["metrics"]["counters"] == {"score_cache.hits": 1}
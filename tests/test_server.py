@@ -0,0 +1,176 @@
+"""Tests for the warm evaluation daemon and its client."""
+
+from __future__ import annotations
+
+import http.client
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from toolkit_eval_harness.cli import EXIT_CLI_ERROR, EXIT_SUCCESS, main
+from toolkit_eval_harness.client import EvalClient
+from toolkit_eval_harness.compare import CompareBudget
+from toolkit_eval_harness.pack import load_suite_from_path
+from toolkit_eval_harness.plugins import _reset_registry, register_scorer
+from toolkit_eval_harness.runner import run_suite
+from toolkit_eval_harness.server import EvalServer
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry() -> Iterator[None]:
+    _reset_registry()
+    yield
+    _reset_registry()
+
+
+@pytest.fixture
+def server() -> Iterator[EvalServer]:
+    with EvalServer(port=0, max_suites=2) as srv:
+        yield srv
+
+
+def _write_suite(tmp_path: Path, n: int = 4, name: str = "suite") -> tuple[Path, Path]:
+    suite_dir = tmp_path / name
+    suite_dir.mkdir()
+    meta = {"schema_version": 1, "name": name, "description": "", "created_at": ""}
+    (suite_dir / "suite.json").write_text(json.dumps(meta), encoding="utf-8")
+    (suite_dir / "cases.jsonl").write_text(
+        "".join(json.dumps({"id": f"c{i}", "expected": i}) + "\n" for i in range(n)),
+        encoding="utf-8",
+    )
+    preds = tmp_path / f"{name}.preds.jsonl"
+    preds.write_text(
+        "".join(json.dumps({"id": f"c{i}", "prediction": i % 2}) + "\n" for i in range(n)),
+        encoding="utf-8",
+    )
+    return suite_dir, preds
+
+
+def test_run_matches_local_and_keeps_suite_resident(
+    tmp_path: Path, server: EvalServer
+) -> None:
+    suite_dir, preds = _write_suite(tmp_path)
+    client = EvalClient(server.url)
+    remote = client.run(suite_dir, predictions_path=preds)
+    local = run_suite(suite=load_suite_from_path(suite_dir), predictions_path=preds)
+    assert remote["summary"]["score"] == local.summary["score"]
+    assert remote["summary"]["pass_count"] == 2
+    assert remote["cases"] == local.cases
+
+    in_memory = client.run(suite_dir, predictions={"c0": 0, "c1": 1}, case_ids=["c0", "c1"])
+    assert in_memory["summary"]["cases"] == 2
+    assert in_memory["summary"]["score"] == 1.0
+    health = client.health()
+    assert (health["suite_misses"], health["suite_hits"]) == (1, 1)
+    assert health["requests"] == {"run": 2}
+    assert [s["name"] for s in health["suites"]] == ["suite"]
+
+
+def test_edited_suite_is_reloaded(tmp_path: Path, server: EvalServer) -> None:
+    suite_dir, preds = _write_suite(tmp_path)
+    client = EvalClient(server.url)
+    first = client.run(suite_dir, predictions_path=preds)
+    with (suite_dir / "cases.jsonl").open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"id": "c4", "expected": 4}) + "\n")
+    second = client.run(suite_dir, predictions_path=preds)
+    assert second["summary"]["cases"] == 5
+    assert second["metadata"]["suite_key"] != first["metadata"]["suite_key"]
+
+
+def test_suites_are_lru_bounded(tmp_path: Path, server: EvalServer) -> None:
+    client = EvalClient(server.url)
+    for name in ("a", "b", "c"):
+        suite_dir, preds = _write_suite(tmp_path, name=name)
+        client.run(suite_dir, predictions_path=preds)
+    assert [s["name"] for s in client.health()["suites"]] == ["b", "c"]
+
+
+def test_registered_scorers_stay_resident(tmp_path: Path, server: EvalServer) -> None:
+    calls: list[Any] = []
+
+    def count(*, expected: Any, predicted: Any, **kw: Any) -> tuple[float, dict[str, Any]]:
+        calls.append(predicted)
+        return 0.5, {}
+
+    register_scorer("count", count)
+    suite_dir, preds = _write_suite(tmp_path)
+    meta = json.loads((suite_dir / "suite.json").read_text(encoding="utf-8"))
+    meta["scoring"] = {"scorers": ["count"]}
+    (suite_dir / "suite.json").write_text(json.dumps(meta), encoding="utf-8")
+    report = EvalClient(server.url).run(suite_dir, predictions_path=preds)
+    assert len(calls) == 4
+    assert report["cases"][0]["plugins"]["count"]["score"] == 0.5
+
+
+def test_compare_in_daemon(tmp_path: Path, server: EvalServer) -> None:
+    suite_dir, preds = _write_suite(tmp_path)
+    baseline = tmp_path / "baseline.json"
+    candidate = tmp_path / "candidate.json"
+    argv = ["run", "--suite", str(suite_dir), "--predictions", str(preds)]
+    assert main([*argv, "--out", str(baseline)]) == EXIT_SUCCESS
+    preds.write_text(json.dumps({"id": "c0", "prediction": 0}) + "\n", encoding="utf-8")
+    assert main([*argv, "--out", str(candidate)]) == EXIT_SUCCESS
+    result = EvalClient(server.url).compare(
+        baseline, candidate, budget=CompareBudget(max_score_regression_pct=1.0), case_diff=True
+    )
+    assert result["passed"] is False
+    assert result["case_diff"]["counts"]["regressed"] == 1
+
+
+def test_errors_map_to_client_exceptions(tmp_path: Path, server: EvalServer) -> None:
+    suite_dir, preds = _write_suite(tmp_path)
+    client = EvalClient(server.url)
+    with pytest.raises(FileNotFoundError):
+        client.run(tmp_path / "missing", predictions_path=preds)
+    with pytest.raises(ValueError, match="exactly one"):
+        client.run(suite_dir)
+    with pytest.raises(ValueError, match="not found in suite"):
+        client.run(suite_dir, predictions_path=preds, case_ids=["nope"])
+    with pytest.raises(ValueError, match="missing_field:baseline"):
+        client._request("/compare", {"candidate": "x"})
+
+
+def test_cli_run_and_compare_via_server(
+    tmp_path: Path, server: EvalServer, capsys: pytest.CaptureFixture[str]
+) -> None:
+    suite_dir, preds = _write_suite(tmp_path)
+    out = tmp_path / "report.json"
+    argv = ["run", "--suite", str(suite_dir), "--predictions", str(preds)]
+    assert main([*argv, "--server", server.url, "--out", str(out)]) == EXIT_SUCCESS
+    printed = json.loads(capsys.readouterr().out)
+    assert printed == json.loads(out.read_text(encoding="utf-8"))
+    assert printed["summary"]["cases"] == 4
+
+    compare = ["compare", "--baseline", str(out), "--candidate", str(out)]
+    assert main([*compare, "--server", server.url]) == EXIT_SUCCESS
+    assert json.loads(capsys.readouterr().out)["passed"] is True
+
+    journal = ["--journal", str(tmp_path / "j.jsonl")]
+    assert main([*argv, "--server", server.url, *journal]) == EXIT_CLI_ERROR
+    assert main([*argv, "--server", "http://127.0.0.1:9"]) == EXIT_CLI_ERROR
+
+
+def test_non_loopback_hosts_refused() -> None:
+    with pytest.raises(ValueError, match="non-loopback"):
+        EvalServer(host="0.0.0.0", port=0)
+    assert main(["serve", "--host", "0.0.0.0", "--port", "0"]) == EXIT_CLI_ERROR
+    with EvalServer(host="localhost", port=0) as srv:
+        assert srv.port > 0
+
+
+def test_requests_with_foreign_host_header_rejected(server: EvalServer) -> None:
+    conn = http.client.HTTPConnection("127.0.0.1", server.port, timeout=10)
+    try:
+        conn.request("GET", "/health", headers={"Host": f"evil.example:{server.port}"})
+        assert conn.getresponse().status == 403
+    finally:
+        conn.close()
+    assert EvalClient(f"http://localhost:{server.port}").health()["requests"] == {}
+
+
+def test_client_rejects_non_http_urls() -> None:
+    with pytest.raises(ValueError, match="unsupported_server_url"):
+        EvalClient("file:///etc/passwd")
@@ -0,0 +1,133 @@
+"""Tests for the content-addressed parsed-suite cache."""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from toolkit_eval_harness.cli import EXIT_SUCCESS, main
+from toolkit_eval_harness.pack import create_pack, load_suite_from_path, suite_file_digests
+from toolkit_eval_harness.suite import read_suite_dir
+from toolkit_eval_harness.suite_cache import SuiteCache, suite_cache_key
+
+
+def _make_suite(tmp_path: Path, name: str = "cached", n: int = 3) -> Path:
+    suite_dir = tmp_path / name
+    suite_dir.mkdir()
+    (suite_dir / "suite.json").write_text(json.dumps({"name": name}), encoding="utf-8")
+    (suite_dir / "cases.jsonl").write_text(
+        "".join(json.dumps({"id": f"c{i}", "expected": i, "tags": ["a"]}) + "\n" for i in range(n)),
+        encoding="utf-8",
+    )
+    return suite_dir
+
+
+def test_digests_match_between_dir_and_pack(tmp_path: Path) -> None:
+    suite_dir = _make_suite(tmp_path)
+    pack = tmp_path / "suite.zip"
+    create_pack(suite_dir=suite_dir, out_zip=pack)
+    assert suite_file_digests(suite_dir) == suite_file_digests(pack)
+
+
+def test_cache_roundtrip_and_hit(tmp_path: Path) -> None:
+    suite_dir = _make_suite(tmp_path)
+    cache = SuiteCache(tmp_path / "cache")
+
+    first = load_suite_from_path(suite_dir, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 1)
+    second = load_suite_from_path(suite_dir, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert second == first == read_suite_dir(suite_dir)
+
+
+def test_cache_key_changes_with_content(tmp_path: Path) -> None:
+    suite_dir = _make_suite(tmp_path)
+    cache = SuiteCache(tmp_path / "cache")
+    load_suite_from_path(suite_dir, cache=cache)
+    with (suite_dir / "cases.jsonl").open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"id": "new", "expected": 1}) + "\n")
+    suite = load_suite_from_path(suite_dir, cache=cache)
+    assert cache.hits == 0
+    assert suite.cases[-1].id == "new"
+
+
+def test_corrupt_entry_is_discarded(tmp_path: Path) -> None:
+    suite_dir = _make_suite(tmp_path)
+    cache = SuiteCache(tmp_path / "cache")
+    key = suite_cache_key(suite_file_digests(suite_dir))
+    (tmp_path / "cache").mkdir()
+    entry = tmp_path / "cache" / f"{key}.suite.json"
+    entry.write_bytes(b"{not json")
+    assert cache.get(key) is None
+    assert not entry.exists()
+
+
+def test_lru_eviction_by_total_bytes(tmp_path: Path) -> None:
+    dirs = [_make_suite(tmp_path, name=f"s{i}", n=50) for i in range(3)]
+    cache = SuiteCache(tmp_path / "cache")
+    keys = [suite_cache_key(suite_file_digests(d)) for d in dirs]
+
+    cache.put(keys[0], read_suite_dir(dirs[0]))
+    entry_size = next((tmp_path / "cache").iterdir()).stat().st_size
+    cache.max_bytes = entry_size * 2 + entry_size // 2
+
+    cache.put(keys[1], read_suite_dir(dirs[1]))
+    # Make entry 0 the most recently used, so entry 1 is evicted next.
+    old = (tmp_path / "cache" / f"{keys[1]}.suite.json").stat().st_mtime - 10
+    os.utime(tmp_path / "cache" / f"{keys[1]}.suite.json", (old, old))
+    assert cache.get(keys[0]) is not None
+
+    cache.put(keys[2], read_suite_dir(dirs[2]))
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+
+
+def test_negative_max_bytes_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="max_bytes"):
+        SuiteCache(tmp_path, max_bytes=-1)
+
+
+def test_cli_run_with_suite_cache(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    suite_dir = _make_suite(tmp_path)
+    pack = tmp_path / "suite.zip"
+    create_pack(suite_dir=suite_dir, out_zip=pack)
+    preds = tmp_path / "preds.jsonl"
+    preds.write_text(json.dumps({"id": "c1", "prediction": 1}) + "\n", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    argv = [
+        "run",
+        "--suite",
+        str(pack),
+        "--predictions",
+        str(preds),
+        "--suite-cache-dir",
+        str(cache_dir),
+    ]
+    assert main(argv) == EXIT_SUCCESS
+    assert len(list(cache_dir.glob("*.suite.json"))) == 1
+    first = json.loads(capsys.readouterr().out)
+    assert main(argv) == EXIT_SUCCESS
+    second = json.loads(capsys.readouterr().out)
+    assert first["cases"] == second["cases"]
+
+
+def test_non_utf8_strings_round_trip(tmp_path: Path) -> None:
+    suite = read_suite_dir(_make_suite(tmp_path))
+    odd = replace(suite, description="lone \ud800 surrogate")
+    cache = SuiteCache(tmp_path / "cache")
+    cache.put("k", odd)
+    assert cache.get("k") == odd
+
+
+def test_legacy_pickle_entries_are_evicted(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    (cache_dir / "old.suite.pkl").write_bytes(b"\x80\x05.")
+    cache = SuiteCache(cache_dir)
+    cache.put("k", read_suite_dir(_make_suite(tmp_path)))
+    assert not (cache_dir / "old.suite.pkl").exists()
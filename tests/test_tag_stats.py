@@ -0,0 +1,113 @@
+"""Tests for per-tag summary statistics and per-tag compare budgets."""
+
+from __future__ import annotations
+
+import json
+import statistics
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from toolkit_eval_harness.cli import EXIT_CLI_ERROR, EXIT_VALIDATION_FAILED, main
+from toolkit_eval_harness.compare import CompareBudget, compare_reports
+from toolkit_eval_harness.formatters import format_table
+from toolkit_eval_harness.metrics import SuiteMetrics, TagStats
+from toolkit_eval_harness.report import EvalReport, write_report_json
+from toolkit_eval_harness.runner import run_suite
+from toolkit_eval_harness.suite import EvalCase, EvalSuite
+
+SCORES = [1.0, 0.0, 0.5, 1.0, 0.25, 0.75, 1.0]
+
+
+def test_tag_stats_welford_and_merge() -> None:
+    whole, left, right = TagStats(), TagStats(), TagStats()
+    for i, score in enumerate(SCORES):
+        whole.add(score)
+        (left if i < 3 else right).add(score)
+    assert whole.mean == pytest.approx(statistics.mean(SCORES))
+    assert whole.variance == pytest.approx(statistics.variance(SCORES))
+    left.merge(right)
+    assert left.to_dict() == pytest.approx(whole.to_dict())
+    assert whole.to_dict()["passed"] == 3 and whole.to_dict()["failed"] == 4
+    assert TagStats().to_dict()["score"] == 0.0
+
+
+def test_suite_metrics_by_tag_counts_repeated_tag_once() -> None:
+    metrics = SuiteMetrics()
+    metrics.record_case(score=1.0, tags=["a", "a", "b"])
+    metrics.record_case(score=0.0, tags=["a"])
+    summary = metrics.tag_summary()
+    assert list(summary) == ["a", "b"]
+    assert summary["a"]["cases"] == 2 and summary["a"]["score"] == 0.5
+    assert summary["b"]["passed"] == 1
+
+
+def test_run_suite_summary_by_tag(tmp_path: Path) -> None:
+    cases = [
+        EvalCase(id=f"c{i}", input=None, expected=i, tags=["even" if i % 2 == 0 else "odd"])
+        for i in range(6)
+    ]
+    suite = EvalSuite(
+        schema_version=1, name="t", description="", created_at="", scoring={}, cases=cases
+    )
+    preds = tmp_path / "p.jsonl"
+    rows = [{"id": f"c{i}", "prediction": i if i < 3 else -1} for i in range(6)]
+    preds.write_text("".join(json.dumps(row) + "\n" for row in rows))
+    report = run_suite(suite=suite, predictions_path=preds, workers=2, chunk_size=2)
+    by_tag = report.summary["by_tag"]
+    assert by_tag["even"]["cases"] == 3 and by_tag["even"]["score"] == pytest.approx(2 / 3)
+    assert by_tag["odd"]["passed"] == 1 and by_tag["odd"]["failed"] == 2
+    assert "Tag" in format_table(report.to_dict())
+
+
+def _report(tags: dict[str, float]) -> EvalReport:
+    by_tag = {t: {"cases": 10, "score": s} for t, s in tags.items()}
+    return EvalReport(suite={}, summary={"cases": 10, "score": 0.8, "by_tag": by_tag})
+
+
+def test_compare_per_tag_budgets() -> None:
+    baseline = _report({"math": 0.8, "code": 0.6, "chat": 0.9})
+    candidate = _report({"math": 0.7, "code": 0.6})
+    assert "by_tag" not in compare_reports(
+        baseline=baseline, candidate=candidate, budget=CompareBudget()
+    )
+    result = compare_reports(
+        baseline=baseline,
+        candidate=candidate,
+        budget=CompareBudget(max_tag_score_regression_pct=5.0, tag_budgets={"chat": 100.0}),
+    )
+    assert result["passed"] is False and result["reason"] == "tag_score_regression"
+    assert result["failed_tags"] == ["chat", "math"]
+    assert result["by_tag"]["math"]["score_regression_pct"] == pytest.approx(12.5)
+    assert result["by_tag"]["chat"]["reason"] == "missing_tag"
+    assert result["by_tag"]["code"]["passed"] is True
+    lenient = CompareBudget(tag_budgets={"math": 20.0})
+    assert compare_reports(baseline=baseline, candidate=candidate, budget=lenient)["passed"]
+
+
+def test_compare_tag_budget_from_cases_without_summary() -> None:
+    def report(*scores: float) -> EvalReport:
+        cases: list[dict[str, Any]] = [
+            {"id": f"c{i}", "score": s, "tags": ["t"]} for i, s in enumerate(scores)
+        ]
+        return EvalReport(suite={}, summary={"score": 0.5}, cases=cases)
+
+    result = compare_reports(
+        baseline=report(1.0, 0.0),
+        candidate=report(0.0, 0.0),
+        budget=CompareBudget(max_tag_score_regression_pct=10.0),
+    )
+    assert result["by_tag"]["t"]["candidate_score"] == 0.0 and result["passed"] is False
+
+
+def test_cli_tag_budget(tmp_path: Path) -> None:
+    write_report_json(_report({"math": 0.8}), tmp_path / "b.json")
+    write_report_json(_report({"math": 0.6}), tmp_path / "c.json")
+    argv = ["compare", "--baseline", str(tmp_path / "b.json"), "--candidate"]
+    argv.append(str(tmp_path / "c.json"))
+    assert main([*argv, "--tag-budget", "math=10"]) == EXIT_VALIDATION_FAILED
+    assert main([*argv, "--tag-budget", "math=30"]) == 0
+    with pytest.raises(SystemExit) as exc:
+        main([*argv, "--tag-budget", "math"])
+    assert exc.value.code == EXIT_CLI_ERROR